@@ -0,0 +1,525 @@
+#!/usr/bin/python3
+
+# Copyright (C) 2022 Free Software Foundation, Inc.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+
+import os, sys, json, time, random, shutil, platform, argparse, tempfile, statistics, subprocess
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(os.path.realpath(__file__))), "..", "libre-menu-editor"))
+
+from modules import basic, desktop
+
+
+class CorpusGenerator():
+
+    def __init__(self, seed=0):
+
+        self._random = random.Random(seed)
+
+        self._languages = [
+
+            "ar", "bg", "ca", "cs", "da", "de", "el", "es", "et", "fi", "fr", "he", "hu", "it",
+
+            "ja", "ko", "lt", "nb", "nl", "pl", "pt", "pt_BR", "ro", "ru", "sk", "sv", "tr", "uk", "zh_CN", "zh_TW"
+
+            ]
+
+        self._words = [
+
+            "text", "editor", "image", "viewer", "music", "player", "video", "office", "document", "terminal",
+
+            "browser", "mail", "calendar", "archive", "manager", "system", "monitor", "settings", "network", "game",
+
+            "photo", "paint", "code", "notes", "scanner", "printer", "backup", "disk", "font", "map"
+
+            ]
+
+        self._categories = [
+
+            "AudioVideo", "Audio", "Video", "Development", "Education", "Game", "Graphics",
+
+            "Network", "Office", "Science", "Settings", "System", "Utility"
+
+            ]
+
+        self._mimetypes = [
+
+            "text/plain", "text/html", "text/markdown", "text/x-python", "image/png", "image/jpeg", "image/svg+xml",
+
+            "audio/mpeg", "audio/ogg", "video/mp4", "video/webm", "application/pdf", "application/zip",
+
+            "application/json", "application/x-desktop", "inode/directory", "x-scheme-handler/http", "x-scheme-handler/https"
+
+            ]
+
+    def _get_words(self, minimum, maximum):
+
+        return [self._random.choice(self._words) for index in range(self._random.randint(minimum, maximum))]
+
+    def get_icon_names(self, count):
+
+        names = []
+
+        for index in range(count):
+
+            words = self._get_words(1, 3)
+
+            if self._random.random() < 0.3:
+
+                words.append("symbolic")
+
+            names.append("{}-{}".format("-".join(words), index))
+
+        return names
+
+    def get_text(self, index):
+
+        name = " ".join(word.capitalize() for word in self._get_words(1, 3))
+
+        comment = " ".join(self._get_words(4, 10)).capitalize()
+
+        lines = [
+
+            "[Desktop Entry]",
+
+            "Type=Application",
+
+            "Version=1.0",
+
+            f"Name={name}",
+
+            f"GenericName={' '.join(self._get_words(1, 2)).capitalize()}",
+
+            f"Comment={comment}"
+
+            ]
+
+        for language in self._random.sample(self._languages, self._random.randint(5, len(self._languages))):
+
+            lines.append(f"Name[{language}]={name} ({language})")
+
+            lines.append(f"Comment[{language}]={comment} ({language})")
+
+        actions = [f"action-{number}" for number in range(self._random.randint(0, 3))]
+
+        program = "-".join(self._get_words(1, 2))
+
+        lines.extend([
+
+            f"Exec=/usr/bin/{program}-{index} %U",
+
+            f"Icon={program}-{index}",
+
+            f"Keywords={';'.join(self._get_words(2, 6))};",
+
+            f"Categories={';'.join(self._random.sample(self._categories, self._random.randint(1, 3)))};",
+
+            f"MimeType={';'.join(self._random.sample(self._mimetypes, self._random.randint(0, 6)))};",
+
+            f"Terminal={'true' if self._random.random() < 0.1 else 'false'}",
+
+            f"NoDisplay={'true' if self._random.random() < 0.05 else 'false'}",
+
+            "StartupNotify=true"
+
+            ])
+
+        if len(actions):
+
+            lines.append(f"Actions={';'.join(actions)};")
+
+        for action in actions:
+
+            lines.extend([
+
+                "",
+
+                f"[Desktop Action {action}]",
+
+                f"Name={' '.join(self._get_words(1, 3)).capitalize()}",
+
+                f"Exec=/usr/bin/{program}-{index} --{action}"
+
+                ])
+
+        return "\n".join(lines) + "\n"
+
+    def generate(self, directory, count):
+
+        os.makedirs(directory, exist_ok=True)
+
+        paths = []
+
+        for index in range(count):
+
+            path = os.path.join(directory, f"org.example.Application{index:05d}.desktop")
+
+            with open(path, "w") as file:
+
+                file.write(self.get_text(index))
+
+            paths.append(path)
+
+        return paths
+
+
+class BenchmarkApplication():
+
+    def __init__(self):
+
+        self._errors = 0
+
+    def log(self, text, error=None, level=None, **fields):
+
+        self._errors += 1
+
+    def get_errors(self):
+
+        return self._errors
+
+
+class BenchmarkSuite():
+
+    def __init__(self, work_dir, repeat=3, seed=0):
+
+        self._work_dir = work_dir
+
+        self._repeat = repeat
+
+        self._seed = seed
+
+        self._application = BenchmarkApplication()
+
+    def _measure(self, callback, setup=None, repeat=None, operations=1):
+
+        durations = []
+
+        for index in range(repeat or self._repeat):
+
+            arguments = setup() if not setup is None else ()
+
+            start_time = time.perf_counter()
+
+            callback(*arguments)
+
+            durations.append((time.perf_counter() - start_time) * 1000)
+
+        return {
+
+            "min": min(durations),
+
+            "median": statistics.median(durations),
+
+            "mean": statistics.mean(durations),
+
+            "max": max(durations),
+
+            "repeat": len(durations),
+
+            "operations": operations,
+
+            "per-operation": min(durations) / max(operations, 1)
+
+            }
+
+    def _parse_all(self, paths, save_dir):
+
+        return [
+
+            desktop.DesktopParser(self._application, path, os.path.join(save_dir, os.path.basename(path)))
+
+            for path in paths
+
+            ]
+
+    def _save_all(self, parsers):
+
+        for parser in parsers:
+
+            parser.set_name(f"{parser.get_name()} (edited)")
+
+            parser.save()
+
+    def _run_search_queries(self, search_filter, queries):
+
+        for query in queries:
+
+            search_filter.get_matches(query)
+
+    def _add_search_items(self, items):
+
+        search_filter = basic.SearchFilter()
+
+        for name, keywords in items:
+
+            search_filter.set_keywords(name, keywords)
+
+            search_filter.get_matches("", [name])
+
+    def _run_icon_queries(self, search_index, queries):
+
+        for keywords in queries:
+
+            search_index.search(keywords)
+
+    def _update_mime_data(self, mime_type_index, mime_info_manager, parsers, save=False):
+
+        for parser in parsers:
+
+            name = os.path.basename(parser.get_save_path())
+
+            mimetypes = parser.get_mimetypes()
+
+            mime_type_index.update(name, mimetypes)
+
+            mime_info_manager.update(name, mimetypes, save=save)
+
+    def _create_mime_managers(self, directory):
+
+        shutil.rmtree(directory, ignore_errors=True)
+
+        os.makedirs(directory)
+
+        mime_info_manager = desktop.MimeInfoManager({
+
+            "MIME Cache": [os.path.join(directory, "mimeinfo.cache")],
+
+            "Added Associations": [os.path.join(directory, "mimeapps.list")]
+
+            })
+
+        return desktop.MimeTypeIndex(), mime_info_manager
+
+    def run_size(self, count):
+
+        size_dir = os.path.join(self._work_dir, str(count))
+
+        data_dir = os.path.join(size_dir, "data")
+
+        override_dir = os.path.join(size_dir, "override")
+
+        generator = CorpusGenerator(self._seed)
+
+        start_time = time.perf_counter()
+
+        paths = generator.generate(os.path.join(data_dir, "applications"), count)
+
+        results = {
+
+            "corpus": {
+
+                "files": count,
+
+                "bytes": sum(os.path.getsize(path) for path in paths),
+
+                "generation-ms": (time.perf_counter() - start_time) * 1000
+
+                }
+
+            }
+
+        os.makedirs(override_dir, exist_ok=True)
+
+        results["starter-locator.get-names.cold"] = self._measure(
+
+            lambda locator: locator.get_names(),
+
+            setup=lambda: (desktop.StarterLocator([data_dir], override_dir),),
+
+            operations=count
+
+            )
+
+        warm_locator = desktop.StarterLocator([data_dir], override_dir)
+
+        warm_locator.get_names()
+
+        results["starter-locator.get-names.warm"] = self._measure(warm_locator.get_names, operations=count)
+
+        results["desktop-parser.load"] = self._measure(lambda: self._parse_all(paths, override_dir), operations=count)
+
+        parsers = self._parse_all(paths, override_dir)
+
+        sample = parsers[:min(count, 1000)]
+
+        results["desktop-parser.save"] = self._measure(
+
+            self._save_all,
+
+            setup=lambda: (self._parse_all([parser.get_load_path() for parser in sample], override_dir),),
+
+            operations=len(sample)
+
+            )
+
+        items = [(os.path.basename(parser.get_load_path()), parser.get_search_data()) for parser in parsers]
+
+        results["search-filter.add"] = self._measure(lambda: self._add_search_items(items), operations=count)
+
+        mime_type_index = desktop.MimeTypeIndex()
+
+        search_filter = basic.SearchFilter()
+
+        search_filter.add_filter("mime:", mime_type_index.get_names)
+
+        for (name, keywords), parser in zip(items, parsers):
+
+            search_filter.set_keywords(name, keywords)
+
+            mime_type_index.update(name, parser.get_mimetypes())
+
+        queries = ["", "e", "edit", "text editor", "no-such-application", "mime:text/plain", "mime:image/*"]
+
+        results["search-filter.match"] = self._measure(
+
+            lambda: self._run_search_queries(search_filter, queries),
+
+            operations=len(queries)
+
+            )
+
+        icon_index = basic.SubstringSearchIndex(generator.get_icon_names(count))
+
+        icon_queries = [{"edit"}, {"text", "editor"}, {"symbolic"}, {"media", "player"}, {"zzz"}]
+
+        results["icon-search"] = self._measure(
+
+            lambda: self._run_icon_queries(icon_index, icon_queries),
+
+            operations=len(icon_queries)
+
+            )
+
+        mime_dir = os.path.join(size_dir, "mime")
+
+        results["update-mime-data"] = self._measure(
+
+            lambda *managers: self._update_mime_data(*managers, parsers),
+
+            setup=lambda: self._create_mime_managers(mime_dir),
+
+            operations=count
+
+            )
+
+        mime_sample = parsers[:min(count, 100)]
+
+        results["update-mime-data.save"] = self._measure(
+
+            lambda *managers: self._update_mime_data(*managers, mime_sample, save=True),
+
+            setup=lambda: self._create_mime_managers(mime_dir),
+
+            operations=len(mime_sample)
+
+            )
+
+        results["log-errors"] = self._application.get_errors()
+
+        shutil.rmtree(size_dir, ignore_errors=True)
+
+        return results
+
+    def run(self, sizes):
+
+        results = {}
+
+        for count in sizes:
+
+            sys.stderr.write(f"running {count} starters\n")
+
+            results[str(count)] = self.run_size(count)
+
+        return results
+
+
+def get_revision():
+
+    try:
+
+        process = subprocess.run(
+
+            ["git", "rev-parse", "HEAD"],
+
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+
+            capture_output=True, text=True
+
+            )
+
+    except OSError:
+
+        return None
+
+    return process.stdout.strip() or None
+
+
+def main(args):
+
+    parser = argparse.ArgumentParser(description="Benchmark parsing, searching and mime handling on synthetic starters.")
+
+    parser.add_argument("--sizes", default="100,1000,10000,50000", help="comma separated corpus sizes")
+
+    parser.add_argument("--repeat", type=int, default=3, help="repetitions per measurement")
+
+    parser.add_argument("--seed", type=int, default=0, help="seed for the generated corpus")
+
+    parser.add_argument("--output", default="-", help="JSON result path, - for stdout")
+
+    options = parser.parse_args(args)
+
+    sizes = [int(size) for size in options.sizes.split(",") if size.strip()]
+
+    with tempfile.TemporaryDirectory(prefix="libre-menu-editor-benchmarks-") as work_dir:
+
+        suite = BenchmarkSuite(work_dir, repeat=options.repeat, seed=options.seed)
+
+        report = {
+
+            "revision": get_revision(),
+
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+
+            "python": platform.python_version(),
+
+            "platform": platform.platform(),
+
+            "repeat": options.repeat,
+
+            "seed": options.seed,
+
+            "results": suite.run(sizes)
+
+            }
+
+    text = json.dumps(report, indent=4)
+
+    if options.output == "-":
+
+        sys.stdout.write(f"{text}\n")
+
+    else:
+
+        with open(options.output, "w") as file:
+
+            file.write(f"{text}\n")
+
+    return 0
+
+
+if __name__ == "__main__":
+
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,629 @@
+#!/usr/bin/python3
+
+# Copyright (C) 2022 Free Software Foundation, Inc.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+
+import os, sys, re, json, fnmatch, argparse, threading
+
+from modules import basic, desktop
+
+
+class SpecInvalidError(Exception):
+
+    pass
+
+
+class HeadlessApplication():
+
+    def __init__(self, project_dir):
+
+        self._project_dir = os.path.abspath(os.path.realpath(project_dir))
+
+        self._app_name = os.path.basename(self._project_dir)
+
+        self._system_paths = desktop.SystemPaths()
+
+        if self._system_paths.get_flatpak():
+
+            self._system_paths.load_host_environment()
+
+        self._cache_dir = os.path.join(self._system_paths.get_user_cache_dir(), self._app_name)
+
+        ###############################################################################################################
+
+        self._executable_index = basic.ExecutableIndex(self._system_paths.get_command_dirs())
+
+        self._exec_parser = desktop.ExecParser(self._system_paths.get_flatpak_bin_dirs())
+
+        self._icon_names = None
+
+        self._icon_names_lock = threading.Lock()
+
+        ###############################################################################################################
+
+        self._starter_locator = desktop.StarterLocator(
+
+            self._system_paths.get_system_data_dirs(),
+
+            self._system_paths.get_starter_override_dir(),
+
+            path_converter=self._system_paths.get_path_converter()
+
+            )
+
+        self._mime_info_manager = desktop.MimeInfoManager(self._system_paths.get_mimeinfo_paths())
+
+    def _load_icon_names(self):
+
+        self._icon_names = set()
+
+        for directory in self._system_paths.get_icon_search_dirs():
+
+            for root, dirs, files in os.walk(directory):
+
+                for file in files:
+
+                    self._icon_names.add(file)
+
+                    self._icon_names.add(os.path.splitext(file)[0])
+
+    def get_command_exists(self, text):
+
+        try:
+
+            command = self._exec_parser.get_program(text)
+
+        except desktop.ExecInvalidError:
+
+            return False
+
+        if command is None:
+
+            return False
+
+        else:
+
+            return not self._executable_index.get_command_path(
+
+                command, path_converter=self._system_paths.get_command_lookup_path, lookup_dir=self._system_paths.get_command_lookup_cwd()
+
+                ) is None
+
+    def get_icon_exists(self, icon):
+
+        if os.path.sep in icon:
+
+            if self._system_paths.get_flatpak():
+
+                icon = self._system_paths.find_sandbox_path(icon)
+
+            return os.path.isfile(icon)
+
+        with self._icon_names_lock:
+
+            if self._icon_names is None:
+
+                self._load_icon_names()
+
+        return icon in self._icon_names or f"{icon}-symbolic" in self._icon_names
+
+    def get_app_name(self):
+
+        return self._app_name
+
+    def get_project_dir(self):
+
+        return self._project_dir
+
+    def get_cache_dir(self):
+
+        return self._cache_dir
+
+    def get_starter_locator(self):
+
+        return self._starter_locator
+
+    def get_mime_info_manager(self):
+
+        return self._mime_info_manager
+
+    def parse(self, name):
+
+        load_path = self._starter_locator.get_path(name, include_host=True)
+
+        save_path = self._starter_locator.get_override_path(name, include_host=True)
+
+        return desktop.DesktopParser(self, load_path, save_path)
+
+    def log(self, text, error=None, level=None, **fields):
+
+        if len(fields):
+
+            text = "{} ({})".format(text, ", ".join(f"{key}={value}" for key, value in fields.items()))
+
+        sys.stderr.write(f"[{self._app_name}] {text}\n")
+
+
+class BatchEditor():
+
+    def __init__(self, app, spec):
+
+        self._application = app
+
+        self._string_fields = {
+
+            "name": ("get_name", "set_name"),
+
+            "comment": ("get_comment", "set_comment"),
+
+            "keywords": ("get_keywords", "set_keywords"),
+
+            "categories": ("get_categories", "set_categories"),
+
+            "icon": ("get_icon", "set_icon"),
+
+            "command": ("get_command", "set_command")
+
+            }
+
+        self._bool_fields = {
+
+            "visible": ("get_visible", "set_visible"),
+
+            "hidden": ("get_hidden", "set_hidden"),
+
+            "disabled": ("get_disabled", "set_disabled"),
+
+            "notify": ("get_notify", "set_notify"),
+
+            "terminal": ("get_terminal", "set_terminal")
+
+            }
+
+        self._list_fields = {
+
+            "mimetypes": ("get_mimetypes", "set_mimetypes")
+
+            }
+
+        self._operations = self._check_spec(spec)
+
+    def _check_spec(self, spec):
+
+        if isinstance(spec, dict):
+
+            spec = spec.get("operations")
+
+        if not isinstance(spec, list):
+
+            raise SpecInvalidError("the spec must be a list of operations or contain one under 'operations'")
+
+        for n, operation in enumerate(spec):
+
+            if not isinstance(operation, dict):
+
+                raise SpecInvalidError(f"operation {n} is not a mapping")
+
+            for key in operation:
+
+                if not key in ["select", "set", "replace", "add-categories", "remove-categories"]:
+
+                    raise SpecInvalidError(f"operation {n} has an unknown key: {key}")
+
+            for key, value in operation.get("select", {}).items():
+
+                if key == "visible":
+
+                    if not isinstance(value, bool):
+
+                        raise SpecInvalidError(f"operation {n} selects 'visible' with a non-boolean value")
+
+                elif key in ["names", "mimetypes", "categories", "commands"]:
+
+                    if not isinstance(value, list) or False in [isinstance(item, str) for item in value]:
+
+                        raise SpecInvalidError(f"operation {n} selects '{key}' with a value that is not a list of strings")
+
+                else:
+
+                    raise SpecInvalidError(f"operation {n} selects an unknown field: {key}")
+
+            for key, value in operation.get("set", {}).items():
+
+                if key in self._string_fields:
+
+                    valid = isinstance(value, str)
+
+                elif key in self._bool_fields:
+
+                    valid = isinstance(value, bool)
+
+                elif key in self._list_fields:
+
+                    valid = isinstance(value, list) and not False in [isinstance(item, str) for item in value]
+
+                else:
+
+                    raise SpecInvalidError(f"operation {n} sets an unknown field: {key}")
+
+                if not valid:
+
+                    raise SpecInvalidError(f"operation {n} sets '{key}' to a value of the wrong type")
+
+            for key, value in operation.get("replace", {}).items():
+
+                if not key in self._string_fields:
+
+                    raise SpecInvalidError(f"operation {n} replaces text in an unknown field: {key}")
+
+                elif not isinstance(value, dict) or not isinstance(value.get("pattern"), str) or not isinstance(value.get("replacement", ""), str):
+
+                    raise SpecInvalidError(f"operation {n} replaces text in '{key}' without a valid pattern")
+
+                try:
+
+                    re.compile(value["pattern"])
+
+                except re.error as error:
+
+                    raise SpecInvalidError(f"operation {n} replaces text in '{key}' with an invalid pattern: {error}")
+
+            for key in ["add-categories", "remove-categories"]:
+
+                value = operation.get(key, [])
+
+                if not isinstance(value, list) or False in [isinstance(item, str) for item in value]:
+
+                    raise SpecInvalidError(f"operation {n} has a '{key}' value that is not a list of strings")
+
+        return spec
+
+    def _split_text(self, text):
+
+        return list(filter(None, text.split(";")))
+
+    def _join_text(self, strings):
+
+        return f"{';'.join(strings)}{bool(len(strings))*';'}"
+
+    def _get_selected(self, operation, name, parser):
+
+        select = operation.get("select", {})
+
+        if "names" in select:
+
+            if not True in [fnmatch.fnmatchcase(name, pattern) for pattern in select["names"]]:
+
+                return False
+
+        if "mimetypes" in select:
+
+            mimetypes = [mimetype.lower() for mimetype in parser.get_mimetypes()]
+
+            if not True in [len(fnmatch.filter(mimetypes, pattern.lower())) > 0 for pattern in select["mimetypes"]]:
+
+                return False
+
+        if "categories" in select:
+
+            categories = self._split_text(parser.get_categories())
+
+            if not True in [category in categories for category in select["categories"]]:
+
+                return False
+
+        if "commands" in select:
+
+            command = parser.get_command()
+
+            if not True in [re.search(pattern, command) is not None for pattern in select["commands"]]:
+
+                return False
+
+        if "visible" in select:
+
+            if not parser.get_visible() == select["visible"]:
+
+                return False
+
+        return True
+
+    def _apply(self, operation, parser):
+
+        for key, value in operation.get("set", {}).items():
+
+            if key in self._string_fields:
+
+                getattr(parser, self._string_fields[key][1])(value)
+
+            elif key in self._bool_fields:
+
+                getattr(parser, self._bool_fields[key][1])(value)
+
+            else:
+
+                getattr(parser, self._list_fields[key][1])(value)
+
+        for key, value in operation.get("replace", {}).items():
+
+            getter, setter = self._string_fields[key]
+
+            text = getattr(parser, getter)()
+
+            getattr(parser, setter)(re.sub(value["pattern"], value.get("replacement", ""), text))
+
+        if "add-categories" in operation or "remove-categories" in operation:
+
+            categories = self._split_text(parser.get_categories())
+
+            for category in operation.get("add-categories", []):
+
+                if not category in categories:
+
+                    categories.append(category)
+
+            for category in operation.get("remove-categories", []):
+
+                if category in categories:
+
+                    categories.remove(category)
+
+            parser.set_categories(self._join_text(categories))
+
+    def run(self, dry_run=False, output=sys.stdout):
+
+        locator = self._application.get_starter_locator()
+
+        mime_info_manager = self._application.get_mime_info_manager()
+
+        changed_names, failed_names = [], []
+
+        for name in locator.iter_names():
+
+            try:
+
+                parser = self._application.parse(name)
+
+            except Exception as error:
+
+                self._application.log(error, error=error, name=name)
+
+                failed_names.append(name)
+
+                continue
+
+            data = parser.get_data()
+
+            for operation in self._operations:
+
+                if self._get_selected(operation, name, parser):
+
+                    self._apply(operation, parser)
+
+            if parser.get_data() == data:
+
+                continue
+
+            changed_names.append(name)
+
+            if dry_run:
+
+                section, old_section = parser.get_data().get("Desktop Entry", {}), data.get("Desktop Entry", {})
+
+                keys = [key for key in dict.fromkeys([*old_section, *section]) if not section.get(key) == old_section.get(key)]
+
+                output.write(f"{name}: {', '.join(keys)}\n")
+
+                continue
+
+            try:
+
+                update_mime_data = "MimeType" in parser.get_changed_keys()
+
+                parser.save()
+
+                if update_mime_data:
+
+                    app_name = os.path.basename(parser.get_save_path())
+
+                    mime_info_manager.update(app_name, parser.get_mimetypes(), save=False)
+
+            except Exception as error:
+
+                self._application.log(error, error=error, name=name, path=parser.get_save_path())
+
+                failed_names.append(name)
+
+            else:
+
+                output.write(f"{name}\n")
+
+        if not dry_run:
+
+            mime_info_manager.save()
+
+        return changed_names, failed_names
+
+
+def read_spec(path):
+
+    if path == "-":
+
+        text = sys.stdin.read()
+
+    else:
+
+        with open(path, "r") as file:
+
+            text = file.read()
+
+    if path.endswith(".yaml") or path.endswith(".yml"):
+
+        try:
+
+            import yaml
+
+        except ImportError:
+
+            raise SpecInvalidError("reading YAML specs requires the python3-yaml package")
+
+        try:
+
+            return yaml.safe_load(text)
+
+        except yaml.YAMLError as error:
+
+            raise SpecInvalidError(f"the spec is not valid YAML: {error}") from None
+
+    else:
+
+        try:
+
+            return json.loads(text)
+
+        except json.JSONDecodeError as error:
+
+            raise SpecInvalidError(f"the spec is not valid JSON: {error}") from None
+
+
+def run(project_dir, args):
+
+    parser = argparse.ArgumentParser(prog="libre-menu-editor --headless")
+
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    apply_parser = subparsers.add_parser("apply", help="apply the operations of a JSON or YAML spec to all matching starters")
+
+    apply_parser.add_argument("spec", help="path of the spec file or '-' to read JSON from stdin")
+
+    apply_parser.add_argument("--dry-run", action="store_true", help="only print which starters would change")
+
+    validate_parser = subparsers.add_parser("validate", help="check all starters for missing commands, icons, actions and invalid values")
+
+    validate_parser.add_argument("--json", action="store_true", help="print the report as JSON")
+
+    validate_parser.add_argument("--no-cache", action="store_true", help="check all starters, even if they did not change since the last run")
+
+    list_parser = subparsers.add_parser("list", help="print the names of all starters")
+
+    list_parser.add_argument("--mimetype", help="only print starters that handle this mimetype, wildcards are allowed")
+
+    options = parser.parse_args(args)
+
+    app = HeadlessApplication(project_dir)
+
+    if options.command == "apply":
+
+        try:
+
+            batch_editor = BatchEditor(app, read_spec(options.spec))
+
+        except (OSError, ValueError, SpecInvalidError) as error:
+
+            app.log(error, error=error)
+
+            return 2
+
+        changed_names, failed_names = batch_editor.run(dry_run=options.dry_run)
+
+        app.log(f"{len(changed_names)} starters changed, {len(failed_names)} failed")
+
+        return int(bool(len(failed_names)))
+
+    elif options.command == "validate":
+
+        cache_path = os.path.join(app.get_cache_dir(), "validation.json")
+
+        validator = desktop.StarterValidator(command_checker=app.get_command_exists, icon_checker=app.get_icon_exists)
+
+        if not options.no_cache:
+
+            validator.load(cache_path)
+
+        locator = app.get_starter_locator()
+
+        names, mtimes = {}, {}
+
+        for name in locator.iter_names():
+
+            path = locator.get_path(name, include_host=True)
+
+            stat = locator.get_stat(name)
+
+            names[path] = name
+
+            if not stat is None:
+
+                mtimes[path] = stat.st_mtime_ns
+
+        results = validator.validate(names, mtimes=mtimes)
+
+        try:
+
+            validator.save(cache_path)
+
+        except OSError as error:
+
+            app.log(error, error=error)
+
+        report = {names[path]: issues for path, issues in results.items() if len(issues)}
+
+        if options.json:
+
+            sys.stdout.write(f"{json.dumps(report, indent=2)}\n")
+
+        else:
+
+            for name, issues in report.items():
+
+                for issue in issues:
+
+                    location = " ".join(filter(None, [issue["section"], issue["key"]]))
+
+                    sys.stdout.write(f"{name}: {issue['problem']} [{location}] {issue['value'] or ''}".rstrip(" ") + "\n")
+
+        return int(bool(len(report)))
+
+    elif options.command == "list":
+
+        mime_type_index = desktop.MimeTypeIndex()
+
+        names = app.get_starter_locator().get_names()
+
+        if not options.mimetype is None:
+
+            for name in names:
+
+                try:
+
+                    mime_type_index.update(name, app.parse(name).get_mimetypes())
+
+                except Exception as error:
+
+                    app.log(error, error=error, name=name)
+
+            names = mime_type_index.get_names(options.mimetype)
+
+        for name in names:
+
+            sys.stdout.write(f"{name}\n")
+
+        return 0
+
+
+if __name__ == "__main__":
+
+    sys.exit(run(os.path.dirname(os.path.abspath(os.path.realpath(__file__))), sys.argv[1:]))
@@ -0,0 +1,50 @@
+#!/usr/bin/python3
+
+# Copyright (C) 2022 Free Software Foundation, Inc.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+
+import os, sys
+
+from modules import basic
+
+
+def run(project_dir, application_id):
+
+    project_dir = os.path.abspath(os.path.realpath(project_dir))
+
+    user_data_dir = os.getenv("XDG_DATA_HOME") or os.path.join(os.path.expanduser("~"), ".local", "share")
+
+    config_dir = os.path.join(user_data_dir, os.path.basename(project_dir))
+
+    process_client = basic.ProcessClient(
+
+        os.path.join(config_dir, "lock"),
+
+        os.path.join(config_dir, "argv")
+
+        )
+
+    if process_client.get_locked():
+
+        process_client.send(sys.argv[1:])
+
+        return 0
+
+    from main import Application
+
+    app = Application(project_dir, application_id=application_id)
+
+    return app.run()
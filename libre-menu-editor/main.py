@@ -16,7 +16,7 @@
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
 
-import os, sys, string, random, shutil, subprocess, datetime, gi
+import os, sys, glob, string, random, shutil, subprocess, threading, gi
 
 gi.require_version("Adw", "1")
 
@@ -42,376 +42,7 @@ from gi.repository import GLib
 
 from gi.repository import Pango
 
-from configparser import ConfigParser
-
-from modules import gui, basic
-
-
-class DesktopParser():
-
-    def __init__(self, app, load_path, save_path):
-
-        self._application = app
-
-        self._config_parser = ConfigParser(interpolation=None, strict=False)
-
-        self._config_parser.optionxform = str
-
-        self._system_locale_names = [
-
-            os.getenv("LANG").split(".")[0].split("_")[0],
-
-            os.getenv("LANG").split(".")[0],
-
-            os.getenv("LANG")
-
-            ]
-
-        self._load_path = load_path
-
-        self._save_path = save_path
-
-        self.load()
-
-    def _get_action_from_section(self, section):
-
-        return section[len("Desktop Action "):]
-
-    def _get_section_from_action(self, action):
-
-        return "Desktop Action %s" % action
-
-    def _get_str(self, key, section="Desktop Entry", localized=False, value=""):
-
-        if self._config_parser.has_section(section):
-
-            if localized:
-
-               for locale in self._system_locale_names:
-
-                    localized_key = "%s[%s]" % (key, locale)
-
-                    if self._config_parser.has_option(section, localized_key):
-
-                        return self._config_parser.get(section, localized_key)
-
-            if self._config_parser.has_option(section, key):
-
-                return self._config_parser.get(section, key)
-
-        return value
-
-    def _get_bool(self, key, section="Desktop Entry"):
-
-        if self._config_parser.has_section(section):
-
-            if self._config_parser.has_option(section, key):
-
-                try:
-
-                    return self._config_parser.getboolean(section, key)
-
-                except ValueError as error:
-
-                    self._application.log(error, error=error)
-
-                    return False
-
-            else:
-
-                return False
-
-        else:
-
-            return False
-
-    def _set(self, key, value, section="Desktop Entry", localized=False):
-
-        if isinstance(value, bool):
-
-            if value:
-
-                value = "true"
-
-            else:
-
-                value = "false"
-
-        if len(value):
-
-            self._config_parser.set(section, key, value)
-
-            if localized:
-
-                for locale in self._system_locale_names:
-
-                    localized_key = "%s[%s]" % (key, locale)
-
-                    self._config_parser.set(section, localized_key, value)
-
-        else:
-
-            if self._config_parser.has_option(section, key):
-
-                self._config_parser.remove_option(section, key)
-
-            if localized:
-
-                for locale in self._system_locale_names:
-
-                    localized_key = "%s[%s]" % (key, locale)
-
-                    if self._config_parser.has_option(section, localized_key):
-
-                        self._config_parser.remove_option(section, localized_key)
-
-    def get_action_name(self, action):
-
-        return self.get_name(section=self._get_section_from_action(action))
-
-    def set_action_name(self, action, name):
-
-        self.set_name(name, section=self._get_section_from_action(action))
-
-    def get_action_command(self, action):
-
-        return self.get_command(section=self._get_section_from_action(action))
-
-    def set_action_command(self, action, command):
-
-        self.set_command(command, section=self._get_section_from_action(action))
-
-    def get_name(self, section="Desktop Entry"):
-
-        return self._get_str("Name", section=section, localized=True)
-
-    def set_name(self, name, section="Desktop Entry"):
-
-        self._set("Name", name, section=section, localized=True)
-
-    def get_comment(self, section="Desktop Entry"):
-
-        return self._get_str("Comment", section=section, localized=True)
-
-    def set_comment(self, comment, section="Desktop Entry"):
-
-        self._set("Comment", comment, section=section, localized=True)
-
-    def get_keywords(self, section="Desktop Entry"):
-
-        return self._get_str("Keywords", section=section, localized=True)
-
-    def set_keywords(self, comment, section="Desktop Entry"):
-
-        self._set("Keywords", comment, section=section, localized=True)
-
-    def get_categories(self, section="Desktop Entry"):
-
-        return self._get_str("Categories", section=section)
-
-    def set_categories(self, comment, section="Desktop Entry"):
-
-        self._set("Categories", comment, section=section)
-
-    def get_icon(self, section="Desktop Entry"):
-
-        return self._get_str("Icon", section=section)
-
-    def set_icon(self, icon, section="Desktop Entry"):
-
-        self._set("Icon", icon, section=section)
-
-    def get_command(self, section="Desktop Entry"):
-
-        return self._get_str("Exec", section=section)
-
-    def set_command(self, command, section="Desktop Entry"):
-
-        self._set("Exec", command, section=section)
-
-    def get_disabled(self, section="Desktop Entry"):
-
-        return self._get_bool("Hidden", section=section)
-
-    def set_disabled(self, value, section="Desktop Entry"):
-
-        self._set("Hidden", value, section=section)
-
-    def get_hidden(self, section="Desktop Entry"):
-
-        return self._get_bool("NoDisplay", section=section)
-
-    def set_hidden(self, value, section="Desktop Entry"):
-
-        self._set("NoDisplay", value, section=section)
-
-    def get_visible(self, section="Desktop Entry"):
-
-        return not self.get_hidden() and not self.get_disabled()
-
-    def set_visible(self, value, section="Desktop Entry"):
-
-        if value:
-
-            self.set_disabled(False)
-
-            self.set_hidden(False)
-
-        else:
-
-            self.set_hidden(True)
-
-    def get_notify(self, section="Desktop Entry"):
-
-        return self._get_bool("StartupNotify", section=section)
-
-    def set_notify(self, value, section="Desktop Entry"):
-
-        self._set("StartupNotify", value, section=section)
-
-    def get_terminal(self, section="Desktop Entry"):
-
-        return self._get_bool("Terminal", section=section)
-
-    def set_terminal(self, value, section="Desktop Entry"):
-
-        self._set("Terminal", value, section=section)
-
-    def get_mimetypes(self):
-
-        if self._config_parser.has_option("Desktop Entry", "MimeType"):
-
-            return list(filter(None, self._config_parser.get("Desktop Entry", "MimeType").split(";")))
-
-        else:
-
-            return []
-
-    def get_load_path(self):
-
-        return self._load_path
-
-    def set_load_path(self, path):
-
-        self._load_path = path
-
-    def get_save_path(self):
-
-        return self._save_path
-
-    def set_save_path(self, path):
-
-        self._save_path = path
-
-    def get_search_data(self):
-
-        data = []
-
-        data.append(self.get_name())
-
-        data.append(self.get_icon())
-
-        data.append(self.get_command())
-
-        data.append(self.get_keywords())
-
-        data.append(self.get_categories())
-
-        data.append(self._get_str("MimeType"))
-
-        data.append(os.path.basename(self._load_path))
-
-        return list(filter(None, data))
-
-    def get_actions(self):
-
-        actions = []
-
-        for section in self._config_parser.sections():
-
-            if section.startswith("Desktop Action "):
-
-                actions.append(self._get_action_from_section(section))
-
-        return actions
-
-    def add_action(self, action):
-
-        section = self._get_section_from_action(action)
-
-        if not self._config_parser.has_section(section):
-
-            self._config_parser.add_section(section)
-
-    def remove_action(self, action):
-
-        self._config_parser.remove_section(self._get_section_from_action(action))
-
-    def check_read(self, path=None):
-
-        if path is None:
-
-            path = self._load_path
-
-        if not os.access(path, os.R_OK):
-
-            raise OSError(f"no access: {path}")
-
-    def check_write(self, path=None):
-
-        if path is None:
-
-            path = self._save_path
-
-        while not path == os.path.abspath(os.sep):
-
-            if not os.path.exists(path):
-
-                path = os.path.dirname(path)
-
-            elif not os.access(path, os.W_OK):
-
-                raise OSError(f"no access: {path}")
-
-            else:
-
-                break
-
-    def load(self, path=None):
-
-        self.check_read(path=path)
-
-        if path is None:
-
-            path = self._load_path
-
-        self._config_parser.clear()
-
-        self._config_parser.read(path)
-
-    def save(self, path=None):
-
-        self.check_write(path=path)
-
-        if path is None:
-
-            path = self._save_path
-
-        actions = self.get_actions()
-
-        self._set("Actions", f"{';'.join(actions)}{bool(len(actions))*';'}")
-
-        if not os.path.exists(path):
-
-            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
-
-        else:
-
-            os.remove(path)
-
-        with open(path, "w") as file:
-
-            self._config_parser.write(file, space_around_delimiters=False)
+from modules import gui, basic, desktop
 
 
 class DefaultTextEditor():
@@ -584,8 +215,12 @@ class DefaultTextEditor():
 
         parser.load(path=edit_path)
 
+        changed_keys = parser.get_changed_keys()
+
         parser.save()
 
+        return changed_keys
+
     def exit(self):
 
         self._parsers.clear()
@@ -619,31 +254,57 @@ class DebugLog():
 
         self._raise_errors = False
 
-        self._messages = []
+        self._log_manager = basic.LogManager(None, stream=sys.stdout)
+
+        self._system_info = None
+
+    def _get_system_info(self):
+
+        if self._system_info is None:
+
+            release_texts = []
+
+            for path in sorted(glob.glob(os.path.join(os.path.sep, "etc", "*-release"))):
+
+                try:
+
+                    with open(path, "r", errors="replace") as file:
+
+                        release_texts.append(file.read().rstrip("\n"))
+
+                except OSError:
+
+                    pass
+
+            self._system_info = [
+
+                "\n".join(release_texts),
+
+                "",
 
-        self._messages.append(str(subprocess.getstatusoutput("cat /etc/*-release")[-1]))
+                " ".join(os.uname()),
 
-        self._messages.append("")
+                "",
 
-        self._messages.append(str(subprocess.getstatusoutput("uname -a")[-1]))
+                "XDG_SESSION_DESKTOP={}".format(str(os.getenv("XDG_SESSION_DESKTOP"))),
 
-        self._messages.append("")
+                "XDG_SESSION_TYPE={}".format(str(os.getenv("XDG_SESSION_TYPE"))),
 
-        self._messages.append("XDG_SESSION_DESKTOP={}".format(str(os.getenv("XDG_SESSION_DESKTOP"))))
+                "",
 
-        self._messages.append("XDG_SESSION_TYPE={}".format(str(os.getenv("XDG_SESSION_TYPE"))))
+                "LANG={}".format(str(os.getenv("LANG"))),
 
-        self._messages.append("")
+                "XDG_DATA_DIRS={}".format(str(os.getenv("XDG_DATA_DIRS"))),
 
-        self._messages.append("LANG={}".format(str(os.getenv("LANG"))))
+                "",
 
-        self._messages.append("XDG_DATA_DIRS={}".format(str(os.getenv("XDG_DATA_DIRS"))))
+                "APP_RUNNING_AS_FLATPAK={}".format(str(os.getenv("APP_RUNNING_AS_FLATPAK"))),
 
-        self._messages.append("")
+                ""
 
-        self._messages.append("APP_RUNNING_AS_FLATPAK={}".format(str(os.getenv("APP_RUNNING_AS_FLATPAK"))))
+                ]
 
-        self._messages.append("")
+        return self._system_info
 
     def get_raise_errors(self):
 
@@ -653,7 +314,7 @@ class DebugLog():
 
         self._raise_errors = value
 
-    def add(self, text, error=None):
+    def add(self, text, error=None, level=None, **fields):
 
         if not error is None:
 
@@ -661,29 +322,37 @@ class DebugLog():
 
                 raise error
 
-        now = datetime.datetime.now()
+            fields["exception"] = type(error).__name__
 
-        message = "[{}][{}:{}:{}] {}".format(
+        if level is None:
 
-            self._application.get_app_name(),
+            level = "info" if error is None else "error"
 
-            now.strftime("%H"),
+        self._log_manager.add(level, text, **fields)
 
-            now.strftime("%M"),
+    def get(self):
 
-            now.strftime("%S"),
+        return "\n".join(self._get_system_info() + [self._log_manager.get_text()])
 
-            text
+    def get_level(self):
 
-            )
+        return self._log_manager.get_level()
 
-        self._messages.append(message)
+    def set_level(self, level):
 
-        sys.stdout.write(f"{message}\n")
+        self._log_manager.set_level(level)
 
-    def get(self):
+    def set_name(self, name):
+
+        self._log_manager.set_name(name)
 
-        return "\n".join(self._messages)
+    def set_path(self, path):
+
+        self._log_manager.set_path(path)
+
+    def close(self):
+
+        self._log_manager.close()
 
 
 class DesktopActionGroup(Adw.PreferencesGroup):
@@ -820,7 +489,7 @@ class DesktopActionGroup(Adw.PreferencesGroup):
 
     def hook(self, event, callback, *args):
 
-        self._events.hook(event, callback, *args)
+        return self._events.hook(event, callback, *args)
 
     def release(self, id):
 
@@ -893,7 +562,7 @@ class KeywordsFilter():
 
         if self._flow_row_connection_id:
 
-            self._flow_row.disconnect(self._flow_row_connection_id)
+            self._flow_row.release(self._flow_row_connection_id)
 
         self._flow_row = widget
 
@@ -1118,7 +787,7 @@ class CategoriesFilter():
 
                 self._combo_row.remove_button(name)
 
-            self._combo_row.disconnect(self._combo_row_connection_id)
+            self._combo_row.release(self._combo_row_connection_id)
 
         self._combo_row = widget
 
@@ -1136,7 +805,7 @@ class CategoriesFilter():
 
         if self._flow_row_connection_id:
 
-            self._flow_row.disconnect(self._flow_row_connection_id)
+            self._flow_row.release(self._flow_row_connection_id)
 
         self._flow_row = widget
 
@@ -1175,10 +844,14 @@ class SettingsPage(Gtk.Box):
 
         super().__init__(*args, **kwargs)
 
-        self._events = basic.EventManager()
+        self._events = basic.EventManager(scheduler=app.schedule_update)
 
         self._events.add("changed", bool, bool)
 
+        self._events.add("inputs-changed", coalesce=True)
+
+        self._events.hook("inputs-changed", self._on_inputs_changed)
+
         self._locale_manager = app.get_locale_manager()
 
         self._icon_finder = app.get_icon_finder()
@@ -1213,7 +886,11 @@ class SettingsPage(Gtk.Box):
 
         self._current_desktop_action_groups = {}
 
-        self._input_children_changes = {}
+        self._changed_input_fields = set()
+
+        self._desktop_action_group_defaults = {}
+
+        self._desktop_actions_changed = False
 
         ###############################################################################################################
 
@@ -1683,127 +1360,143 @@ class SettingsPage(Gtk.Box):
 
     def _on_input_child_data_changed(self, event, child, data):
 
-        if not isinstance(child, DesktopActionGroup):
+        if self._loading_desktop_starter:
 
-            if child == self._icon_chooser_row:
+            return
 
-                self._input_children_changes[child] = data == self._current_parser.get_icon()
+        if isinstance(child, DesktopActionGroup):
 
-            elif child == self._name_entry_row:
+            if child in self._desktop_action_group_defaults:
 
-                self._input_children_changes[child] = data == self._current_parser.get_name()
+                self._update_desktop_action_group_changed(child, data)
 
-            elif child == self._comment_entry_row:
+        elif child == self._icon_chooser_row:
 
-                self._input_children_changes[child] = data == self._current_parser.get_comment()
+            self._set_input_field_changed(child, not data == self._current_parser.get_icon())
 
-            elif child == self._keywords_filter:
+        elif child == self._name_entry_row:
 
-                self._input_children_changes[child] = data == self._current_parser.get_keywords()
+            self._set_input_field_changed(child, not data == self._current_parser.get_name())
 
-            elif child == self._categories_filter:
+        elif child == self._comment_entry_row:
 
-                self._input_children_changes[child] = data == self._current_parser.get_categories()
+            self._set_input_field_changed(child, not data == self._current_parser.get_comment())
 
-            elif child == self._command_chooser_row:
+        elif child == self._keywords_filter:
 
-                self._input_children_changes[child] = data == self._current_parser.get_command()
+            self._set_input_field_changed(child, not data == self._current_parser.get_keywords())
 
-            elif child == self._visible_switch_row:
+        elif child == self._categories_filter:
 
-                self._input_children_changes[child] = data == self._current_parser.get_visible()
+            self._set_input_field_changed(child, not data == self._current_parser.get_categories())
 
-            elif child == self._notify_switch_row:
+        elif child == self._command_chooser_row:
 
-                self._input_children_changes[child] = data == self._current_parser.get_notify()
+            self._set_input_field_changed(child, not data == self._current_parser.get_command())
 
-            elif child == self._terminal_switch_row:
+        elif child == self._visible_switch_row:
 
-                self._input_children_changes[child] = data == self._current_parser.get_terminal()
+            self._set_input_field_changed(child, not data == self._current_parser.get_visible())
 
-        self._update_action_children_sensitive()
+        elif child == self._notify_switch_row:
 
-    def _get_input_children_changed(self):
+            self._set_input_field_changed(child, not data == self._current_parser.get_notify())
 
-        if False in self._input_children_changes.values():
+        elif child == self._terminal_switch_row:
 
-            value = True
+            self._set_input_field_changed(child, not data == self._current_parser.get_terminal())
 
-        else:
+        self._events.trigger("inputs-changed")
+
+    def _on_inputs_changed(self, event):
 
-            value = self._get_desktop_action_groups_changed()
+        self._update_action_children_sensitive()
+
+    def _get_input_children_changed(self):
+
+        value = bool(self._changed_input_fields) or self._desktop_actions_changed
 
         if not value == self._changed:
 
-            self._events.trigger("changed", self._changed, bool(value))
+            self._events.trigger("changed", self._changed, value)
 
-        self._changed = bool(value)
+        self._changed = value
 
         return value
 
-    def _get_desktop_action_groups_changed(self):
+    def _set_input_field_changed(self, field, value):
 
-        try:
+        if value:
 
-            parser_actions = self._current_parser.get_actions()
+            self._changed_input_fields.add(field)
 
-        except AttributeError:
+        else:
 
-            return False
+            self._changed_input_fields.discard(field)
 
-        if not self._current_desktop_actions == parser_actions:
+    def _update_desktop_action_group_changed(self, desktop_action_group, data):
 
-            parser_actions_count = len(parser_actions)
+        default_name, default_command = self._desktop_action_group_defaults[desktop_action_group]
 
-            if len(self._current_desktop_actions) > parser_actions_count:
+        name, command = data
 
-                for n, current_action in enumerate(self._current_desktop_actions[:parser_actions_count]):
+        self._set_input_field_changed((desktop_action_group, "name"), not name == default_name)
 
-                    current_name = self._current_desktop_action_groups[current_action].get_name()
+        self._set_input_field_changed((desktop_action_group, "command"), not command == default_command)
 
-                    parser_name = self._current_parser.get_action_name(parser_actions[n])
+    def _update_desktop_actions_changed(self):
 
-                    if not current_name == parser_name:
+        for desktop_action_group in self._desktop_action_group_defaults:
 
-                        return True
+            self._changed_input_fields.discard((desktop_action_group, "name"))
 
-                    current_command = self._current_desktop_action_groups[current_action].get_command()
+            self._changed_input_fields.discard((desktop_action_group, "command"))
 
-                    parser_command = self._current_parser.get_action_command(parser_actions[n])
+        self._desktop_action_group_defaults.clear()
 
-                    if not current_command == parser_command:
+        try:
 
-                        return True
+            parser_actions = self._current_parser.get_actions()
 
-                else:
+        except AttributeError:
 
-                    for action in self._current_desktop_actions[parser_actions_count:]:
+            self._desktop_actions_changed = False
 
-                        desktop_action_group = self._current_desktop_action_groups[action]
+            return
 
-                        if len(desktop_action_group.get_name()) or len(desktop_action_group.get_command()):
+        parser_actions_count = len(parser_actions)
 
-                            return True
+        current_actions_count = len(self._current_desktop_actions)
 
-            else:
+        if current_actions_count < parser_actions_count:
 
-                return True
+            self._desktop_actions_changed = True
+
+        elif current_actions_count == parser_actions_count:
+
+            self._desktop_actions_changed = not self._current_desktop_actions == parser_actions
 
         else:
 
-            for action in self._current_desktop_actions:
+            self._desktop_actions_changed = False
+
+        for n, action in enumerate(self._current_desktop_actions):
+
+            desktop_action_group = self._current_desktop_action_groups[action]
+
+            if n < parser_actions_count:
 
-                name = self._current_desktop_action_groups[action].get_name()
+                defaults = self._current_parser.get_action_name(parser_actions[n]), self._current_parser.get_action_command(parser_actions[n])
 
-                if not name == self._current_parser.get_action_name(action):
+            else:
 
-                    return True
+                defaults = "", ""
 
-                command = self._current_desktop_action_groups[action].get_command()
+            self._desktop_action_group_defaults[desktop_action_group] = defaults
 
-                if not command == self._current_parser.get_action_command(action):
+            data = desktop_action_group.get_name(), desktop_action_group.get_command()
 
-                    return True
+            self._update_desktop_action_group_changed(desktop_action_group, data)
 
     def _show_placeholder_desktop_action(self):
 
@@ -1863,6 +1556,10 @@ class SettingsPage(Gtk.Box):
 
         self._hide_placeholder_desktop_action()
 
+        if not self._loading_desktop_starter:
+
+            self._update_desktop_actions_changed()
+
         self._update_action_children_sensitive()
 
     def _remove_desktop_action(self, action, set_focus=False):
@@ -1903,6 +1600,10 @@ class SettingsPage(Gtk.Box):
 
         self._update_top_desktop_action_group_header()
 
+        if not self._loading_desktop_starter:
+
+            self._update_desktop_actions_changed()
+
         self._update_action_children_sensitive()
 
     def _update_top_desktop_action_group_header(self):
@@ -2021,11 +1722,29 @@ class SettingsPage(Gtk.Box):
 
         self._current_parser = parser
 
-        for action in list(self._current_desktop_actions):
+        parser_actions = self._current_parser.get_actions()
+
+        for action in self._current_desktop_actions[len(parser_actions):]:
 
             self._remove_desktop_action(action)
 
-        for action in self._current_parser.get_actions():
+        desktop_action_groups = [self._current_desktop_action_groups[action] for action in self._current_desktop_actions]
+
+        self._current_desktop_actions = []
+
+        self._current_desktop_action_groups = {}
+
+        for action, desktop_action_group in zip(parser_actions, desktop_action_groups):
+
+            desktop_action_group.set_name(self._current_parser.get_action_name(action))
+
+            desktop_action_group.set_command(self._current_parser.get_action_command(action))
+
+            self._current_desktop_action_groups[action] = desktop_action_group
+
+            self._current_desktop_actions.append(action)
+
+        for action in parser_actions[len(desktop_action_groups):]:
 
             self._add_desktop_action(action)
 
@@ -2049,8 +1768,14 @@ class SettingsPage(Gtk.Box):
 
         self._icon_browser_row.set_default_text(self._icon_chooser_row.get_text())
 
+        self._keywords_flow_row.flush_events()
+
+        self._categories_flow_row.flush_events()
+
         self._loading_desktop_starter = False
 
+        self._update_desktop_actions_changed()
+
         self._update_action_children_sensitive(False)
 
     def save_desktop_starter(self):
@@ -2103,10 +1828,14 @@ class SettingsPage(Gtk.Box):
 
         self._icon_browser_row.set_default_text(self._icon_chooser_row.get_text())
 
+        changed_keys = self._current_parser.get_changed_keys()
+
         self._current_parser.save()
 
         self.reset(reset_children=False)
 
+        return changed_keys
+
     def get_always_show_save_button(self):
 
         return self._always_show_save_button
@@ -2127,6 +1856,12 @@ class SettingsPage(Gtk.Box):
 
     def get_changed(self):
 
+        self._keywords_flow_row.flush_events()
+
+        self._categories_flow_row.flush_events()
+
+        self._events.flush()
+
         return self._changed
 
     def reset(self, reset_children=True):
@@ -2161,7 +1896,11 @@ class SettingsPage(Gtk.Box):
 
         self._update_action_children_sensitive(False)
 
-        self._input_children_changes.clear()
+        self._changed_input_fields.clear()
+
+        if not self._loading_desktop_starter:
+
+            self._update_desktop_actions_changed()
 
         self.set_delete_mode_enabled(False)
 
@@ -2198,20 +1937,58 @@ class StarterNotFoundError(Exception):
 
 class Application(gui.Application):
 
+    _big_start_menu = basic.LazyProperty(lambda self: self._create_menu("big_start"))
+
+    _small_start_menu = basic.LazyProperty(lambda self: self._create_menu("small_start"))
+
+    _big_reset_starter_menu = basic.LazyProperty(lambda self: self._create_menu("big_reset_starter"))
+
+    _small_reset_starter_menu = basic.LazyProperty(lambda self: self._create_menu("small_reset_starter"))
+
+    _big_delete_starter_menu = basic.LazyProperty(lambda self: self._create_menu("big_delete_starter"))
+
+    _small_delete_starter_menu = basic.LazyProperty(lambda self: self._create_menu("small_delete_starter"))
+
+    _big_discard_starter_menu = basic.LazyProperty(lambda self: self._create_menu("big_discard_starter"))
+
+    _small_discard_starter_menu = basic.LazyProperty(lambda self: self._create_menu("small_discard_starter"))
+
     def __init__(self, *args, **kwargs):
 
         ###############################################################################################################
 
+        self._startup_stop_watch = basic.StopWatch()
+
         self._debug_log = DebugLog(self)
 
+        self._startup_stop_watch.lap("debug log")
+
         if "--debug" in sys.argv:
 
+            basic.EventManager.validate_arguments = True
+
+            self._debug_log.set_level("debug")
+
             sys.stdout.write(self._debug_log.get())
 
         ###############################################################################################################
 
         super().__init__(*args, **kwargs)
 
+        self._debug_log.set_name(self.get_app_name())
+
+        self._debug_log.set_path(os.path.join(self.get_cache_dir(), "debug.log"))
+
+        self._profiler_trace_path = os.getenv("LIBRE_MENU_EDITOR_PROFILE_TRACE")
+
+        if "--profile" in sys.argv or os.getenv("LIBRE_MENU_EDITOR_PROFILE") in ("1", "true") or self._profiler_trace_path:
+
+            self._profiler.set_active(True)
+
+            self._profiler.set_trace(bool(self._profiler_trace_path))
+
+        self._startup_stop_watch.lap("application")
+
         self._current_desktop_starter_name = None
 
         self._desktop_starter_parsers = {}
@@ -2428,41 +2205,49 @@ class Application(gui.Application):
 
             )
 
+        self._startup_stop_watch.lap("icon alternatives")
+
         ###############################################################################################################
 
         self._desktop_starter_custom_create_name = "custom-desktop-starter"
 
         self._desktop_starter_template_path = os.path.join(self.get_project_dir(), "default.desktop")
 
-        self._desktop_starter_override_dir = os.path.join(GLib.get_user_data_dir(), "applications")
+        self._desktop_starter_override_dir = self._system_paths.get_starter_override_dir()
 
-        ###############################################################################################################
+        self._starter_locator = desktop.StarterLocator(
 
-        if os.getenv("APP_RUNNING_AS_FLATPAK") == "true":
+            self._system_paths.get_system_data_dirs(),
 
-            subprocess.Popen([
+            self._desktop_starter_override_dir,
 
-                "flatpak-spawn", "--host", "touch",
+            path_converter=self._system_paths.get_path_converter()
 
-                os.path.join(self.get_flatpak_real_home(), ".config", "mimeapps.list")
+            )
 
-                ])
+        self._starter_locator.set_active(True)
 
-        self._mimeinfo_override_paths = {
+        self.hook("host-environment-loaded", self._on_host_environment_loaded)
 
-            "MIME Cache": [
+        self._startup_stop_watch.lap("starter locator")
 
-                os.path.join(self._desktop_starter_override_dir, "mimeinfo.cache")
+        ###############################################################################################################
 
-                ],
+        self._mimeinfo_override_paths = self._system_paths.get_mimeinfo_paths()
 
-            "Added Associations": [
+        self._mime_info_manager = desktop.MimeInfoManager(self._mimeinfo_override_paths)
 
-                os.path.join(GLib.get_user_config_dir(), "mimeapps.list")
+        self._mime_info_manager.set_active(True)
 
-                ]
+        self._mime_type_index = desktop.MimeTypeIndex()
 
-            }
+        self._starter_validator = desktop.StarterValidator(command_checker=self._get_validation_command_exists, icon_checker=self._get_icon_exists)
+
+        self._validation_thread = None
+
+        self._validation_icon_names = set()
+
+        self._startup_stop_watch.lap("mime info")
 
         ###############################################################################################################
 
@@ -2486,6 +2271,8 @@ class Application(gui.Application):
 
         self._search_list.hook("item-activated", self._on_search_list_item_activated)
 
+        self._search_list.add_filter("mime:", self._mime_type_index.get_names)
+
         ###############################################################################################################
 
         self._save_settings_button = self._settings_page.get_save_button()
@@ -2508,6 +2295,8 @@ class Application(gui.Application):
 
         self._search_button = self._search_list.get_search_button()
 
+        self._startup_stop_watch.lap("pages")
+
         ###############################################################################################################
 
         self._view_menu_section = gui.Menu(self)
@@ -2558,49 +2347,27 @@ class Application(gui.Application):
 
         ###############################################################################################################
 
-        self._help_menu_section = gui.Menu(self)
-
-        self._help_menu_section.add_button("show_shortcuts", self._locale_manager.get("SHOW_SHORTCUTS_MENU_BUTTON_LABEL"))
-
-        self._help_menu_section.hook("show_shortcuts", self._on_show_shortcuts_button_clicked)
-
-        self._help_menu_section.add_button("show_about", self._locale_manager.get("SHOW_ABOUT_MENU_BUTTON_LABEL"))
-
-        self._help_menu_section.hook("show_about", self._on_show_about_button_clicked)
-
-        ###############################################################################################################
-
-        for name in ["big_start", "small_start", "big_reset_starter", "small_reset_starter", "big_delete_starter", "small_delete_starter", "big_discard_starter", "small_discard_starter"]:
-
-            setattr(self, f"_{name}_menu", gui.Menu(self))
-
-        ###############################################################################################################
-
-        for name in ["big_start", "big_reset_starter", "big_delete_starter", "big_discard_starter"]:
+        self._tools_menu_section = gui.Menu(self)
 
-            getattr(self, f"_{name}_menu").append_section(None, self._view_menu_section)
+        self._tools_menu_section.add_button("validate_starters", self._locale_manager.get("VALIDATE_STARTERS_MENU_BUTTON_LABEL"))
 
-            getattr(self, f"_{name}_menu").append_section(None, self._add_menu_section)
+        self._tools_menu_section.hook("validate_starters", self._on_validate_starters_button_clicked)
 
         ###############################################################################################################
 
-        for name in ["big_reset_starter", "small_reset_starter"]:
-
-            getattr(self, f"_{name}_menu").append_section(None, self._reset_starter_menu_section)
+        self._help_menu_section = gui.Menu(self)
 
-        for name in ["big_delete_starter", "small_delete_starter"]:
+        self._help_menu_section.add_button("show_shortcuts", self._locale_manager.get("SHOW_SHORTCUTS_MENU_BUTTON_LABEL"))
 
-            getattr(self, f"_{name}_menu").append_section(None, self._delete_starter_menu_section)
+        self._help_menu_section.hook("show_shortcuts", self._on_show_shortcuts_button_clicked)
 
-        for name in ["big_discard_starter", "small_discard_starter"]:
+        self._help_menu_section.add_button("show_about", self._locale_manager.get("SHOW_ABOUT_MENU_BUTTON_LABEL"))
 
-            getattr(self, f"_{name}_menu").append_section(None, self._discard_starter_menu_section)
+        self._help_menu_section.hook("show_about", self._on_show_about_button_clicked)
 
         ###############################################################################################################
 
-        for name in ["big_start", "small_start", "big_reset_starter", "small_reset_starter", "big_delete_starter", "small_delete_starter", "big_discard_starter", "small_discard_starter"]:
-
-            getattr(self, f"_{name}_menu").append_section(None, self._help_menu_section)
+        self._startup_stop_watch.lap("menu sections")
 
         ###############################################################################################################
 
@@ -2680,6 +2447,8 @@ class Application(gui.Application):
 
         self._greeter_page.append(self._greeter_window_handle)
 
+        self._startup_stop_watch.lap("greeter")
+
         ###############################################################################################################
 
         self._left_event_controller_key = Gtk.EventControllerKey()
@@ -2836,81 +2605,125 @@ class Application(gui.Application):
 
             self._main_split_layout = Gtk.Box()
 
-            self._main_split_layout.append(self._left_area_box)
+            self._main_split_layout.append(self._left_area_box)
+
+            self._main_split_layout.append(self._main_separator)
+
+            self._main_split_layout.append(self._right_area_box)
+
+        ###############################################################################################################
+
+        self._main_stack.connect("notify::visible-child", self._on_main_stack_visible_child_changed)
+
+        ###############################################################################################################
+
+        self._greeter_stack = Gtk.Stack()
+
+        self._greeter_stack.add_child(self._greeter_page)
+
+        self._greeter_stack.add_child(self._main_split_layout)
+
+        self._toast_overlay = Adw.ToastOverlay()
+
+        self._toast_overlay.set_vexpand(True)
+
+        self._toast_overlay.set_child(self._greeter_stack)
+
+        self._startup_stop_watch.lap("layout")
+
+        ###############################################################################################################
+
+        self._application_window_event_controller_key = Gtk.EventControllerKey()
+
+        self._application_window_event_controller_key.connect("key-pressed", self._on_application_window_event_controller_key_pressed)
+
+        self._application_window.set_icon_name(self._icon_finder.get_name("page.codeberg.libre_menu_editor.LibreMenuEditor"))
+
+        self._application_window.set_title(self._locale_manager.get("APPLICATION_NAME"))
+
+        self._application_window.add_controller(self._application_window_event_controller_key)
+
+        self._application_window.connect("map", self._on_application_window_map)
 
-            self._main_split_layout.append(self._main_separator)
+        self._application_window.connect("close-request", self._on_application_window_close_request)
 
-            self._main_split_layout.append(self._right_area_box)
+        self._application_window.set_content(self._toast_overlay)
 
         ###############################################################################################################
 
-        self._main_stack.connect("notify::visible-child", self._on_main_stack_visible_child_changed)
+        self._text_editor = DefaultTextEditor(self)
+
+        self._text_editor.hook("update", self._on_text_editor_update)
+
+        self._startup_stop_watch.lap("text editor")
 
         ###############################################################################################################
 
-        self._greeter_stack = Gtk.Stack()
+        self._process_manager = basic.ProcessManager(
 
-        self._greeter_stack.add_child(self._greeter_page)
+            os.path.join(self._config_dir, "lock"),
 
-        self._greeter_stack.add_child(self._main_split_layout)
+            os.path.join(self._config_dir, "argv")
 
-        self._toast_overlay = Adw.ToastOverlay()
+            )
 
-        self._toast_overlay.set_vexpand(True)
+        self._process_manager.hook("activate", self._on_process_manager_activate)
 
-        self._toast_overlay.set_child(self._greeter_stack)
+        self._startup_stop_watch.lap("process manager")
 
         ###############################################################################################################
 
-        self._about_window = Adw.AboutWindow()
+        self._application_window_drop_target = Gtk.DropTarget.new(Gdk.FileList, Gdk.DragAction.COPY)
 
-        self._about_window.set_application_icon(
+        self._application_window_drop_target.set_gtypes([Gdk.FileList])
 
-            self._icon_finder.get_name("page.codeberg.libre_menu_editor.LibreMenuEditor")
+        self._application_window_drop_target.connect("drop", self._on_application_window_drop_target_drop)
 
-            )
+        self._application_window.add_controller(self._application_window_drop_target)
 
-        self._about_window.set_application_name(self._locale_manager.get("APPLICATION_NAME"))
+        ###############################################################################################################
 
-        self._about_window.set_developer_name("libre-menu-editor")
+        self.connect("shutdown", self._on_application_shutdown)
 
-        self._about_window.set_issue_url("https://codeberg.org/libre-menu-editor/libre-menu-editor/issues")
+        self._update_menu_button()
 
-        self._about_window.set_copyright("© 2022 Free Software Foundation")
+        self._startup_stop_watch.lap("menus")
 
-        self._about_window.set_license_type(Gtk.License.GPL_3_0)
+        self._load_desktop_starter_dirs()
 
-        self._about_window.set_hide_on_close(True)
+        self._startup_stop_watch.lap("starters")
 
-        self._about_window.set_transient_for(self._application_window)
+    @basic.LazyProperty
+    def _about_window(self):
 
-        self._about_window.set_modal(True)
+        about_window = Adw.AboutWindow()
 
-        ###############################################################################################################
+        about_window.set_application_icon(
 
-        self._application_window_event_controller_key = Gtk.EventControllerKey()
+            self._icon_finder.get_name("page.codeberg.libre_menu_editor.LibreMenuEditor")
 
-        self._application_window_event_controller_key.connect("key-pressed", self._on_application_window_event_controller_key_pressed)
+            )
 
-        self._application_window.set_icon_name(self._icon_finder.get_name("page.codeberg.libre_menu_editor.LibreMenuEditor"))
+        about_window.set_application_name(self._locale_manager.get("APPLICATION_NAME"))
 
-        self._application_window.set_title(self._locale_manager.get("APPLICATION_NAME"))
+        about_window.set_developer_name("libre-menu-editor")
 
-        self._application_window.add_controller(self._application_window_event_controller_key)
+        about_window.set_issue_url("https://codeberg.org/libre-menu-editor/libre-menu-editor/issues")
 
-        self._application_window.connect("map", self._on_application_window_map)
+        about_window.set_copyright("© 2022 Free Software Foundation")
 
-        self._application_window.connect("close-request", self._on_application_window_close_request)
+        about_window.set_license_type(Gtk.License.GPL_3_0)
 
-        self._application_window.set_content(self._toast_overlay)
+        about_window.set_hide_on_close(True)
 
-        ###############################################################################################################
+        about_window.set_transient_for(self._application_window)
 
-        self._text_editor = DefaultTextEditor(self)
+        about_window.set_modal(True)
 
-        self._text_editor.hook("update", self._on_text_editor_update)
+        return about_window
 
-        ###############################################################################################################
+    @basic.LazyProperty
+    def _open_file_chooser_dialog(self):
 
         self._open_dialog_file_filter = Gtk.FileFilter()
 
@@ -2918,7 +2731,7 @@ class Application(gui.Application):
 
         if not os.getenv("APP_RUNNING_AS_FLATPAK") == "true" or os.getenv("USE_NATIVE_DIALOGS") == "true":
 
-            self._open_file_chooser_dialog = Gtk.FileChooserNative(select_multiple=True, filter=self._open_dialog_file_filter)
+            file_chooser_dialog = Gtk.FileChooserNative(select_multiple=True, filter=self._open_dialog_file_filter)
 
         else:
 
@@ -2932,51 +2745,55 @@ class Application(gui.Application):
 
             self._open_dialog_cancel_button.set_label(self._locale_manager.get("PATH_CHOOSER_DIALOG_CANCEL_BUTTON_LABEL"))
 
-            self._open_file_chooser_dialog = Gtk.FileChooserDialog(select_multiple=True, filter=self._open_dialog_file_filter)
+            file_chooser_dialog = Gtk.FileChooserDialog(select_multiple=True, filter=self._open_dialog_file_filter)
 
-            self._open_file_chooser_dialog.add_action_widget(self._open_dialog_accept_button, Gtk.ResponseType.ACCEPT)
+            file_chooser_dialog.add_action_widget(self._open_dialog_accept_button, Gtk.ResponseType.ACCEPT)
 
-            self._open_file_chooser_dialog.add_action_widget(self._open_dialog_cancel_button, Gtk.ResponseType.CANCEL)
+            file_chooser_dialog.add_action_widget(self._open_dialog_cancel_button, Gtk.ResponseType.CANCEL)
 
-            self._open_file_chooser_dialog.set_default_response(Gtk.ResponseType.ACCEPT)
+            file_chooser_dialog.set_default_response(Gtk.ResponseType.ACCEPT)
 
-        self._open_file_chooser_dialog.set_title(self._locale_manager.get("OPEN_FILE_CHOOSER_DIALOG_TITLE"))
+        file_chooser_dialog.set_title(self._locale_manager.get("OPEN_FILE_CHOOSER_DIALOG_TITLE"))
 
-        self._open_file_chooser_dialog.connect("response", self._on_open_file_chooser_dialog_response)
+        file_chooser_dialog.connect("response", self._on_open_file_chooser_dialog_response)
 
-        self._open_file_chooser_dialog.set_transient_for(self._application_window)
+        file_chooser_dialog.set_transient_for(self._application_window)
 
-        self._open_file_chooser_dialog.set_modal(True)
+        file_chooser_dialog.set_modal(True)
 
-        ###############################################################################################################
+        return file_chooser_dialog
 
-        self._process_manager = basic.ProcessManager(
+    def _create_menu(self, name):
 
-            os.path.join(self._config_dir, "lock"),
+        size, kind = name.split("_", 1)
 
-            os.path.join(self._config_dir, "argv")
+        menu = gui.Menu(self)
 
-            )
+        if size == "big":
 
-        self._process_manager.hook("activate", self._on_process_manager_activate)
+            menu.append_section(None, self._view_menu_section)
 
-        ###############################################################################################################
+            menu.append_section(None, self._add_menu_section)
 
-        self._application_window_drop_target = Gtk.DropTarget.new(Gdk.FileList, Gdk.DragAction.COPY)
+        if kind == "reset_starter":
 
-        self._application_window_drop_target.set_gtypes([Gdk.FileList])
+            menu.append_section(None, self._reset_starter_menu_section)
 
-        self._application_window_drop_target.connect("drop", self._on_application_window_drop_target_drop)
+        elif kind == "delete_starter":
 
-        self._application_window.add_controller(self._application_window_drop_target)
+            menu.append_section(None, self._delete_starter_menu_section)
 
-        ###############################################################################################################
+        elif kind == "discard_starter":
 
-        self.connect("shutdown", self._on_application_shutdown)
+            menu.append_section(None, self._discard_starter_menu_section)
 
-        self._update_menu_button()
+        else:
 
-        self._load_desktop_starter_dirs()
+            menu.append_section(None, self._tools_menu_section)
+
+        menu.append_section(None, self._help_menu_section)
+
+        return menu
 
     def _on_application_window_drop_target_drop(self, drop_target, value, x, y):
 
@@ -3008,13 +2825,13 @@ class Application(gui.Application):
 
         try:
 
-            self._text_editor.save(name)
+            changed_keys = self._text_editor.save(name)
 
             parser = self._text_editor.get_parser(name)
 
-            if not name in self._unsaved_custom_starters or not self._unsaved_custom_starters[name]["external"]:
+            if "MimeType" in changed_keys:
 
-                self._update_mime_data(parser)
+                self._update_mime_data(name, parser)
 
         except Exception as error:
 
@@ -3024,6 +2841,8 @@ class Application(gui.Application):
 
         else:
 
+            self._starter_locator.invalidate()
+
             text = parser.get_name()
 
             if not len(text):
@@ -3046,10 +2865,54 @@ class Application(gui.Application):
 
                     self._load_settings_page(name)
 
+    def _on_host_environment_loaded(self, event):
+
+        try:
+
+            Gio.Subprocess.new([
+
+                "flatpak-spawn", "--host", "touch",
+
+                os.path.join(self.get_flatpak_real_home(), ".config", "mimeapps.list")
+
+                ], Gio.SubprocessFlags.NONE)
+
+        except GLib.Error as error:
+
+            self.log(error, error=error)
+
+        self._starter_validator.clear()
+
+        if not self._system_paths.get_system_data_dirs() == self._starter_locator.get_data_dirs():
+
+            self._starter_locator.set_data_dirs(self._system_paths.get_system_data_dirs())
+
+            self._load_desktop_starter_dirs()
+
     def _on_application_shutdown(self, app):
 
         self._process_manager.set_active(False)
 
+        self._mime_info_manager.set_active(False)
+
+        self._starter_locator.set_active(False)
+
+        if self._profiler.get_active():
+
+            sys.stdout.write("\n{}\n".format(self._profiler.get_text()))
+
+            if self._profiler_trace_path:
+
+                try:
+
+                    self._profiler.save_trace(self._profiler_trace_path)
+
+                except OSError as error:
+
+                    self.log(error, error=error, path=self._profiler_trace_path)
+
+        self._debug_log.close()
+
     def _on_application_window_close_request(self, window):
 
         if self._settings_page.get_changed():
@@ -3070,6 +2933,16 @@ class Application(gui.Application):
 
             self._greeter_button.grab_focus()
 
+        if self._startup_stop_watch.get_running():
+
+            self._startup_stop_watch.lap("window mapped")
+
+            self._startup_stop_watch.stop()
+
+            if "--debug" in sys.argv:
+
+                sys.stdout.write("\n{}\n".format(self._startup_stop_watch.get_text()))
+
     def _on_application_window_event_controller_key_pressed(self, window, keyval, keycode, state):
 
         control_modifier_pressed = state == state | Gdk.ModifierType.CONTROL_MASK
@@ -3400,9 +3273,25 @@ class Application(gui.Application):
 
         self._show_shortcuts_dialog()
 
+    def _on_validate_starters_button_clicked(self, event):
+
+        self._validate_desktop_starters()
+
+    def _on_validation_dialog_row_activated(self, list_box, row, dialog):
+
+        dialog.close()
+
+        self._on_search_list_item_activated(None, row.name)
+
     def _on_show_about_button_clicked(self, event):
 
-        self._about_window.set_debug_info(self._debug_log.get())
+        debug_info = [self._debug_log.get(), self._startup_stop_watch.get_text()]
+
+        if self._profiler.get_active():
+
+            debug_info.append(self._profiler.get_text())
+
+        self._about_window.set_debug_info("\n\n".join(debug_info))
 
         self._about_window.set_visible(True)
 
@@ -3434,79 +3323,57 @@ class Application(gui.Application):
 
     def _get_desktop_starter_has_default(self, name):
 
-        return os.path.exists(self._get_desktop_starter_default_path(name, include_host=True))
+        return self._starter_locator.get_has_default(name)
 
     def _get_desktop_starter_has_override(self, name):
 
-        return os.path.exists(self._get_desktop_starter_override_path(name))
+        return self._starter_locator.get_has_override(name)
 
     def _get_desktop_starter_default_path(self, name, include_host=False):
 
-        for directory in self._system_data_dirs:
-
-            path = os.path.join(directory, "applications", "%s.desktop" % name)
-
-            if os.getenv("APP_RUNNING_AS_FLATPAK") == "true" and include_host:
-
-                path = self.get_flatpak_sandbox_system_path(path)
-
-            if os.path.exists(path):
-
-                return path
-
-        else:
-
-            return os.path.join(self._system_data_dirs[0], "applications", "%s.desktop" % name)
+        return self._starter_locator.get_default_path(name, include_host=include_host)
 
     def _get_desktop_starter_override_path(self, name, include_host=False):
 
-        path = os.path.join(self._desktop_starter_override_dir, "%s.desktop" % name)
-
-        if os.getenv("APP_RUNNING_AS_FLATPAK") == "true" and include_host:
-
-            path = self.get_flatpak_sandbox_system_path(path)
-
-        return path
+        return self._starter_locator.get_override_path(name, include_host=include_host)
 
     def _get_desktop_starter_names(self):
 
-        names = []
+        return self._starter_locator.get_names()
 
-        for directory in self._system_data_dirs:
+    def _get_validation_command_exists(self, text):
 
-            directory = os.path.join(directory, "applications")
+        return self.get_command_exists(text, include_lookup_cwd=True)
 
-            if os.path.exists(directory):
+    def _get_icon_exists(self, icon):
 
-                for file in os.listdir(directory):
+        if os.path.sep in icon:
 
-                    if file.endswith(".desktop"):
+            if os.getenv("APP_RUNNING_AS_FLATPAK") == "true":
 
-                        name = file[:-len(".desktop")]
+                icon = self.get_flatpak_sandbox_system_path(icon)
 
-                        if not name in names:
+            return os.path.isfile(icon)
 
-                            names.append(name)
-
-        if os.path.exists(self._desktop_starter_override_dir):
+        else:
 
-            for file in os.listdir(self._desktop_starter_override_dir):
+            return icon in self._validation_icon_names or f"{icon}-symbolic" in self._validation_icon_names
 
-                if file.endswith(".desktop"):
+    def _get_validation_issue_text(self, issue):
 
-                    name = file[:-len(".desktop")]
+        text = self._locale_manager.get("VALIDATION_%s_TEXT" % issue["problem"].upper().replace("-", "_"))
 
-                    if not name in names:
+        if issue["section"] and issue["section"].startswith("Desktop Action "):
 
-                        names.append(name)
+            text = f"{text} ({issue['section'][len('Desktop Action '):]})"
 
-            else:
+        if issue["value"]:
 
-                return names
+            return f"{text}: {issue['value']}"
 
         else:
 
-            return names
+            return text
 
     def _set_show_hidden_switch_state_without_triggering(self, state):
 
@@ -3518,15 +3385,17 @@ class Application(gui.Application):
 
     def _load_desktop_starter_dirs(self):
 
-        for name in reversed(sorted(self._get_desktop_starter_names())):
+        for name in self._starter_locator.iter_names(reverse=True):
 
-            try:
+            if not name in self._desktop_starter_parsers:
 
-                self._add_desktop_starter(name)
+                try:
 
-            except Exception as error:
+                    self._add_desktop_starter(name)
 
-                self.log(error, error=error)
+                except Exception as error:
+
+                    self.log(error, error=error, name=name, path=self._starter_locator.get_path(name))
 
     def _focus_settings_page(self):
 
@@ -3820,6 +3689,70 @@ class Application(gui.Application):
 
         reset_dialog.show()
 
+    def _show_validation_dialog(self, report):
+
+        if len(report):
+
+            body = self._locale_manager.get("VALIDATION_DIALOG_FAILED_BODY")
+
+        else:
+
+            body = self._locale_manager.get("VALIDATION_DIALOG_PASSED_BODY")
+
+        validation_dialog = Adw.MessageDialog.new(
+
+            self._application_window,
+
+            self._locale_manager.get("VALIDATION_DIALOG_HEAD"),
+
+            body
+
+            )
+
+        validation_dialog.add_response(
+
+            "close", self._locale_manager.get("VALIDATION_DIALOG_CLOSE_BUTTON_LABEL")
+
+            )
+
+        if len(report):
+
+            list_box = Gtk.ListBox()
+
+            list_box.add_css_class("boxed-list")
+
+            list_box.set_selection_mode(Gtk.SelectionMode.NONE)
+
+            list_box.connect("row-activated", self._on_validation_dialog_row_activated, validation_dialog)
+
+            for name, issues in report.items():
+
+                row = Adw.ActionRow()
+
+                row.name = name
+
+                row.set_title(name)
+
+                row.set_subtitle("\n".join([self._get_validation_issue_text(issue) for issue in issues]))
+
+                row.set_activatable(True)
+
+                list_box.append(row)
+
+            scrolled_window = Gtk.ScrolledWindow()
+
+            scrolled_window.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
+
+            scrolled_window.set_propagate_natural_height(True)
+
+            scrolled_window.set_max_content_height(400)
+
+            scrolled_window.set_child(list_box)
+
+            validation_dialog.set_extra_child(scrolled_window)
+
+        validation_dialog.show()
+
     def _show_delete_dialog(self, callback, *callback_args, **callback_kwargs):
 
         delete_dialog = Adw.MessageDialog.new(
@@ -3966,81 +3899,23 @@ class Application(gui.Application):
 
                 raise error
 
-    def _update_mime_data(self, parser, delete=False):
-
-        for section in self._mimeinfo_override_paths:
-
-            paths = self._mimeinfo_override_paths[section]
-
-            mime_parser = ConfigParser(interpolation=None, strict=False)
-
-            mime_parser.optionxform = str
-
-            if not mime_parser.has_section(section):
-
-                mime_parser.add_section(section)
-
-            mimeinfo_changed = False
-
-            for path in paths:
-
-                if os.access(path, os.R_OK):
-
-                    mime_parser.read(path)
-
-            app_name = os.path.basename(parser.get_save_path())
-
-            app_mimetypes = parser.get_mimetypes()
+    def _update_mime_data(self, name, parser, delete=False):
 
-            mime_data_dict = dict(mime_parser.items(section))
-
-            for mime_data_mimetype in mime_data_dict:
-
-                mime_data_names = list(filter(None, mime_data_dict[mime_data_mimetype].split(";")))
-
-                if app_name in mime_data_names and (not mime_data_mimetype in app_mimetypes or delete):
-
-                    mime_data_names.remove(app_name)
-
-                    if len(mime_data_names):
-
-                        mime_parser.set(section, mime_data_mimetype, f"{';'.join(mime_data_names)};")
-
-                    else:
-
-                        mime_parser.remove_option(section, mime_data_mimetype)
-
-                    mimeinfo_changed = True
+        with self._profiler.span("update-mime-data"):
 
             if not delete:
 
-                for app_mimetype in app_mimetypes:
-
-                    if not app_mimetype in mime_data_dict:
-
-                        mime_parser.set(section, app_mimetype, f"{app_name};")
-
-                        mimeinfo_changed = True
-
-                    elif not app_name in mime_data_dict[app_mimetype]:
-
-                        mime_data_names = list(filter(None, mime_data_dict[app_mimetype].split(";")))
-
-                        mime_data_names.append(app_name)
+                self._mime_type_index.update(name, parser.get_mimetypes())
 
-                        mime_parser.set(section, app_mimetype, f"{';'.join(mime_data_names)};")
-
-                        mimeinfo_changed = True
-
-            if mimeinfo_changed:
+            else:
 
-                for path in paths:
+                self._mime_type_index.update(name, [])
 
-                    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            if not name in self._unsaved_custom_starters or not self._unsaved_custom_starters[name]["external"]:
 
-                    with open(path, "w") as file:
+                app_name = os.path.basename(parser.get_save_path())
 
-                        mime_parser.write(file, space_around_delimiters=False)
+                self._mime_info_manager.update(app_name, parser.get_mimetypes(), delete=delete)
 
     def _load_settings_page(self, name):
 
@@ -4094,9 +3969,11 @@ class Application(gui.Application):
 
                     self._settings_page.set_always_show_save_button(False)
 
-                    self._update_mime_data(parser)
+                changed_keys = self._settings_page.save_desktop_starter()
 
-                self._settings_page.save_desktop_starter()
+                if "MimeType" in changed_keys and (not self._current_desktop_starter_name in self._unsaved_custom_starters or not self._unsaved_custom_starters[self._current_desktop_starter_name]["external"]):
+
+                    self._update_mime_data(self._current_desktop_starter_name, parser)
 
                 if self._current_desktop_starter_name in self._text_editor.get_names():
 
@@ -4112,6 +3989,8 @@ class Application(gui.Application):
 
             else:
 
+                self._starter_locator.invalidate()
+
                 if self._current_desktop_starter_name in self._unsaved_custom_starters and not self._unsaved_custom_starters[self._current_desktop_starter_name]["external"]:
 
                     del self._unsaved_custom_starters[self._current_desktop_starter_name]
@@ -4128,6 +4007,56 @@ class Application(gui.Application):
 
                 self._update_menu_button_menu_model()
 
+    def _validate_desktop_starters(self):
+
+        if self._validation_thread is None:
+
+            self._validation_icon_names = set(self._icon_finder.get_names()) | set(self._icon_finder.get_legacy_names())
+
+            paths = {}
+
+            for name in self._get_desktop_starter_names():
+
+                paths[self._starter_locator.get_path(name, include_host=True)] = name
+
+            self._validation_thread = threading.Thread(target=self._validation_thread_target, args=[paths], daemon=True)
+
+            self._validation_thread.start()
+
+    def _validation_thread_target(self, paths):
+
+        try:
+
+            results = self._starter_validator.validate(paths)
+
+        except Exception as error:
+
+            GLib.idle_add(self._after_desktop_starters_validation_failed, error)
+
+            results = {}
+
+        GLib.idle_add(self._after_desktop_starters_validated, paths, results)
+
+    def _after_desktop_starters_validation_failed(self, error):
+
+        self.log(error, level="error", exception=type(error).__name__)
+
+        return GLib.SOURCE_REMOVE
+
+    def _after_desktop_starters_validated(self, paths, results):
+
+        self._validation_thread = None
+
+        report = {}
+
+        for path in sorted(results, key=lambda path: paths[path]):
+
+            if len(results[path]):
+
+                report[paths[path]] = results[path]
+
+        self._show_validation_dialog(report)
+
     def _get_random_unused_desktop_starter_name(self):
 
         while True:
@@ -4136,7 +4065,7 @@ class Application(gui.Application):
 
             name = "%s.%s" % (self._desktop_starter_custom_create_name, random_string)
 
-            if not name in self._get_desktop_starter_names() and not name in self._unsaved_custom_starters:
+            if not self._starter_locator.get_has_name(name) and not name in self._unsaved_custom_starters:
 
                 return name
 
@@ -4220,7 +4149,7 @@ class Application(gui.Application):
 
                         except Exception as error:
 
-                            self.log(error, error=error)
+                            self.log(error, error=error, name=name, path=path)
 
                             exceptions[os.path.basename(path)] = name
 
@@ -4330,18 +4259,20 @@ class Application(gui.Application):
 
         try:
 
-            self._update_mime_data(parser, delete=True)
+            self._update_mime_data(name, parser, delete=True)
 
             os.remove(path)
 
         except Exception as error:
 
-            self.log(error, error=error)
+            self.log(error, error=error, name=name, path=path)
 
             self.notify(self._locale_manager.get("STARTER_RESET_ERROR_TEXT"), error=True)
 
             return True
 
+        self._starter_locator.invalidate()
+
         text = parser.get_name()
 
         if not len(text):
@@ -4366,18 +4297,20 @@ class Application(gui.Application):
 
         try:
 
-            self._update_mime_data(parser, delete=True)
+            self._update_mime_data(name, parser, delete=True)
 
             os.remove(path)
 
         except Exception as error:
 
-            self.log(error, error=error)
+            self.log(error, error=error, name=name, path=path)
 
             self.notify(self._locale_manager.get("STARTER_DELETE_ERROR_TEXT"), error=True)
 
             return True
 
+        self._starter_locator.invalidate()
+
         text = parser.get_name()
 
         if not len(text):
@@ -4398,7 +4331,7 @@ class Application(gui.Application):
 
         except Exception as error:
 
-            self.log(error, error=error)
+            self.log(error, error=error, name=name)
 
             self.notify(self._locale_manager.get("OPEN_FILE_ERROR_TEXT"), error=True)
 
@@ -4422,7 +4355,9 @@ class Application(gui.Application):
 
             search_data.append(text)
 
-        self._search_list.add(name, text, icon, search_data)
+        with self._profiler.span("search-list.add"):
+
+            self._search_list.add(name, text, icon, search_data)
 
     def _remove_search_list_item(self, name):
 
@@ -4496,6 +4431,8 @@ class Application(gui.Application):
 
             self._desktop_starter_parsers[name] = parser
 
+            self._mime_type_index.update(name, parser.get_mimetypes())
+
             if not skip_search_list:
 
                 self._add_search_list_item(name)
@@ -4520,6 +4457,8 @@ class Application(gui.Application):
 
             del self._desktop_starter_parsers[name]
 
+            self._mime_type_index.update(name, [])
+
             if not skip_search_list:
 
                 if self._search_list.get_search_mode():
@@ -4570,33 +4509,31 @@ class Application(gui.Application):
 
         if name in self._unsaved_custom_starters:
 
-            load_path = self._unsaved_custom_starters[name]["load-path"]
+            save_path = self._unsaved_custom_starters[name]["save-path"]
 
         else:
 
-            load_path = self._get_desktop_starter_override_path(name, include_host=True)
-
-        if name in self._unsaved_custom_starters:
+            save_path = self._get_desktop_starter_override_path(name, include_host=True)
 
-            save_path = self._unsaved_custom_starters[name]["save-path"]
+        if name in self._unsaved_custom_starters and os.path.exists(self._unsaved_custom_starters[name]["load-path"]):
 
-        else:
+            load_path = self._unsaved_custom_starters[name]["load-path"]
 
-            save_path = self._get_desktop_starter_override_path(name, include_host=True)
+        elif not name in self._unsaved_custom_starters and self._starter_locator.get_has_override(name):
 
-        if not os.path.exists(load_path):
+            load_path = self._get_desktop_starter_override_path(name, include_host=True)
 
-            default_path = self._get_desktop_starter_default_path(name, include_host=True)
+        elif self._starter_locator.get_has_default(name):
 
-            if os.path.exists(default_path):
+            load_path = self._get_desktop_starter_default_path(name, include_host=True)
 
-                load_path = default_path
+        else:
 
-            else:
+            raise StarterNotFoundError(name)
 
-                raise StarterNotFoundError(name)
+        with self._profiler.span("desktop-parser.init"):
 
-        parser = DesktopParser(self, load_path, save_path)
+            parser = desktop.DesktopParser(self, load_path, save_path)
 
         return parser
 
@@ -4606,14 +4543,30 @@ class Application(gui.Application):
 
             self._debug_log.set_raise_errors(True)
 
+            self._debug_log.set_level("debug")
+
             args.remove("--debug")
 
+        if len(args) and "--profile" in args:
+
+            args.remove("--profile")
+
         if len(args) and "--new" in args:
 
             self._create_desktop_starter()
 
             args.remove("--new")
 
+        while "--mimetype" in args:
+
+            index = args.index("--mimetype")
+
+            if index + 1 < len(args):
+
+                self._search_list.set_search_text(f"mime:{args.pop(index + 1)}")
+
+            args.pop(index)
+
         self._load_external_starters(*args)
 
     def notify(self, text, error=False):
@@ -4630,9 +4583,9 @@ class Application(gui.Application):
 
         self._toast_overlay.add_toast(toast)
 
-    def log(self, text, error=None):
+    def log(self, text, error=None, level=None, **fields):
 
-        self._debug_log.add(text, error=error)
+        self._debug_log.add(text, error=error, level=level, **fields)
 
 if __name__ == "__main__":
 
@@ -16,7 +16,7 @@
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
 
-import os, sys, json, threading, time, fcntl
+import os, sys, json, math, threading, time, fcntl, bisect, socket, queue, collections, contextlib, inspect, weakref
 
 
 class PathInspector():
@@ -47,7 +47,7 @@ class PathInspector():
 
             time.sleep(self._delay)
 
-            for path in self._paths:
+            for path in list(self._paths):
 
                 old_timestamp = self._paths[path]["timestamp"]
 
@@ -144,14 +144,101 @@ class PathInspector():
         self._events.release(id)
 
 
+class ProcessClient():
+
+    def __init__(self, lock_path, argv_path, socket_path=None):
+
+        if socket_path is None:
+
+            socket_path = os.path.join(os.path.dirname(lock_path), "socket")
+
+        self._lock_path = lock_path
+
+        self._argv_path = argv_path
+
+        self._socket_path = socket_path
+
+        self._socket_timeout = 2.0
+
+    def _send_socket_args(self, args):
+
+        client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+        client.settimeout(self._socket_timeout)
+
+        try:
+
+            client.connect(self._socket_path)
+
+            client.sendall("\0".join(args).encode("utf-8"))
+
+            client.shutdown(socket.SHUT_WR)
+
+            return client.recv(1) == b"1"
+
+        except (OSError, UnicodeError):
+
+            return False
+
+        finally:
+
+            client.close()
+
+    def _append_argv_file(self, args):
+
+        os.makedirs(os.path.dirname(self._argv_path), exist_ok=True)
+
+        data = "\n{}".format("\n".join(args)).encode("utf-8")
+
+        file = os.open(self._argv_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+
+        try:
+
+            os.write(file, data)
+
+        finally:
+
+            os.close(file)
+
+    def get_locked(self):
+
+        try:
+
+            with open(self._lock_path, "a") as file:
+
+                fcntl.lockf(file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+                fcntl.lockf(file, fcntl.LOCK_UN)
+
+        except FileNotFoundError:
+
+            return False
+
+        except IOError:
+
+            return True
+
+        return False
+
+    def send(self, args):
+
+        if not self._send_socket_args(args):
+
+            self._append_argv_file(args)
+
+
 class ProcessManager():
 
-    def __init__(self, lock_path, argv_path, exit=True):
+    def __init__(self, lock_path, argv_path, exit=True, socket_path=None):
 
         os.makedirs(os.path.dirname(lock_path), exist_ok=True)
 
         os.makedirs(os.path.dirname(argv_path), exist_ok=True)
 
+        if socket_path is None:
+
+            socket_path = os.path.join(os.path.dirname(lock_path), "socket")
+
         try:
 
             self._lock_file = open(lock_path, "w+")
@@ -160,275 +247,1261 @@ class ProcessManager():
 
         except IOError as error:
 
-            with open(argv_path, "a") as file:
+            ProcessClient(lock_path, argv_path, socket_path).send(sys.argv[1:])
+
+            if exit:
+
+                sys.exit(int(exit))
+
+            else:
+
+                raise error
+
+        else:
+
+            self._lock_path = lock_path
+
+            self._argv_path = argv_path
+
+            self._socket_path = socket_path
+
+            self._socket_timeout = 2.0
+
+            self._socket_max_size = 1048576
+
+            self._active = False
+
+            self._pending_args = []
+
+            self._lock = threading.Lock()
+
+            self._events = EventManager()
+
+            self._events.add("activate", list)
+
+            self._path_inspector = PathInspector()
+
+            self._path_inspector.hook("created", self._on_path_inspector_created)
+
+            self._path_inspector.hook("changed", self._on_path_inspector_changed)
+
+            self._initial_args = sys.argv[1:]
+
+            self._socket = self._open_socket_server()
+
+            if not self._socket is None:
+
+                self._socket_thread = threading.Thread(target=self._socket_thread_target, daemon=True)
+
+                self._socket_thread.start()
+
+    def _open_socket_server(self):
+
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+        try:
+
+            if os.path.exists(self._socket_path) or os.path.islink(self._socket_path):
+
+                os.remove(self._socket_path)
+
+            server.bind(self._socket_path)
+
+            os.chmod(self._socket_path, 0o600)
+
+            server.listen()
+
+        except OSError:
+
+            server.close()
+
+            return None
+
+        return server
+
+    def _close_socket_server(self):
+
+        if not self._socket is None:
+
+            try:
+
+                self._socket.shutdown(socket.SHUT_RDWR)
+
+            except OSError:
+
+                pass
+
+            self._socket.close()
+
+            self._socket = None
+
+            try:
+
+                os.remove(self._socket_path)
+
+            except OSError:
+
+                pass
+
+    def _socket_thread_target(self):
+
+        server = self._socket
+
+        while True:
+
+            try:
+
+                connection, address = server.accept()
+
+            except OSError:
+
+                break
+
+            with connection:
+
+                try:
+
+                    connection.settimeout(self._socket_timeout)
+
+                    args = self._read_socket_args(connection)
+
+                    if not args is None:
+
+                        connection.sendall(b"1")
+
+                except OSError:
+
+                    continue
+
+            if not args is None:
+
+                self._receive_args(args)
+
+    def _read_socket_args(self, connection):
+
+        chunks = []
+
+        size = 0
+
+        while True:
+
+            chunk = connection.recv(65536)
+
+            if not chunk:
+
+                break
+
+            size += len(chunk)
+
+            if size > self._socket_max_size:
+
+                return None
+
+            chunks.append(chunk)
+
+        try:
+
+            return b"".join(chunks).decode("utf-8").split("\0")
+
+        except UnicodeError:
+
+            return None
+
+    def _receive_args(self, args):
+
+        with self._lock:
+
+            if not self._active:
+
+                self._pending_args.append(args)
+
+                return
+
+        self._trigger_argv_event(args)
+
+    def _on_path_inspector_created(self, event, path, timestamp):
+
+        self._parse_argv_file(path)
+
+    def _on_path_inspector_changed(self, event, path, timestamp):
+
+        self._parse_argv_file(path)
+
+    def _parse_argv_file(self, path):
+
+        reading_path = "{}.{}".format(path, os.getpid())
+
+        try:
+
+            os.rename(path, reading_path)
+
+        except FileNotFoundError:
+
+            self._trigger_argv_event([])
+
+        else:
+
+            with open(reading_path, "r") as file:
+
+                args = file.read().splitlines()
+
+            os.remove(reading_path)
+
+            self._trigger_argv_event(args)
+
+    def _trigger_argv_event(self, args):
+
+        args =  list(filter(None, args))
+
+        self._events.trigger("activate", args)
+
+    def get_active(self):
+
+        return self._active
+
+    def set_active(self, value):
+
+        if value:
+
+            with self._lock:
+
+                self._active = True
+
+                pending_args = self._pending_args
+
+                self._pending_args = []
+
+            if len(self._initial_args):
+
+                self._trigger_argv_event(self._initial_args)
+
+                self._initial_args.clear()
+
+            for args in pending_args:
+
+                self._trigger_argv_event(args)
+
+            if not self._argv_path in self._path_inspector.get_paths():
+
+                if os.path.exists(self._argv_path):
+
+                    self._parse_argv_file(self._argv_path)
+
+                self._path_inspector.add(self._argv_path)
+
+                return
+
+        else:
+
+            with self._lock:
+
+                self._active = False
+
+            self._close_socket_server()
+
+        self._path_inspector.set_active(value)
+
+    def hook(self, event, callback):
+
+        return self._events.hook(event, callback)
+
+    def release(self, id):
+
+        self._events.release(id)
+
+
+class LazyProperty():
+
+    def __init__(self, function):
+
+        self._function = function
+
+        self._name = function.__name__
+
+    def __set_name__(self, owner, name):
+
+        self._name = name
+
+    def __get__(self, instance, owner=None):
+
+        if instance is None:
+
+            return self
+
+        value = self._function(instance)
+
+        instance.__dict__[self._name] = value
+
+        return value
+
+
+class StopWatch():
+
+    def __init__(self):
+
+        self._start_time = time.perf_counter()
+
+        self._lap_time = self._start_time
+
+        self._laps = []
+
+        self._running = True
+
+    def lap(self, name):
+
+        if not self._running:
+
+            return
+
+        now = time.perf_counter()
+
+        self._laps.append((name, (now - self._lap_time) * 1000))
+
+        self._lap_time = now
+
+    def stop(self):
+
+        self._running = False
+
+    def get_running(self):
+
+        return self._running
+
+    def get_laps(self):
+
+        return list(self._laps)
+
+    def get_total(self):
+
+        return (self._lap_time - self._start_time) * 1000
+
+    def get_text(self):
+
+        lines = ["{}: {:.1f} ms".format(name, duration) for name, duration in self._laps]
+
+        lines.append("total: {:.1f} ms".format(self.get_total()))
+
+        return "\n".join(lines)
+
+
+class ProfilerSpan():
+
+    def __init__(self, profiler, name):
+
+        self._profiler = profiler
+
+        self._name = name
+
+        self._start_time = 0
+
+    def __enter__(self):
+
+        self._start_time = time.perf_counter()
+
+        return self
+
+    def __exit__(self, error_type, error, traceback):
+
+        self._profiler.add(self._name, self._start_time, time.perf_counter())
+
+
+class Profiler():
+
+    def __init__(self, active=False, trace=False, max_samples=10000, max_trace_events=100000):
+
+        self._active = active
+
+        self._trace = trace
+
+        self._max_samples = max_samples
+
+        self._start_time = time.perf_counter()
+
+        self._stats = {}
+
+        self._trace_events = collections.deque(maxlen=max_trace_events)
+
+        self._null_span = contextlib.nullcontext()
+
+        self._lock = threading.Lock()
+
+    def _get_percentile(self, samples, percent):
+
+        index = max(0, int(math.ceil(len(samples) * percent / 100)) - 1)
+
+        return samples[index]
+
+    def span(self, name):
+
+        if not self._active:
+
+            return self._null_span
+
+        return ProfilerSpan(self, name)
+
+    def add(self, name, start_time, end_time):
+
+        duration = end_time - start_time
+
+        with self._lock:
+
+            try:
+
+                stats = self._stats[name]
+
+            except KeyError:
+
+                stats = self._stats[name] = {
+
+                    "count": 0,
+
+                    "total": 0.0,
+
+                    "max": 0.0,
+
+                    "samples": collections.deque(maxlen=self._max_samples)
+
+                    }
+
+            stats["count"] += 1
+
+            stats["total"] += duration
+
+            stats["max"] = max(stats["max"], duration)
+
+            stats["samples"].append(duration)
+
+            if self._trace:
+
+                self._trace_events.append((name, start_time, duration, threading.get_ident()))
+
+    def get_stats(self):
+
+        results = {}
+
+        with self._lock:
+
+            items = [(name, dict(stats, samples=sorted(stats["samples"]))) for name, stats in self._stats.items()]
+
+        for name, stats in items:
+
+            results[name] = {
+
+                "count": stats["count"],
+
+                "total": stats["total"] * 1000,
+
+                "mean": stats["total"] * 1000 / stats["count"],
+
+                "p50": self._get_percentile(stats["samples"], 50) * 1000,
+
+                "p90": self._get_percentile(stats["samples"], 90) * 1000,
+
+                "p99": self._get_percentile(stats["samples"], 99) * 1000,
+
+                "max": stats["max"] * 1000
+
+                }
+
+        return results
+
+    def get_text(self):
+
+        stats = self.get_stats()
+
+        lines = ["{:<32} {:>8} {:>10} {:>8} {:>8} {:>8} {:>8}".format("span", "count", "total ms", "p50", "p90", "p99", "max")]
+
+        for name in sorted(stats, key=lambda name: stats[name]["total"], reverse=True):
+
+            lines.append("{:<32} {:>8} {:>10.1f} {:>8.2f} {:>8.2f} {:>8.2f} {:>8.2f}".format(
+
+                name,
+
+                stats[name]["count"],
+
+                stats[name]["total"],
+
+                stats[name]["p50"],
+
+                stats[name]["p90"],
+
+                stats[name]["p99"],
+
+                stats[name]["max"]
+
+                ))
+
+        return "\n".join(lines)
+
+    def save_trace(self, path):
+
+        with self._lock:
+
+            events = list(self._trace_events)
+
+        process_id = os.getpid()
+
+        data = {
+
+            "traceEvents": [
+
+                {
+
+                    "name": name,
+
+                    "ph": "X",
+
+                    "ts": (start_time - self._start_time) * 1000000,
+
+                    "dur": duration * 1000000,
+
+                    "pid": process_id,
+
+                    "tid": thread_id
+
+                    }
+
+                for name, start_time, duration, thread_id in events
+
+                ],
+
+            "displayTimeUnit": "ms"
+
+            }
+
+        if os.path.dirname(path):
+
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        with open(path, "w") as file:
+
+            json.dump(data, file)
+
+    def clear(self):
+
+        with self._lock:
+
+            self._stats.clear()
+
+            self._trace_events.clear()
+
+    def get_active(self):
+
+        return self._active
+
+    def set_active(self, value):
+
+        self._active = value
+
+    def get_trace(self):
+
+        return self._trace
+
+    def set_trace(self, value):
+
+        self._trace = value
+
+
+class SearchFilter():
+
+    def __init__(self):
+
+        self._keywords = {}
+
+        self._filters = {}
+
+    def get_keywords(self, name):
+
+        return list(self._keywords[name])
+
+    def set_keywords(self, name, keywords):
+
+        self._keywords[name] = [keyword.lower() for keyword in keywords]
+
+    def remove(self, name):
+
+        del self._keywords[name]
+
+    def get_names(self):
+
+        return list(self._keywords.keys())
+
+    def get_filters(self):
+
+        return list(self._filters.keys())
+
+    def add_filter(self, prefix, callback):
+
+        self._filters[prefix.lower()] = callback
+
+    def remove_filter(self, prefix):
+
+        del self._filters[prefix.lower()]
+
+    def get_matches(self, text, names=None):
+
+        text = text.lower()
+
+        if names is None:
+
+            names = self._keywords
+
+        for prefix in self._filters:
+
+            if text.startswith(prefix):
+
+                filter_names = set(self._filters[prefix](text[len(prefix):].strip()))
+
+                return set(name for name in names if name in filter_names)
+
+        return set(name for name in names if any(text in keyword for keyword in self._keywords[name]))
+
+
+class SubstringSearchIndex():
+
+    def __init__(self, names=(), separator=";"):
+
+        self._separator = separator
+
+        self.set_names(names)
+
+    def get_names(self):
+
+        return list(self._names)
+
+    def set_names(self, names):
+
+        self._names = list(names)
+
+        self._search_string = self._separator.join(self._names)
+
+        self._lower_string = self._search_string.lower()
+
+    def get_separator(self):
+
+        return self._separator
+
+    def search(self, keywords, exclude=(), interrupted=None):
+
+        lists = []
+
+        for string in keywords:
+
+            lists.append([])
+
+            start_pos = 0
+
+            while interrupted is None or not interrupted():
+
+                try:
+
+                    start_pos = self._lower_string.index(string, start_pos)
+
+                except ValueError:
+
+                    break
+
+                start_pos = self._search_string.rfind(self._separator, 0, start_pos)
+
+                start_pos = 0 if start_pos < 0 else start_pos + len(self._separator)
+
+                end_pos = self._search_string.find(self._separator, start_pos)
+
+                if end_pos < 0:
+
+                    name = self._search_string[start_pos:]
+
+                else:
+
+                    name = self._search_string[start_pos:end_pos]
+
+                if not name in exclude:
+
+                    lists[-1].append(name)
+
+                if end_pos < 0:
+
+                    break
+
+                start_pos = end_pos + len(self._separator)
+
+                if not len(self._search_string) > start_pos:
+
+                    break
+
+            else:
+
+                return set()
+
+        if not len(lists):
+
+            return set()
+
+        names = set(lists.pop(0))
+
+        for remaining_list in lists:
+
+            names = names.intersection(remaining_list)
+
+        return names
+
+
+class EventAlreadyExistingError(Exception):
+
+    pass
+
+
+class EventNotFoundError(Exception):
+
+    pass
+
+
+class EventCallbackInvalidError(Exception):
+
+    pass
+
+
+class EventHookInvalidError(Exception):
+
+    pass
+
+
+class EventInvalidArgumentsError(Exception):
+
+    pass
+
+
+class EventUnexpectedArgumentsError(Exception):
+
+    pass
+
+
+class EventMissingArgumentsError(Exception):
+
+    pass
+
+
+class EventSchedulerMissingError(Exception):
+
+    pass
+
+
+class WeakCallback():
+
+    def __init__(self, method, scheduler=None):
+
+        self._reference = weakref.WeakMethod(method, self._on_reference_collected)
+
+        self._scheduler = scheduler
+
+        self._finalizers = []
+
+    def _on_reference_collected(self, reference):
+
+        if self._scheduler is None:
+
+            self._run_finalizers()
+
+        else:
+
+            self._scheduler(self._run_finalizers)
+
+    def _run_finalizers(self):
+
+        for callback, args in self._finalizers:
+
+            callback(*args)
+
+        self._finalizers.clear()
+
+        return False
+
+    def __call__(self, *args, **kwargs):
+
+        method = self._reference()
+
+        if not method is None:
+
+            return method(*args, **kwargs)
+
+    def add_finalizer(self, callback, *args):
+
+        self._finalizers.append((callback, args))
+
+    def get_alive(self):
+
+        return not self._reference() is None
+
+
+class EventManager():
+
+    validate_arguments = False
+
+    def __init__(self, scheduler=None):
+
+        self._events = {}
+
+        self._hooks = {}
+
+        self._count = 0
+
+        self._scheduler = scheduler
+
+        self._pending_events = {}
+
+        self._flush_scheduled = False
+
+        self._collected_hooks = []
+
+    def _validate_arguments(self, event, args):
+
+        for arg, argtype in zip(args, self._events[event]["argtypes"]):
+
+            if not isinstance(arg, argtype):
+
+                raise EventInvalidArgumentsError(arg)
+
+    def _raise_arguments_error(self, event, args):
+
+        if not event in self._events:
+
+            raise EventNotFoundError(event)
+
+        elif len(self._events[event]["argtypes"]) > len(args):
+
+            raise EventMissingArgumentsError(len(self._events[event]["argtypes"]) - len(args))
+
+        else:
+
+            raise EventUnexpectedArgumentsError(len(args) - len(self._events[event]["argtypes"]))
+
+    def _dispatch(self, event, hooks, args):
+
+        response = False
+
+        for hook in hooks:
+
+            if hook["active"]:
+
+                callback = hook["callback"] or hook["reference"]()
+
+                if not callback is None and callback(event, *args, *hook["args"]):
+
+                    response = True
+
+        return response
+
+    def _release_collected_hooks(self):
+
+        while len(self._collected_hooks):
+
+            id = self._collected_hooks.pop()
+
+            if id in self._hooks:
+
+                self.release(id)
+
+    def _on_hook_reference_collected(self, id):
+
+        self._collected_hooks.append(id)
+
+    def _on_scheduler_flush(self):
+
+        self._flush_scheduled = False
+
+        self.flush()
+
+        return False
+
+    def get_events(self):
+
+        return self._events.keys()
+
+    def get_hooks(self):
+
+        self._release_collected_hooks()
+
+        return self._hooks.keys()
+
+    def add(self, event, *argtypes, coalesce=False):
+
+        if not event in self._events:
+
+            for argtype in argtypes:
+
+                if not isinstance(type, type(argtype)):
+
+                    raise EventInvalidArgumentsError(argtypes)
+
+            else:
+
+                if coalesce and self._scheduler is None:
+
+                    raise EventSchedulerMissingError(event)
+
+                self._events[event] = {
+
+                    "argtypes": argtypes,
+
+                    "length": len(argtypes),
+
+                    "coalesce": coalesce,
+
+                    "hooks": ()
+
+                    }
+
+        else:
+
+            raise EventAlreadyExistingError(event)
+
+    def remove(self, event):
+
+        if event in self._events:
+
+            for hook in self._events[event]["hooks"]:
+
+                self.release(hook["id"])
+
+            self._pending_events.pop(event, None)
+
+            del self._events[event]
+
+        else:
+
+            raise EventNotFoundError(event)
+
+    def hook(self, event, callback, *args, weak=False):
+
+        self._release_collected_hooks()
+
+        if event in self._events:
+
+            if callable(callback) and (not weak or inspect.ismethod(callback)):
+
+                self._count += 1
+
+                id = self._count
+
+                hook = {
+
+                    "id": id,
+
+                    "callback": None if weak else callback,
+
+                    "reference": weakref.WeakMethod(callback, lambda reference: self._on_hook_reference_collected(id)) if weak else None,
+
+                    "args": args,
+
+                    "event": event,
+
+                    "active": True
+
+                    }
+
+                self._hooks[hook["id"]] = hook
+
+                self._events[event]["hooks"] += (hook,)
+
+                return hook["id"]
+
+            else:
+
+                raise EventCallbackInvalidError(callback)
+
+        else:
+
+            raise EventNotFoundError(event)
+
+    def release(self, id):
+
+        if id in self._hooks:
+
+            hook = self._hooks.pop(id)
+
+            hook["active"] = False
+
+            event = self._events[hook["event"]]
+
+            event["hooks"] = tuple(item for item in event["hooks"] if item["active"])
+
+        else:
+
+            raise EventHookInvalidError(id)
 
-                file.writelines("\n{}".format("\n".join(sys.argv[1:])))
+    def trigger(self, event, *args):
 
-            if exit:
+        try:
 
-                sys.exit(int(exit))
+            data = self._events[event]
 
-            else:
+        except KeyError:
 
-                raise error
+            raise EventNotFoundError(event) from None
 
-        else:
+        if not data["length"] == len(args):
 
-            self._lock_path = lock_path
+            self._raise_arguments_error(event, args)
 
-            self._argv_path = argv_path
+        if self.validate_arguments:
 
-            self._events = EventManager()
+            self._validate_arguments(event, args)
 
-            self._events.add("activate", list)
+        if len(self._collected_hooks):
 
-            self._path_inspector = PathInspector()
+            self._release_collected_hooks()
 
-            self._path_inspector.hook("created", self._on_path_inspector_created)
+        if data["coalesce"]:
 
-            self._path_inspector.hook("changed", self._on_path_inspector_changed)
+            self._pending_events[event] = args
 
-            self._initial_args = sys.argv[1:]
+            if not self._flush_scheduled:
 
-    def _on_path_inspector_created(self, event, path, timestamp):
+                self._flush_scheduled = True
 
-        self._parse_argv_file(path)
+                self._scheduler(self._on_scheduler_flush)
 
-    def _on_path_inspector_changed(self, event, path, timestamp):
+            return False
 
-        self._parse_argv_file(path)
+        return self._dispatch(event, data["hooks"], args)
 
-    def _parse_argv_file(self, path):
+    def flush(self):
 
-        if os.path.exists(path):
+        self._release_collected_hooks()
 
-            with open(path, "r") as file:
+        pending_events = self._pending_events
 
-                args = file.read().splitlines()
+        self._pending_events = {}
 
-                os.remove(path)
+        for event, args in pending_events.items():
 
-            self._trigger_argv_event(args)
+            if event in self._events:
 
-        else:
+                self._dispatch(event, self._events[event]["hooks"], args)
 
-            self._trigger_argv_event([])
 
-    def _trigger_argv_event(self, args):
+class LogLevelInvalidError(Exception):
 
-        args =  list(filter(None, args))
+    pass
 
-        self._events.trigger("activate", args)
 
-    def get_active(self):
+class LogManager():
 
-        return self._path_inspector.get_active()
+    def __init__(self, name, path=None, stream=None, level="info", capacity=1000, max_size=1048576, backup_count=2):
 
-    def set_active(self, value):
+        self._name = name
 
-        if value:
+        self._path = path
 
-            if len(self._initial_args):
+        self._stream = stream
 
-                self._trigger_argv_event(self._initial_args)
+        self._levels = {
 
-                self._initial_args.clear()
+            "debug": 10,
 
-            if not self._argv_path in self._path_inspector.get_paths():
+            "info": 20,
 
-                self._path_inspector.add(self._argv_path)
+            "warning": 30,
 
-                return
+            "error": 40
 
-        self._path_inspector.set_active(value)
+            }
 
-    def hook(self, event, callback):
+        self._level = self._get_level_value(level)
 
-        return self._events.hook(event, callback)
+        self._records = collections.deque(maxlen=capacity)
 
-    def release(self, id):
+        self._max_size = max_size
 
-        self._events.release(id)
+        self._backup_count = backup_count
 
+        self._queue = queue.SimpleQueue()
 
-class EventAlreadyExistingError(Exception):
+        self._lock = threading.Lock()
 
-    pass
+        self._thread = None
 
+    def _get_level_value(self, level):
 
-class EventNotFoundError(Exception):
+        if not level in self._levels:
 
-    pass
+            raise LogLevelInvalidError(level)
 
+        return self._levels[level]
 
-class EventCallbackInvalidError(Exception):
+    def _thread_target(self):
 
-    pass
+        while True:
 
+            record = self._queue.get()
 
-class EventHookInvalidError(Exception):
+            if record is None:
 
-    pass
+                break
 
+            path = self._path
 
-class EventInvalidArgumentsError(Exception):
+            if not self._stream is None:
 
-    pass
+                try:
 
+                    self._stream.write(f"{self.format(record)}\n")
 
-class EventUnexpectedArgumentsError(Exception):
+                    self._stream.flush()
 
-    pass
+                except (OSError, ValueError):
 
+                    pass
 
-class EventMissingArgumentsError(Exception):
+            if not path is None:
 
-    pass
+                try:
 
+                    self._write_file(path, json.dumps(record, default=str))
 
-class EventManager():
+                except OSError:
 
-    def __init__(self):
+                    pass
 
-        self._events = {}
+    def _write_file(self, path, line):
 
-        self._hooks = {}
+        data = f"{line}\n".encode("utf-8")
 
-        self._count = 0
+        try:
 
-    def get_events(self):
+            size = os.path.getsize(path)
 
-        return self._events.keys()
+        except FileNotFoundError:
 
-    def get_hooks(self):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
 
-        return self._hooks.keys()
+            size = 0
 
-    def add(self, event, *argtypes):
+        if size and size + len(data) > self._max_size:
 
-        if not event in self._events:
+            self._rotate_files(path)
 
-            for argtype in argtypes:
+        with open(path, "ab") as file:
 
-                if not isinstance(type, type(argtype)):
+            file.write(data)
 
-                    raise EventInvalidArgumentsError(argtypes)
+    def _rotate_files(self, path):
 
-            else:
+        for index in range(self._backup_count, 0, -1):
 
-                self._events[event] = {
+            source = path if index == 1 else f"{path}.{index - 1}"
 
-                    "argtypes": argtypes,
+            if os.path.exists(source):
 
-                    "hooks": []
+                os.replace(source, f"{path}.{index}")
 
-                    }
+        if os.path.exists(path):
 
-        else:
+            os.remove(path)
 
-            raise EventAlreadyExistingError(event)
+    def add(self, level, text, **fields):
 
-    def remove(self, event):
+        level_value = self._get_level_value(level)
 
-        if event in self._events:
+        record = {
 
-            for id in self._events[event]["hooks"]:
+            "time": time.time(),
 
-                self.release(id)
+            "level": level,
 
-            del self._events[event]
+            "text": str(text)
 
-        else:
+            }
 
-            raise EventNotFoundError(event)
+        record.update(fields)
 
-    def hook(self, event, callback, *args):
+        self._records.append(record)
 
-        if event in self._events:
+        if level_value >= self._level and (not self._stream is None or not self._path is None):
 
-            if callable(callback):
+            with self._lock:
 
-                self._count += 1
+                if self._thread is None:
 
-                id = str(self._count)
+                    self._thread = threading.Thread(target=self._thread_target, daemon=True)
 
-                self._hooks[id] = {
+                    self._thread.start()
 
-                    "callback": callback,
+            self._queue.put(record)
 
-                    "args": args,
+    def format(self, record):
 
-                    "event": event
+        text = "[{}][{}][{}] {}".format(
 
-                    }
+            self._name,
 
-                self._events[event]["hooks"].append(id)
+            time.strftime("%H:%M:%S", time.localtime(record["time"])),
 
-                return id
+            record["level"],
 
-            else:
+            record["text"]
 
-                raise EventCallbackInvalidError(callback)
+            )
 
-        else:
+        fields = [f"{key}={value}" for key, value in record.items() if not key in ("time", "level", "text")]
 
-            raise EventNotFoundError(event)
+        if len(fields):
 
-    def release(self, id):
+            text = "{} ({})".format(text, ", ".join(fields))
 
-        if id in self._hooks:
+        return text
 
-            event = self._hooks[id]["event"]
+    def get(self, level="debug"):
 
-            self._events[event]["hooks"].remove(id)
+        level_value = self._get_level_value(level)
 
-            del self._hooks[id]
+        return [record for record in list(self._records) if self._levels[record["level"]] >= level_value]
 
-        else:
+    def get_text(self, level="debug"):
 
-            raise EventHookInvalidError(id)
+        return "\n".join(self.format(record) for record in self.get(level))
 
-    def trigger(self, event, *args):
+    def get_level(self):
 
-        responses = []
+        for name, value in self._levels.items():
 
-        if event in self._events:
+            if value == self._level:
 
-            if len(self._events[event]["argtypes"]) == len(args):
+                return name
 
-                for n, arg in enumerate(args):
+    def set_level(self, level):
 
-                    if not isinstance(arg, self._events[event]["argtypes"][n]):
+        self._level = self._get_level_value(level)
 
-                        raise EventInvalidArgumentsError(arg)
+    def get_name(self):
 
-                else:
+        return self._name
 
-                    for id in self._events[event]["hooks"]:
+    def set_name(self, name):
 
-                        callback = self._hooks[id]["callback"]
+        self._name = name
 
-                        args += self._hooks[id]["args"]
+    def get_path(self):
 
-                        responses.append(bool(callback(event, *args)))
+        return self._path
 
-            elif len(self._events[event]["argtypes"]) > len(args):
+    def set_path(self, path):
 
-                value = len(self._events[event]["argtypes"]) - len(args)
+        self._path = path
 
-                raise EventMissingArgumentsError(value)
+    def close(self):
 
-            elif len(args) > len(self._events[event]["argtypes"]):
+        with self._lock:
 
-                value = len(args) - len(self._events[event]["argtypes"])
+            thread = self._thread
 
-                raise EventUnexpectedArgumentsError(value)
+            self._thread = None
 
-        else:
+        if not thread is None:
 
-            raise EventNotFoundError(event)
+            self._queue.put(None)
 
-        return True in responses
+            thread.join()
 
 
 class SettingNotFoundError(Exception):
@@ -741,3 +1814,283 @@ class LocaleManager():
 class PathNotAccessibleError(Exception):
 
     pass
+
+
+class ExecutableIndex():
+
+    def __init__(self, directories=(), delay=1.0):
+
+        self._directories = []
+
+        self._entries = {}
+
+        self._delay = delay
+
+        self._checked = 0
+
+        self._lock = threading.RLock()
+
+        self.set_directories(directories)
+
+    def _scan_directory(self, directory):
+
+        try:
+
+            timestamp = os.stat(directory).st_mtime_ns
+
+        except OSError:
+
+            self._entries[directory] = {"timestamp": None, "names": set()}
+
+            return
+
+        if not directory in self._entries or not self._entries[directory]["timestamp"] == timestamp:
+
+            names = set()
+
+            try:
+
+                with os.scandir(directory) as iterator:
+
+                    for entry in iterator:
+
+                        try:
+
+                            if entry.is_file() and os.access(entry.path, os.X_OK):
+
+                                names.add(entry.name)
+
+                        except OSError:
+
+                            pass
+
+            except OSError:
+
+                pass
+
+            self._entries[directory] = {"timestamp": timestamp, "names": names}
+
+    def _revalidate(self, force=False):
+
+        if force or time.monotonic() - self._checked > self._delay:
+
+            for directory in self._directories:
+
+                self._scan_directory(directory)
+
+            self._checked = time.monotonic()
+
+    def get_directories(self):
+
+        return list(self._directories)
+
+    def set_directories(self, directories):
+
+        with self._lock:
+
+            self._directories = []
+
+            for directory in directories:
+
+                if not directory in self._directories:
+
+                    self._directories.append(directory)
+
+            for directory in list(self._entries):
+
+                if not directory in self._directories:
+
+                    del self._entries[directory]
+
+            self._checked = 0
+
+    def get_path(self, name):
+
+        with self._lock:
+
+            self._revalidate()
+
+            for directory in self._directories:
+
+                if name in self._entries[directory]["names"]:
+
+                    return os.path.join(directory, name)
+
+    def get_command_path(self, command, path_converter=None, lookup_dir=None):
+
+        if os.path.sep in command:
+
+            path = command
+
+            if command.startswith(os.path.sep):
+
+                if not path_converter is None:
+
+                    path = path_converter(path)
+
+            elif not lookup_dir is None:
+
+                path = os.path.join(lookup_dir, path)
+
+            if os.access(path, os.X_OK) and os.path.isfile(path):
+
+                return path
+
+        elif len(command):
+
+            path = self.get_path(command)
+
+            if not path is None:
+
+                return path
+
+            elif not lookup_dir is None:
+
+                path = os.path.join(lookup_dir, command)
+
+                if os.access(path, os.X_OK) and os.path.isfile(path):
+
+                    return path
+
+    def get_names(self):
+
+        with self._lock:
+
+            self._revalidate()
+
+            names = set()
+
+            for directory in self._directories:
+
+                names.update(self._entries[directory]["names"])
+
+            return names
+
+    def update(self):
+
+        with self._lock:
+
+            self._revalidate(force=True)
+
+
+class CommandCompleter():
+
+    def __init__(self, executable_index, path_converter=None):
+
+        self._executable_index = executable_index
+
+        self._path_converter = path_converter
+
+        self._names = []
+
+        self._directories = {}
+
+        self._lock = threading.Lock()
+
+        self._thread = None
+
+    def _thread_target(self):
+
+        names = sorted(self._executable_index.get_names())
+
+        with self._lock:
+
+            self._names = names
+
+            self._thread = None
+
+    def _get_directory_entries(self, directory):
+
+        if not self._path_converter is None:
+
+            path = self._path_converter(directory)
+
+        else:
+
+            path = directory
+
+        try:
+
+            timestamp = os.stat(path).st_mtime_ns
+
+        except OSError:
+
+            return []
+
+        if not directory in self._directories or not self._directories[directory]["timestamp"] == timestamp:
+
+            entries = []
+
+            try:
+
+                with os.scandir(path) as iterator:
+
+                    for entry in iterator:
+
+                        try:
+
+                            if entry.is_dir():
+
+                                entries.append(entry.name + os.path.sep)
+
+                            elif entry.is_file() and os.access(entry.path, os.X_OK):
+
+                                entries.append(entry.name)
+
+                        except OSError:
+
+                            pass
+
+            except OSError:
+
+                pass
+
+            self._directories[directory] = {"timestamp": timestamp, "entries": sorted(entries)}
+
+        return self._directories[directory]["entries"]
+
+    def _get_prefix_matches(self, names, prefix, limit):
+
+        matches = []
+
+        for index in range(bisect.bisect_left(names, prefix), len(names)):
+
+            if len(matches) >= limit or not names[index].startswith(prefix):
+
+                break
+
+            matches.append(names[index])
+
+        return matches
+
+    def get_completions(self, prefix, limit=10):
+
+        if prefix.startswith(os.path.sep):
+
+            directory, name = os.path.split(prefix)
+
+            entries = self._get_directory_entries(directory)
+
+            return [os.path.join(directory, entry) for entry in self._get_prefix_matches(entries, name, limit)]
+
+        elif len(prefix) and not os.path.sep in prefix:
+
+            with self._lock:
+
+                names = self._names
+
+            return self._get_prefix_matches(names, prefix, limit)
+
+        else:
+
+            return []
+
+    def update(self):
+
+        with self._lock:
+
+            if self._thread is None:
+
+                self._thread = threading.Thread(target=self._thread_target, daemon=True)
+
+                self._thread.start()
@@ -0,0 +1,1986 @@
+#!/usr/bin/python3
+
+# Copyright (C) 2022 Free Software Foundation, Inc.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+
+import os, time, shutil, tempfile, fnmatch, threading, subprocess, json, heapq
+
+from configparser import ConfigParser, Error as ConfigParserError
+
+from concurrent.futures import ThreadPoolExecutor
+
+from modules import basic
+
+
+class DesktopParser():
+
+    def __init__(self, app, load_path, save_path, mtime=None):
+
+        self._application = app
+
+        self._config_parser = ConfigParser(interpolation=None, strict=False)
+
+        self._config_parser.optionxform = str
+
+        system_locale = os.getenv("LANG") or "C"
+
+        self._system_locale_names = [
+
+            system_locale.split(".")[0].split("_")[0],
+
+            system_locale.split(".")[0],
+
+            system_locale
+
+            ]
+
+        self._load_path = load_path
+
+        self._save_path = save_path
+
+        self._saved_data = None
+
+        self._saved_mtime = None
+
+        self.load(mtime=mtime)
+
+    def _get_action_from_section(self, section):
+
+        return section[len("Desktop Action "):]
+
+    def _get_section_from_action(self, action):
+
+        return "Desktop Action %s" % action
+
+    def _get_mtime(self, path):
+
+        try:
+
+            return os.path.getmtime(path)
+
+        except OSError:
+
+            return None
+
+    def _update_saved_data(self, path, mtime=None):
+
+        self._saved_data = self.get_data()
+
+        if mtime is None:
+
+            self._saved_mtime = self._get_mtime(path)
+
+        else:
+
+            self._saved_mtime = mtime
+
+    def _get_str(self, key, section="Desktop Entry", localized=False, value=""):
+
+        if self._config_parser.has_section(section):
+
+            if localized:
+
+               for locale in self._system_locale_names:
+
+                    localized_key = "%s[%s]" % (key, locale)
+
+                    if self._config_parser.has_option(section, localized_key):
+
+                        return self._config_parser.get(section, localized_key)
+
+            if self._config_parser.has_option(section, key):
+
+                return self._config_parser.get(section, key)
+
+        return value
+
+    def _get_bool(self, key, section="Desktop Entry"):
+
+        if self._config_parser.has_section(section):
+
+            if self._config_parser.has_option(section, key):
+
+                try:
+
+                    return self._config_parser.getboolean(section, key)
+
+                except ValueError as error:
+
+                    self._application.log(error, error=error, path=self._load_path, key=key)
+
+                    return False
+
+            else:
+
+                return False
+
+        else:
+
+            return False
+
+    def _set(self, key, value, section="Desktop Entry", localized=False):
+
+        if isinstance(value, bool):
+
+            if value:
+
+                value = "true"
+
+            else:
+
+                value = "false"
+
+        if len(value):
+
+            self._config_parser.set(section, key, value)
+
+            if localized:
+
+                for locale in self._system_locale_names:
+
+                    localized_key = "%s[%s]" % (key, locale)
+
+                    self._config_parser.set(section, localized_key, value)
+
+        else:
+
+            if self._config_parser.has_option(section, key):
+
+                self._config_parser.remove_option(section, key)
+
+            if localized:
+
+                for locale in self._system_locale_names:
+
+                    localized_key = "%s[%s]" % (key, locale)
+
+                    if self._config_parser.has_option(section, localized_key):
+
+                        self._config_parser.remove_option(section, localized_key)
+
+    def get_action_name(self, action):
+
+        return self.get_name(section=self._get_section_from_action(action))
+
+    def set_action_name(self, action, name):
+
+        self.set_name(name, section=self._get_section_from_action(action))
+
+    def get_action_command(self, action):
+
+        return self.get_command(section=self._get_section_from_action(action))
+
+    def set_action_command(self, action, command):
+
+        self.set_command(command, section=self._get_section_from_action(action))
+
+    def get_name(self, section="Desktop Entry"):
+
+        return self._get_str("Name", section=section, localized=True)
+
+    def set_name(self, name, section="Desktop Entry"):
+
+        self._set("Name", name, section=section, localized=True)
+
+    def get_comment(self, section="Desktop Entry"):
+
+        return self._get_str("Comment", section=section, localized=True)
+
+    def set_comment(self, comment, section="Desktop Entry"):
+
+        self._set("Comment", comment, section=section, localized=True)
+
+    def get_keywords(self, section="Desktop Entry"):
+
+        return self._get_str("Keywords", section=section, localized=True)
+
+    def set_keywords(self, comment, section="Desktop Entry"):
+
+        self._set("Keywords", comment, section=section, localized=True)
+
+    def get_categories(self, section="Desktop Entry"):
+
+        return self._get_str("Categories", section=section)
+
+    def set_categories(self, comment, section="Desktop Entry"):
+
+        self._set("Categories", comment, section=section)
+
+    def get_icon(self, section="Desktop Entry"):
+
+        return self._get_str("Icon", section=section)
+
+    def set_icon(self, icon, section="Desktop Entry"):
+
+        self._set("Icon", icon, section=section)
+
+    def get_command(self, section="Desktop Entry"):
+
+        return self._get_str("Exec", section=section)
+
+    def set_command(self, command, section="Desktop Entry"):
+
+        self._set("Exec", command, section=section)
+
+    def get_disabled(self, section="Desktop Entry"):
+
+        return self._get_bool("Hidden", section=section)
+
+    def set_disabled(self, value, section="Desktop Entry"):
+
+        self._set("Hidden", value, section=section)
+
+    def get_hidden(self, section="Desktop Entry"):
+
+        return self._get_bool("NoDisplay", section=section)
+
+    def set_hidden(self, value, section="Desktop Entry"):
+
+        self._set("NoDisplay", value, section=section)
+
+    def get_visible(self, section="Desktop Entry"):
+
+        return not self.get_hidden() and not self.get_disabled()
+
+    def set_visible(self, value, section="Desktop Entry"):
+
+        if value:
+
+            self.set_disabled(False)
+
+            self.set_hidden(False)
+
+        else:
+
+            self.set_hidden(True)
+
+    def get_notify(self, section="Desktop Entry"):
+
+        return self._get_bool("StartupNotify", section=section)
+
+    def set_notify(self, value, section="Desktop Entry"):
+
+        self._set("StartupNotify", value, section=section)
+
+    def get_terminal(self, section="Desktop Entry"):
+
+        return self._get_bool("Terminal", section=section)
+
+    def set_terminal(self, value, section="Desktop Entry"):
+
+        self._set("Terminal", value, section=section)
+
+    def get_mimetypes(self):
+
+        if self._config_parser.has_option("Desktop Entry", "MimeType"):
+
+            return list(filter(None, self._config_parser.get("Desktop Entry", "MimeType").split(";")))
+
+        else:
+
+            return []
+
+    def set_mimetypes(self, mimetypes):
+
+        self._set("MimeType", f"{';'.join(mimetypes)}{bool(len(mimetypes))*';'}")
+
+    def get_load_path(self):
+
+        return self._load_path
+
+    def set_load_path(self, path):
+
+        self._load_path = path
+
+    def get_save_path(self):
+
+        return self._save_path
+
+    def set_save_path(self, path):
+
+        if not path == self._save_path:
+
+            self._saved_data = None
+
+            self._saved_mtime = None
+
+        self._save_path = path
+
+    def get_search_data(self):
+
+        data = []
+
+        data.append(self.get_name())
+
+        data.append(self.get_icon())
+
+        data.append(self.get_command())
+
+        data.append(self.get_keywords())
+
+        data.append(self.get_categories())
+
+        data.append(self._get_str("MimeType"))
+
+        data.append(os.path.basename(self._load_path))
+
+        return list(filter(None, data))
+
+    def get_actions(self):
+
+        actions = []
+
+        for section in self._config_parser.sections():
+
+            if section.startswith("Desktop Action "):
+
+                actions.append(self._get_action_from_section(section))
+
+        return actions
+
+    def add_action(self, action):
+
+        section = self._get_section_from_action(action)
+
+        if not self._config_parser.has_section(section):
+
+            self._config_parser.add_section(section)
+
+    def remove_action(self, action):
+
+        self._config_parser.remove_section(self._get_section_from_action(action))
+
+    def check_read(self, path=None):
+
+        if path is None:
+
+            path = self._load_path
+
+        if not os.access(path, os.R_OK):
+
+            raise OSError(f"no access: {path}")
+
+    def check_write(self, path=None):
+
+        if path is None:
+
+            path = self._save_path
+
+        while not path == os.path.abspath(os.sep):
+
+            if not os.path.exists(path):
+
+                path = os.path.dirname(path)
+
+            elif not os.access(path, os.W_OK):
+
+                raise OSError(f"no access: {path}")
+
+            else:
+
+                break
+
+    def get_data(self):
+
+        data = {}
+
+        for section in self._config_parser.sections():
+
+            data[section] = dict(self._config_parser.items(section, raw=True))
+
+        return data
+
+    def get_changed(self):
+
+        if self._saved_data is None or not self._saved_mtime == self._get_mtime(self._save_path):
+
+            return True
+
+        else:
+
+            return not self.get_data() == self._saved_data
+
+    def get_changed_keys(self, section="Desktop Entry"):
+
+        data = self.get_data()
+
+        if self._saved_data is None or not self._saved_mtime == self._get_mtime(self._save_path):
+
+            old_items = {}
+
+        elif section in self._saved_data:
+
+            old_items = self._saved_data[section]
+
+        else:
+
+            old_items = {}
+
+        if section in data:
+
+            new_items = data[section]
+
+        else:
+
+            new_items = {}
+
+        keys = []
+
+        for key in list(old_items) + list(new_items):
+
+            if not key in keys and not old_items.get(key) == new_items.get(key):
+
+                keys.append(key)
+
+        return keys
+
+    def load(self, path=None, mtime=None):
+
+        self.check_read(path=path)
+
+        if path is None:
+
+            path = self._load_path
+
+        self._config_parser.clear()
+
+        self._config_parser.read(path)
+
+        if os.path.abspath(path) == os.path.abspath(self._save_path):
+
+            self._update_saved_data(path, mtime=mtime)
+
+    def save(self, path=None):
+
+        actions = self.get_actions()
+
+        self._set("Actions", f"{';'.join(actions)}{bool(len(actions))*';'}")
+
+        if path is None:
+
+            path = self._save_path
+
+            if not self.get_changed():
+
+                return False
+
+        self.check_write(path=path)
+
+        if not os.path.exists(path):
+
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+        else:
+
+            os.remove(path)
+
+        with open(path, "w") as file:
+
+            self._config_parser.write(file, space_around_delimiters=False)
+
+        if os.path.abspath(path) == os.path.abspath(self._save_path):
+
+            self._update_saved_data(path)
+
+        return True
+
+
+class ExecInvalidError(Exception):
+
+    pass
+
+
+class ExecParser():
+
+    def __init__(self, flatpak_bin_dirs=(), cache_size=256):
+
+        self._flatpak_bin_dirs = list(flatpak_bin_dirs)
+
+        self._cache_size = cache_size
+
+        self._programs = {}
+
+        self._programs_lock = threading.Lock()
+
+        self._string_escapes = {"s": " ", "n": "\n", "t": "\t", "r": "\r", "\\": "\\"}
+
+        self._field_codes = ["%f", "%F", "%u", "%U", "%i", "%c", "%k", "%d", "%D", "%n", "%N", "%v", "%m"]
+
+        self._env_value_options = ["-u", "--unset", "-C", "--chdir"]
+
+        self._env_split_options = ["-S", "--split-string"]
+
+    def _unescape(self, text):
+
+        chars, index = [], 0
+
+        while index < len(text):
+
+            if text[index] == "\\" and index + 1 < len(text) and text[index + 1] in self._string_escapes:
+
+                chars.append(self._string_escapes[text[index + 1]])
+
+                index += 2
+
+            else:
+
+                chars.append(text[index])
+
+                index += 1
+
+        return "".join(chars)
+
+    def _iter_tokens(self, text):
+
+        chars, quoted, escaped, started = [], False, False, False
+
+        for char in text:
+
+            if escaped:
+
+                chars.append(char)
+
+                escaped = False
+
+            elif char == "\\":
+
+                escaped, started = True, True
+
+            elif char == '"':
+
+                quoted, started = not quoted, True
+
+            elif char in " \t\n" and not quoted:
+
+                if started:
+
+                    yield "".join(chars)
+
+                    chars, started = [], False
+
+            else:
+
+                chars.append(char)
+
+                started = True
+
+        if quoted or escaped:
+
+            raise ExecInvalidError(text)
+
+        elif started:
+
+            yield "".join(chars)
+
+    def _iter_arguments(self, text):
+
+        for token in self._iter_tokens(text):
+
+            if not token in self._field_codes:
+
+                yield token.replace("%%", "%")
+
+    def _resolve_program(self, program, arguments):
+
+        name = os.path.basename(program)
+
+        if name == "env":
+
+            for argument in arguments:
+
+                if argument in self._env_value_options:
+
+                    next(arguments, None)
+
+                elif argument in self._env_split_options:
+
+                    arguments = self._iter_arguments(next(arguments, ""))
+
+                    return self._resolve_program(next(arguments, program), arguments)
+
+                elif not argument.startswith("-") and not "=" in argument:
+
+                    return self._resolve_program(argument, arguments)
+
+        elif name == "flatpak" and next(arguments, None) == "run":
+
+            for argument in arguments:
+
+                if not argument.startswith("-"):
+
+                    return (program, argument.split("/")[0])
+
+        return (program, None)
+
+    def _get_flatpak_app_path(self, app_id):
+
+        for directory in self._flatpak_bin_dirs:
+
+            path = os.path.join(directory, app_id)
+
+            if os.path.exists(path):
+
+                return path
+
+        else:
+
+            return os.path.join(self._flatpak_bin_dirs[0], app_id)
+
+    def get_flatpak_bin_dirs(self):
+
+        return list(self._flatpak_bin_dirs)
+
+    def get_tokens(self, text):
+
+        return list(self._iter_tokens(self._unescape(text)))
+
+    def get_arguments(self, text):
+
+        return list(self._iter_arguments(self._unescape(text)))
+
+    def get_program(self, text):
+
+        with self._programs_lock:
+
+            program = self._programs.get(text, False)
+
+        if program is False:
+
+            arguments = self._iter_arguments(self._unescape(text))
+
+            program = next(arguments, None)
+
+            if not program is None:
+
+                program = self._resolve_program(program, arguments)
+
+            with self._programs_lock:
+
+                if len(self._programs) >= self._cache_size:
+
+                    del self._programs[next(iter(self._programs))]
+
+                self._programs[text] = program
+
+        if program is None:
+
+            return None
+
+        elif program[1] is None or not len(self._flatpak_bin_dirs):
+
+            return program[0]
+
+        else:
+
+            return self._get_flatpak_app_path(program[1])
+
+
+class MimeSectionNotFoundError(Exception):
+
+    pass
+
+
+class MimeInfoManager():
+
+    def __init__(self, paths):
+
+        self._paths = {}
+
+        self._parsers = {}
+
+        self._names = {}
+
+        self._timestamps = {}
+
+        self._outdated_sections = set()
+
+        self._unsaved_sections = set()
+
+        self._events = basic.EventManager()
+
+        self._events.add("changed", str, str)
+
+        self._path_inspector = basic.PathInspector()
+
+        self._path_inspector.hook("changed", self._on_path_inspector_changed)
+
+        self._path_inspector.hook("created", self._on_path_inspector_changed)
+
+        self._path_inspector.hook("deleted", self._on_path_inspector_changed)
+
+        for section in paths:
+
+            self._paths[section] = list(paths[section])
+
+            self._outdated_sections.add(section)
+
+    def _on_path_inspector_changed(self, event, path, timestamp):
+
+        if not self._timestamps.get(path) == self._get_timestamp(path):
+
+            for section in self._paths:
+
+                if path in self._paths[section]:
+
+                    self._outdated_sections.add(section)
+
+    def _get_timestamp(self, path):
+
+        try:
+
+            return os.path.getmtime(path)
+
+        except OSError:
+
+            return 0
+
+    def _split_names(self, text):
+
+        return list(filter(None, text.split(";")))
+
+    def _join_names(self, names):
+
+        return f"{';'.join(names)};"
+
+    def _load_section(self, section):
+
+        mime_parser = ConfigParser(interpolation=None, strict=False)
+
+        mime_parser.optionxform = str
+
+        for path in self._paths[section]:
+
+            if os.access(path, os.R_OK):
+
+                mime_parser.read(path)
+
+            self._timestamps[path] = self._get_timestamp(path)
+
+        if not mime_parser.has_section(section):
+
+            mime_parser.add_section(section)
+
+        names = {}
+
+        for mimetype, text in mime_parser.items(section, raw=True):
+
+            for name in self._split_names(text):
+
+                if not name in names:
+
+                    names[name] = set()
+
+                names[name].add(mimetype)
+
+        self._parsers[section] = mime_parser
+
+        self._names[section] = names
+
+        self._outdated_sections.discard(section)
+
+    def _get_parser(self, section):
+
+        if not section in self._paths:
+
+            raise MimeSectionNotFoundError(section)
+
+        if section in self._outdated_sections and not section in self._unsaved_sections:
+
+            self._load_section(section)
+
+        return self._parsers[section]
+
+    def _write_file(self, path, mime_parser):
+
+        path = os.path.realpath(path)
+
+        directory = os.path.dirname(path)
+
+        os.makedirs(directory, exist_ok=True)
+
+        try:
+
+            descriptor, temp_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", dir=directory)
+
+        except OSError:
+
+            # the sandbox may only expose the file itself and not its parent directory
+
+            with open(path, "w") as file:
+
+                mime_parser.write(file, space_around_delimiters=False)
+
+        else:
+
+            try:
+
+                with os.fdopen(descriptor, "w") as file:
+
+                    mime_parser.write(file, space_around_delimiters=False)
+
+                if os.path.exists(path):
+
+                    shutil.copymode(path, temp_path)
+
+                else:
+
+                    os.chmod(temp_path, 0o644)
+
+                os.replace(temp_path, path)
+
+            except OSError:
+
+                if os.path.exists(temp_path):
+
+                    os.remove(temp_path)
+
+                with open(path, "w") as file:
+
+                    mime_parser.write(file, space_around_delimiters=False)
+
+    def _save_section(self, section):
+
+        for path in self._paths[section]:
+
+            self._write_file(path, self._parsers[section])
+
+            self._timestamps[path] = self._get_timestamp(path)
+
+        self._unsaved_sections.discard(section)
+
+        self._outdated_sections.discard(section)
+
+    def get_sections(self):
+
+        return list(self._paths.keys())
+
+    def get_paths(self, section):
+
+        if section in self._paths:
+
+            return list(self._paths[section])
+
+        else:
+
+            raise MimeSectionNotFoundError(section)
+
+    def get_names(self, mimetype, section):
+
+        mime_parser = self._get_parser(section)
+
+        if mime_parser.has_option(section, mimetype):
+
+            return self._split_names(mime_parser.get(section, mimetype, raw=True))
+
+        else:
+
+            return []
+
+    def get_mimetypes(self, name, section):
+
+        self._get_parser(section)
+
+        if name in self._names[section]:
+
+            return sorted(self._names[section][name])
+
+        else:
+
+            return []
+
+    def update(self, name, mimetypes, delete=False, save=True):
+
+        changed_sections = []
+
+        for section in self._paths:
+
+            mime_parser = self._get_parser(section)
+
+            old_mimetypes = self._names[section].get(name, set())
+
+            if delete:
+
+                new_mimetypes = set()
+
+            else:
+
+                new_mimetypes = set(mimetypes)
+
+            if old_mimetypes == new_mimetypes:
+
+                continue
+
+            for mimetype in old_mimetypes - new_mimetypes:
+
+                if not mime_parser.has_option(section, mimetype):
+
+                    continue
+
+                names = [item for item in self._split_names(mime_parser.get(section, mimetype, raw=True)) if not item == name]
+
+                if len(names):
+
+                    mime_parser.set(section, mimetype, self._join_names(names))
+
+                else:
+
+                    mime_parser.remove_option(section, mimetype)
+
+            for mimetype in new_mimetypes - old_mimetypes:
+
+                if mime_parser.has_option(section, mimetype):
+
+                    names = self._split_names(mime_parser.get(section, mimetype, raw=True))
+
+                else:
+
+                    names = []
+
+                if not name in names:
+
+                    names.append(name)
+
+                mime_parser.set(section, mimetype, self._join_names(names))
+
+            if len(new_mimetypes):
+
+                self._names[section][name] = new_mimetypes
+
+            elif name in self._names[section]:
+
+                del self._names[section][name]
+
+            if save:
+
+                self._save_section(section)
+
+            else:
+
+                self._unsaved_sections.add(section)
+
+            changed_sections.append(section)
+
+            self._events.trigger("changed", section, name)
+
+        return changed_sections
+
+    def load(self):
+
+        for section in self._paths:
+
+            self._load_section(section)
+
+    def save(self):
+
+        for section in list(self._unsaved_sections):
+
+            self._save_section(section)
+
+    def get_active(self):
+
+        return self._path_inspector.get_active()
+
+    def set_active(self, value):
+
+        if value:
+
+            for section in self._paths:
+
+                for path in self._paths[section]:
+
+                    if not path in self._path_inspector.get_paths():
+
+                        self._path_inspector.add(path)
+
+        else:
+
+            self._path_inspector.set_active(False)
+
+    def hook(self, event, callback, *args):
+
+        return self._events.hook(event, callback, *args)
+
+    def release(self, id):
+
+        self._events.release(id)
+
+
+class MimeTypeIndex():
+
+    def __init__(self):
+
+        self._names = {}
+
+        self._mimetypes = {}
+
+    def _normalize(self, mimetype):
+
+        return mimetype.strip().lower()
+
+    def get_mimetypes(self, name=None):
+
+        if name is None:
+
+            return sorted(self._names.keys())
+
+        elif name in self._mimetypes:
+
+            return list(self._mimetypes[name])
+
+        else:
+
+            return []
+
+    def get_names(self, pattern):
+
+        pattern = self._normalize(pattern)
+
+        if True in [character in pattern for character in "*?["]:
+
+            names = set()
+
+            for mimetype in fnmatch.filter(self._names.keys(), pattern):
+
+                names.update(self._names[mimetype])
+
+            return sorted(names)
+
+        elif pattern in self._names:
+
+            return sorted(self._names[pattern])
+
+        else:
+
+            return []
+
+    def update(self, name, mimetypes):
+
+        old_mimetypes = set(self._mimetypes.get(name, ()))
+
+        new_mimetypes = set([self._normalize(mimetype) for mimetype in mimetypes])
+
+        for mimetype in old_mimetypes - new_mimetypes:
+
+            self._names[mimetype].discard(name)
+
+            if not len(self._names[mimetype]):
+
+                del self._names[mimetype]
+
+        for mimetype in new_mimetypes - old_mimetypes:
+
+            if not mimetype in self._names:
+
+                self._names[mimetype] = set()
+
+            self._names[mimetype].add(name)
+
+        if len(new_mimetypes):
+
+            self._mimetypes[name] = tuple(sorted(new_mimetypes))
+
+        elif name in self._mimetypes:
+
+            del self._mimetypes[name]
+
+    def clear(self):
+
+        self._names.clear()
+
+        self._mimetypes.clear()
+
+
+class SystemPaths():
+
+    def __init__(self, flatpak=None, environment=None):
+
+        if flatpak is None:
+
+            flatpak = os.getenv("APP_RUNNING_AS_FLATPAK") == "true"
+
+        self._flatpak = flatpak
+
+        self._environment = dict(os.environ if environment is None else environment)
+
+        self._host_environment = None
+
+        self._host_prefix = os.path.join(os.path.sep, "run", "host")
+
+        self._host_environment_command = ["flatpak-spawn", "--host", "env", "-0"]
+
+        self._sandbox_dirs = {}
+
+        self._sandbox_dirs_delay = 2.0
+
+        self._sandbox_dirs_lock = threading.Lock()
+
+        self._update()
+
+    def _join_path_prefix(self, *paths):
+
+        names = [""]
+
+        for path in paths:
+
+            names.append(os.path.sep.join(list(filter(None, path.split(os.path.sep)))))
+
+        return os.path.sep.join(names)
+
+    def _split_variable(self, variable):
+
+        value = self.get_host_variable(variable)
+
+        if value is None:
+
+            return []
+
+        else:
+
+            return list(filter(None, value.split(":")))
+
+    def _expand_home(self, path, home_dir):
+
+        if path.startswith("~"):
+
+            return self._join_path_prefix(home_dir, path[1:])
+
+        else:
+
+            return path
+
+    def _get_host_dirs(self, variable):
+
+        dirs = []
+
+        for path in self._split_variable(variable):
+
+            path = self._expand_home(path, self._real_home)
+
+            if path.startswith(self._real_home) and not path in dirs:
+
+                dirs.append(path)
+
+            path = self._join_path_prefix(self._host_prefix, path)
+
+            if not path in dirs:
+
+                dirs.append(path)
+
+        return dirs
+
+    def _update(self):
+
+        self._home_dir = self._environment.get("HOME") or os.path.expanduser("~")
+
+        self._user_data_dir = self._environment.get("XDG_DATA_HOME") or os.path.join(self._home_dir, ".local", "share")
+
+        self._user_config_dir = self._environment.get("XDG_CONFIG_HOME") or os.path.join(self._home_dir, ".config")
+
+        self._user_cache_dir = self._environment.get("XDG_CACHE_HOME") or os.path.join(self._home_dir, ".cache")
+
+        self._system_data_dirs = [
+
+            os.path.join(self._user_data_dir, "flatpak", "exports", "share"),
+
+            os.path.join(os.path.sep, "var", "lib", "flatpak", "exports", "share"),
+
+            os.path.join(os.path.sep, "var", "lib", "snapd", "desktop")
+
+            ]
+
+        if self._flatpak:
+
+            if not self.get_host_variable("HOME") is None:
+
+                self._real_home = os.path.abspath(self.get_host_variable("HOME"))
+
+            elif self._environment.get("USER"):
+
+                self._real_home = os.path.join(os.path.sep, "home", self._environment["USER"])
+
+            else:
+
+                self._real_home = self._home_dir
+
+            self._system_data_dirs.append(self._join_path_prefix(self._host_prefix, "usr", "local", "share"))
+
+            self._system_data_dirs.append(self._join_path_prefix(self._host_prefix, "usr", "share"))
+
+            for path in self._get_host_dirs("XDG_DATA_DIRS"):
+
+                if not path in self._system_data_dirs:
+
+                    self._system_data_dirs.append(path)
+
+            self._icon_search_dirs = [
+
+                self._join_path_prefix(self._host_prefix, self._real_home, ".local", "share", "icons"),
+
+                self._join_path_prefix(self._host_prefix, self._real_home, ".local", "share", "pixmaps"),
+
+                self._join_path_prefix(self._host_prefix, self._real_home, ".icons"),
+
+                self._join_path_prefix(self._host_prefix, self._real_home, ".pixmaps")
+
+                ]
+
+            self._command_dirs = self._get_host_dirs("PATH")
+
+            self._command_lookup_cwd = self._real_home
+
+        else:
+
+            self._real_home = None
+
+            self._system_data_dirs.append(os.path.join(os.path.sep, "usr", "local", "share"))
+
+            self._system_data_dirs.append(os.path.join(os.path.sep, "usr", "share"))
+
+            for path in self._split_variable("XDG_DATA_DIRS"):
+
+                path = self._expand_home(path, self._home_dir)
+
+                if not path in self._system_data_dirs:
+
+                    self._system_data_dirs.append(path)
+
+            self._icon_search_dirs = [
+
+                os.path.join(self._user_data_dir, "icons"),
+
+                os.path.join(self._user_data_dir, "pixmaps"),
+
+                os.path.join(self._home_dir, ".icons"),
+
+                os.path.join(self._home_dir, ".pixmaps")
+
+                ]
+
+            self._command_dirs = []
+
+            for path in self._split_variable("PATH"):
+
+                path = self._expand_home(path, self._home_dir)
+
+                if not path in self._command_dirs:
+
+                    self._command_dirs.append(path)
+
+            self._command_lookup_cwd = self._home_dir
+
+        for path in self._system_data_dirs:
+
+            self._icon_search_dirs.append(os.path.join(path, "icons"))
+
+            self._icon_search_dirs.append(os.path.join(path, "pixmaps"))
+
+        self._flatpak_bin_dirs = [
+
+            os.path.join(os.path.dirname(path), "bin") for path in self._system_data_dirs
+
+            if path.endswith(os.path.join("flatpak", "exports", "share"))
+
+            ]
+
+    def _get_host_path(self, path):
+
+        target = path
+
+        while True:
+
+            if os.path.islink(target):
+
+                target = os.path.realpath(path)
+
+            test = self._join_path_prefix(self._host_prefix, target)
+
+            if os.path.exists(test):
+
+                return test
+
+            elif os.path.islink(test):
+
+                target = os.path.realpath(test)
+
+            else:
+
+                return None
+
+    def _get_sandbox_dirs(self, directory):
+
+        with self._sandbox_dirs_lock:
+
+            if (not directory in self._sandbox_dirs or not len(self._sandbox_dirs[directory]["dirs"]) and
+                time.monotonic() - self._sandbox_dirs[directory]["timestamp"] > self._sandbox_dirs_delay):
+
+                dirs = []
+
+                if os.path.isdir(directory):
+
+                    dirs.append(directory)
+
+                host_directory = self._get_host_path(directory)
+
+                if not host_directory is None and not host_directory in dirs and os.path.isdir(host_directory):
+
+                    dirs.append(host_directory)
+
+                self._sandbox_dirs[directory] = {"timestamp": time.monotonic(), "dirs": dirs}
+
+            return self._sandbox_dirs[directory]["dirs"]
+
+    def get_flatpak(self):
+
+        return self._flatpak
+
+    def get_home_dir(self):
+
+        return self._home_dir
+
+    def get_real_home(self):
+
+        return self._real_home
+
+    def get_user_data_dir(self):
+
+        return self._user_data_dir
+
+    def get_user_config_dir(self):
+
+        return self._user_config_dir
+
+    def get_user_cache_dir(self):
+
+        return self._user_cache_dir
+
+    def get_system_data_dirs(self):
+
+        return list(self._system_data_dirs)
+
+    def get_icon_search_dirs(self):
+
+        return list(self._icon_search_dirs)
+
+    def get_command_dirs(self):
+
+        return list(self._command_dirs)
+
+    def get_command_lookup_cwd(self):
+
+        return self._command_lookup_cwd
+
+    def get_flatpak_bin_dirs(self):
+
+        return list(self._flatpak_bin_dirs)
+
+    def get_starter_override_dir(self):
+
+        return os.path.join(self._user_data_dir, "applications")
+
+    def get_mimeinfo_paths(self):
+
+        return {
+
+            "MIME Cache": [
+
+                os.path.join(self.get_starter_override_dir(), "mimeinfo.cache")
+
+                ],
+
+            "Added Associations": [
+
+                os.path.join(self._user_config_dir, "mimeapps.list")
+
+                ]
+
+            }
+
+    def get_path_converter(self):
+
+        if self._flatpak:
+
+            return self.get_sandbox_path
+
+        else:
+
+            return None
+
+    def get_host_environment_command(self):
+
+        return list(self._host_environment_command)
+
+    def parse_host_environment(self, data):
+
+        environment = {}
+
+        for item in data.decode(errors="replace").split("\0"):
+
+            if "=" in item:
+
+                key, value = item.split("=", 1)
+
+                environment[key] = value
+
+        return environment
+
+    def load_host_environment(self):
+
+        try:
+
+            process = subprocess.run(self._host_environment_command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+
+        except OSError:
+
+            self.set_host_environment({})
+
+        else:
+
+            if not process.returncode:
+
+                self.set_host_environment(self.parse_host_environment(process.stdout))
+
+            else:
+
+                self.set_host_environment({})
+
+    def get_host_environment(self):
+
+        if self._host_environment is None:
+
+            return None
+
+        else:
+
+            return dict(self._host_environment)
+
+    def set_host_environment(self, environment):
+
+        self._host_environment = dict(environment)
+
+        self._update()
+
+    def get_host_variable(self, variable):
+
+        if self._flatpak:
+
+            value = (self._host_environment or {}).get(variable, "").split("\n")[0]
+
+        else:
+
+            value = self._environment.get(variable, "")
+
+        if len(value):
+
+            return value
+
+    def get_host_system_path(self, path):
+
+        if path.startswith(self._host_prefix):
+
+            return os.path.join(os.path.sep, path[len(self._host_prefix):])
+
+        else:
+
+            return path
+
+    def get_sandbox_path(self, path):
+
+        directory, name = os.path.split(path)
+
+        sandbox_dirs = self._get_sandbox_dirs(directory)
+
+        if len(sandbox_dirs):
+
+            return os.path.join(sandbox_dirs[0], name)
+
+        else:
+
+            return path
+
+    def find_sandbox_path(self, path):
+
+        directory, name = os.path.split(path)
+
+        for sandbox_directory in self._get_sandbox_dirs(directory):
+
+            sandbox_path = os.path.join(sandbox_directory, name)
+
+            if os.path.exists(sandbox_path):
+
+                return sandbox_path
+
+            elif os.path.islink(sandbox_path):
+
+                return self._get_host_path(path) or path
+
+        else:
+
+            return path
+
+    def get_command_lookup_path(self, path):
+
+        if (self._flatpak and not path.startswith(self._real_home) and
+            not True in [path.startswith(directory) for directory in self._flatpak_bin_dirs]):
+
+            return self._join_path_prefix(self._host_prefix, path)
+
+        else:
+
+            return path
+
+
+class StarterLocator():
+
+    def __init__(self, data_dirs, override_dir, path_converter=None):
+
+        self._data_dirs = list(data_dirs)
+
+        self._override_dir = override_dir
+
+        self._path_converter = path_converter
+
+        self._listings = {}
+
+        self._outdated_dirs = set()
+
+        self._lock = threading.Lock()
+
+        self._path_inspector = basic.PathInspector()
+
+        for event in ["changed", "created", "deleted"]:
+
+            self._path_inspector.hook(event, self._on_path_inspector_changed)
+
+    def _on_path_inspector_changed(self, event, path, timestamp):
+
+        with self._lock:
+
+            self._outdated_dirs.add(path)
+
+    def _convert_path(self, path, include_host):
+
+        if include_host and not self._path_converter is None:
+
+            return self._path_converter(path)
+
+        else:
+
+            return path
+
+    def _get_default_dirs(self):
+
+        return [self._convert_path(os.path.join(directory, "applications"), True) for directory in self._data_dirs]
+
+    def _scan_directory(self, directory):
+
+        entries = set()
+
+        try:
+
+            timestamp = os.stat(directory).st_mtime_ns
+
+        except OSError:
+
+            timestamp = None
+
+        else:
+
+            try:
+
+                with os.scandir(directory) as iterator:
+
+                    for entry in iterator:
+
+                        if entry.name.endswith(".desktop"):
+
+                            entries.add(entry.name[:-len(".desktop")])
+
+            except OSError:
+
+                pass
+
+        self._listings[directory] = {"timestamp": timestamp, "entries": entries}
+
+    def _get_listing(self, directory):
+
+        watched = self.get_active() and directory in self._path_inspector.get_paths()
+
+        with self._lock:
+
+            outdated = directory in self._outdated_dirs
+
+            self._outdated_dirs.discard(directory)
+
+        if outdated or not directory in self._listings:
+
+            self._scan_directory(directory)
+
+        elif not watched:
+
+            try:
+
+                timestamp = os.stat(directory).st_mtime_ns
+
+            except OSError:
+
+                timestamp = None
+
+            if not timestamp == self._listings[directory]["timestamp"]:
+
+                self._scan_directory(directory)
+
+        return self._listings[directory]["entries"]
+
+    def get_data_dirs(self):
+
+        return list(self._data_dirs)
+
+    def set_data_dirs(self, data_dirs):
+
+        self._data_dirs = list(data_dirs)
+
+        if self.get_active():
+
+            for directory in self._get_default_dirs():
+
+                if not directory in self._path_inspector.get_paths():
+
+                    self._path_inspector.add(directory)
+
+    def get_override_dir(self):
+
+        return self._override_dir
+
+    def iter_names(self, reverse=False):
+
+        listings = [self._get_listing(directory) for directory in [*self._get_default_dirs(), self._override_dir]]
+
+        previous_name = None
+
+        for name in heapq.merge(*[sorted(listing, reverse=reverse) for listing in listings], reverse=reverse):
+
+            if not name == previous_name:
+
+                previous_name = name
+
+                yield name
+
+    def get_names(self):
+
+        return list(self.iter_names())
+
+    def get_has_name(self, name):
+
+        return self.get_has_override(name) or self.get_has_default(name)
+
+    def get_stat(self, name):
+
+        if self.get_has_name(name):
+
+            try:
+
+                return os.stat(self.get_path(name, include_host=True))
+
+            except OSError:
+
+                return None
+
+        else:
+
+            return None
+
+    def get_default_path(self, name, include_host=False):
+
+        for directory, default_dir in zip(self._data_dirs, self._get_default_dirs()):
+
+            if name in self._get_listing(default_dir):
+
+                if include_host:
+
+                    return os.path.join(default_dir, "%s.desktop" % name)
+
+                else:
+
+                    return os.path.join(directory, "applications", "%s.desktop" % name)
+
+        else:
+
+            return os.path.join(self._data_dirs[0], "applications", "%s.desktop" % name)
+
+    def get_override_path(self, name, include_host=False):
+
+        path = os.path.join(self._override_dir, "%s.desktop" % name)
+
+        return self._convert_path(path, include_host)
+
+    def get_path(self, name, include_host=False):
+
+        if self.get_has_override(name):
+
+            return self.get_override_path(name, include_host=include_host)
+
+        else:
+
+            return self.get_default_path(name, include_host=include_host)
+
+    def get_has_default(self, name):
+
+        for directory in self._get_default_dirs():
+
+            if name in self._get_listing(directory):
+
+                return True
+
+        else:
+
+            return False
+
+    def get_has_override(self, name):
+
+        return name in self._get_listing(self._override_dir)
+
+    def get_active(self):
+
+        return self._path_inspector.get_active()
+
+    def set_active(self, value):
+
+        if value:
+
+            for directory in [*self._get_default_dirs(), self._override_dir]:
+
+                if not directory in self._path_inspector.get_paths():
+
+                    self._path_inspector.add(directory)
+
+        else:
+
+            self._path_inspector.set_active(False)
+
+    def invalidate(self, directory=None):
+
+        with self._lock:
+
+            self._outdated_dirs.add(self._override_dir if directory is None else directory)
+
+
+class StarterValidator():
+
+    def __init__(self, command_checker=None, icon_checker=None, max_workers=None):
+
+        self._command_checker = command_checker
+
+        self._icon_checker = icon_checker
+
+        self._max_workers = max_workers
+
+        self._bool_keys = ["Hidden", "NoDisplay", "StartupNotify", "Terminal", "DBusActivatable", "PrefersNonDefaultGPU", "SingleMainWindow"]
+
+        self._cache_version = 2
+
+        self._results = {}
+
+        self._lock = threading.Lock()
+
+    def _get_mtime(self, path):
+
+        try:
+
+            return os.stat(path).st_mtime_ns
+
+        except OSError:
+
+            return None
+
+    def _get_issue(self, problem, section=None, key=None, value=None):
+
+        return {"problem": problem, "section": section, "key": key, "value": value}
+
+    def _get_issue_found(self, issue):
+
+        if issue["problem"] == "missing-command":
+
+            return not self._command_checker is None and not self._command_checker(issue["value"])
+
+        elif issue["problem"] == "missing-icon":
+
+            return not self._icon_checker is None and not self._icon_checker(issue["value"].strip())
+
+        else:
+
+            return True
+
+    def _check_entry(self, issues, config_parser, section):
+
+        command = config_parser.get(section, "Exec", fallback="")
+
+        if len(command.strip()):
+
+            issues.append(self._get_issue("missing-command", section, "Exec", command))
+
+        icon = config_parser.get(section, "Icon", fallback="")
+
+        if len(icon.strip()):
+
+            issues.append(self._get_issue("missing-icon", section, "Icon", icon))
+
+        for key in self._bool_keys:
+
+            if config_parser.has_option(section, key):
+
+                value = config_parser.get(section, key)
+
+                if not value.lower() in ConfigParser.BOOLEAN_STATES:
+
+                    issues.append(self._get_issue("invalid-boolean", section, key, value))
+
+    def _check_file(self, path):
+
+        issues = []
+
+        config_parser = ConfigParser(interpolation=None, strict=False)
+
+        config_parser.optionxform = str
+
+        try:
+
+            with open(path, "r") as file:
+
+                config_parser.read_file(file)
+
+        except (OSError, UnicodeDecodeError, ConfigParserError) as error:
+
+            issues.append(self._get_issue("unreadable", value=str(error)))
+
+            return issues
+
+        if not config_parser.has_section("Desktop Entry"):
+
+            issues.append(self._get_issue("missing-section", "Desktop Entry"))
+
+            return issues
+
+        self._check_entry(issues, config_parser, "Desktop Entry")
+
+        listed_actions = list(filter(None, config_parser.get("Desktop Entry", "Actions", fallback="").split(";")))
+
+        for action in listed_actions:
+
+            section = "Desktop Action %s" % action
+
+            if not config_parser.has_section(section):
+
+                issues.append(self._get_issue("missing-action", "Desktop Entry", "Actions", action))
+
+            else:
+
+                self._check_entry(issues, config_parser, section)
+
+        for section in config_parser.sections():
+
+            if section.startswith("Desktop Action ") and not section[len("Desktop Action "):] in listed_actions:
+
+                issues.append(self._get_issue("unlisted-action", section))
+
+        return issues
+
+    def validate(self, paths, mtimes=None):
+
+        results, pending = {}, {}
+
+        for path in paths:
+
+            if not mtimes is None and path in mtimes:
+
+                mtime = mtimes[path]
+
+            else:
+
+                mtime = self._get_mtime(path)
+
+            with self._lock:
+
+                if not mtime is None and path in self._results and self._results[path][0] == mtime:
+
+                    results[path] = self._results[path][1]
+
+                else:
+
+                    pending[path] = mtime
+
+        if len(pending):
+
+            with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+
+                for path, issues in zip(pending, executor.map(self._check_file, pending)):
+
+                    results[path] = issues
+
+                    with self._lock:
+
+                        self._results[path] = (pending[path], issues)
+
+        return {path: [dict(issue) for issue in issues if self._get_issue_found(issue)] for path, issues in results.items()}
+
+    def load(self, path):
+
+        try:
+
+            with open(path, "r") as file:
+
+                data = json.load(file)
+
+        except (OSError, ValueError):
+
+            return False
+
+        if not isinstance(data, dict) or not data.get("version") == self._cache_version or not isinstance(data.get("results"), dict):
+
+            return False
+
+        with self._lock:
+
+            for key, value in data["results"].items():
+
+                if isinstance(value, list) and len(value) == 2:
+
+                    self._results[key] = (value[0], value[1])
+
+        return True
+
+    def save(self, path):
+
+        with self._lock:
+
+            data = {
+
+                "version": self._cache_version,
+
+                "results": {key: list(value) for key, value in self._results.items() if not value[0] is None}
+
+                }
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        with open(path, "w") as file:
+
+            json.dump(data, file)
+
+    def clear(self):
+
+        with self._lock:
+
+            self._results.clear()
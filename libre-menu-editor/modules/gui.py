@@ -16,7 +16,7 @@
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
 
-import os, threading, subprocess, gi, re
+import os, threading, gi, re
 
 gi.require_version("Adw", "1")
 
@@ -46,7 +46,7 @@ from gi.repository import GObject
 
 from gi.repository import Pango
 
-from modules import basic
+from modules import basic, desktop
 
 
 class Timeout():
@@ -106,9 +106,9 @@ class IconFinder():
 
     def __init__(self, app):
 
-        self._events = basic.EventManager()
+        self._events = basic.EventManager(scheduler=app.schedule_update)
 
-        self._events.add("changed", object)
+        self._events.add("changed", object, coalesce=True)
 
         self._ignore_prefix = None
 
@@ -116,6 +116,8 @@ class IconFinder():
 
         self._application_window = app.get_application_window()
 
+        self._profiler = app.get_profiler()
+
         self._alternatives = {}
 
         self._legacy_icons = {}
@@ -168,6 +170,10 @@ class IconFinder():
 
                 self._load_legacy_icons(path)
 
+    def get_legacy_names(self):
+
+        return list(self._legacy_icons)
+
     def get_alternatives(self, name):
 
         if name in self._alternatives:
@@ -254,7 +260,7 @@ class IconFinder():
 
                 raise IconNotFoundError(icon)
 
-    def get_name(self, name, missing_ok=True, use_alternatives=True):
+    def _get_name(self, name, missing_ok, use_alternatives):
 
         if not self._ignore_prefix or not name.startswith(self._ignore_prefix):
 
@@ -294,6 +300,12 @@ class IconFinder():
 
             raise IconNotFoundError(name)
 
+    def get_name(self, name, missing_ok=True, use_alternatives=True):
+
+        with self._profiler.span("icon-finder.get-name"):
+
+            return self._get_name(name, missing_ok, use_alternatives)
+
     def has_name(self, name, use_alternatives=False):
 
         try:
@@ -320,9 +332,9 @@ class IconFinder():
 
         return self._icon_theme
 
-    def hook(self, event, callback, *args):
+    def hook(self, event, callback, *args, weak=False):
 
-        self._events.hook(event, callback, *args)
+        return self._events.hook(event, callback, *args, weak=weak)
 
     def release(self, id):
 
@@ -348,20 +360,20 @@ class IconBrowserRow(Adw.PreferencesRow):
 
         self._icon_finder = app.get_icon_finder()
 
+        self._profiler = app.get_profiler()
+
         self._events = basic.EventManager()
 
         self._events.add("search-completed", object)
 
         self._events.add("active-changed", bool)
 
-        self._icon_names = []
+        self._search_index = basic.SubstringSearchIndex()
 
-        self._string_separator = ";"
+        self._string_separator = self._search_index.get_separator()
 
         self._keyword_separator = " "
 
-        self._search_string = ""
-
         self._results_cache = {}
 
         self._max_cached_results = 10
@@ -370,8 +382,6 @@ class IconBrowserRow(Adw.PreferencesRow):
 
         self._min_keywords_length = 0
 
-        self._lower_string = ""
-
         self._can_set_active = False
 
         self._default_text = None
@@ -604,15 +614,11 @@ class IconBrowserRow(Adw.PreferencesRow):
 
     def _connect_icon_finder_changed(self):
 
-        self._icon_finder.hook("changed", self._on_icon_finder_changed)
+        self._icon_finder.hook("changed", self._on_icon_finder_changed, weak=True)
 
     def _update_search_data(self):
 
-        self._icon_names = self._icon_finder.get_names()
-
-        self._search_string = self._string_separator.join(self._icon_names)
-
-        self._lower_string = self._search_string.lower()
+        self._search_index.set_names(self._icon_finder.get_names())
 
     def _start_search_thread(self):
 
@@ -680,11 +686,13 @@ class IconBrowserRow(Adw.PreferencesRow):
 
                 if not len(keywords):
 
-                    names = [IconName(name) for name in self._icon_names]
+                    names = [IconName(name) for name in self._search_index.get_names()]
 
                 else:
 
-                    names = self._get_names(keywords, exclude=[text])
+                    with self._profiler.span("icon-browser.search"):
+
+                        names = self._get_names(keywords, exclude=[text])
 
                 try:
 
@@ -764,91 +772,13 @@ class IconBrowserRow(Adw.PreferencesRow):
 
     def _get_names(self, keywords, exclude=[]):
 
-        names = []
-
-        for string in keywords:
-
-            names.append([])
-
-            start_pos = 0
-
-            while not self._search_interrupted:
-
-                try:
-
-                    start_pos = self._lower_string.index(string, start_pos)
-
-                except ValueError:
-
-                    break
-
-                else:
-
-                    start_pos -= 1
-
-                    while not self._search_string[start_pos:start_pos + len(self._string_separator)] == self._string_separator:
-
-                        start_pos -= 1
-
-                        if start_pos < 1:
-
-                            start_pos = 0
-
-                            break
-
-                    else:
-
-                        start_pos += 1
-
-                    try:
-
-                        end_pos = self._search_string.index(self._string_separator, start_pos)
-
-                    except ValueError:
-
-                        name = self._search_string[start_pos:]
-
-                        if not name in exclude:
-
-                            names[-1].append(name)
-
-                        break
-
-                    else:
-
-                        name = self._search_string[start_pos:end_pos]
-
-                        if not name in exclude:
-
-                            names[-1].append(name)
-
-                        start_pos = end_pos + len(self._string_separator)
-
-                        if not len(self._search_string) > start_pos:
-
-                            break
-
-            else:
-
-                return []
-
-        else:
-
-            return [IconName(name) for name in self._get_matching_names(names)]
-
-    def _get_matching_names(self, lists):
-
-        first_list = lists.pop(0)
+        names = self._search_index.search(keywords, exclude=exclude, interrupted=self._get_search_interrupted)
 
-        first_list = set(first_list)
+        return [IconName(name) for name in names]
 
-        for remaining_list in lists:
-
-            first_list = first_list.intersection(remaining_list)
-
-        else:
+    def _get_search_interrupted(self):
 
-            return first_list
+        return self._search_interrupted
 
     def get_search_entry(self):
 
@@ -916,7 +846,7 @@ class IconBrowserRow(Adw.PreferencesRow):
 
     def hook(self, event, callback, *args):
 
-        self._events.hook(event, callback, *args)
+        return self._events.hook(event, callback, *args)
 
     def release(self, id):
 
@@ -971,7 +901,7 @@ class EntryRow(Adw.EntryRow):
 
     def hook(self, event, callback, *args):
 
-        self._events.hook(event, callback, *args)
+        return self._events.hook(event, callback, *args)
 
     def release(self, id):
 
@@ -1334,8 +1264,164 @@ class CommandChooserRow(FileChooserRow):
 
         self._application = app
 
+        self._command_completer = app.get_command_completer()
+
+        self._completion_limit = 8
+
+        self._completion_list_box = Gtk.ListBox()
+
+        self._completion_list_box.connect("row-activated", self._on_completion_list_box_row_activated)
+
+        self._completion_popover = Gtk.Popover()
+
+        self._completion_popover.add_css_class("menu")
+
+        self._completion_popover.set_autohide(False)
+
+        self._completion_popover.set_has_arrow(False)
+
+        self._completion_popover.set_position(Gtk.PositionType.BOTTOM)
+
+        self._completion_popover.set_halign(Gtk.Align.START)
+
+        self._completion_popover.set_child(self._completion_list_box)
+
+        self._completion_popover.set_parent(self)
+
+        self._event_controller_key = Gtk.EventControllerKey()
+
+        self._event_controller_key.connect("key-pressed", self._on_event_controller_key_pressed)
+
+        self._editable.add_controller(self._event_controller_key)
+
+        self._event_controller_focus.connect("enter", self._on_event_controller_focus_enter)
+
+        self.connect("unmap", self._on_unmap)
+
         self.add_css_class("error")
 
+    def _on_unmap(self, widget):
+
+        self._completion_popover.popdown()
+
+    def _on_event_controller_focus_enter(self, controller):
+
+        self._command_completer.update()
+
+    def _on_event_controller_focus_leave(self, controller):
+
+        super()._on_event_controller_focus_leave(controller)
+
+        GLib.idle_add(self._after_event_controller_focus_leave)
+
+    def _after_event_controller_focus_leave(self):
+
+        if not self.get_root() is None:
+
+            focus_widget = self.get_root().get_focus()
+
+            if not focus_widget is None and focus_widget.is_ancestor(self._completion_popover):
+
+                return
+
+        self._completion_popover.popdown()
+
+    def _on_event_controller_key_pressed(self, controller, keyval, keycode, state):
+
+        if self._completion_popover.get_visible():
+
+            if keyval == Gdk.KEY_Escape:
+
+                self._completion_popover.popdown()
+
+                return True
+
+            elif keyval == Gdk.KEY_Tab:
+
+                self._apply_completion(self._completion_list_box.get_row_at_index(0).completion)
+
+                return True
+
+            elif keyval == Gdk.KEY_Down:
+
+                self._completion_list_box.get_row_at_index(0).grab_focus()
+
+                return True
+
+    def _on_completion_list_box_row_activated(self, list_box, row):
+
+        self._apply_completion(row.completion)
+
+    def _split_command(self, text):
+
+        escaped_pieces = text.split("\\ ")
+
+        for index, escaped_piece in enumerate(escaped_pieces):
+
+            if " " in escaped_piece:
+
+                command, rest = escaped_piece.split(" ", 1)
+
+                return "\\ ".join([*escaped_pieces[:index], command]), f" {rest}"
+
+        else:
+
+            return text, ""
+
+    def _apply_completion(self, completion):
+
+        command, rest = self._split_command(self.get_text())
+
+        command = completion.replace(" ", "\\ ")
+
+        self._completion_popover.popdown()
+
+        self.set_text(f"{command}{rest}")
+
+        self._editable.grab_focus_without_selecting()
+
+        self.set_position(len(command))
+
+    def _update_completions(self, text):
+
+        command, rest = self._split_command(text)
+
+        if not self._editable.has_focus() or len(rest):
+
+            completions = []
+
+        else:
+
+            completions = self._command_completer.get_completions(command.replace("\\ ", " "), limit=self._completion_limit)
+
+        completions = [completion for completion in completions if not completion == command.replace("\\ ", " ")]
+
+        while not self._completion_list_box.get_row_at_index(0) is None:
+
+            self._completion_list_box.remove(self._completion_list_box.get_row_at_index(0))
+
+        if len(completions):
+
+            for completion in completions:
+
+                label = Gtk.Label(label=completion, xalign=0)
+
+                label.set_ellipsize(Pango.EllipsizeMode.MIDDLE)
+
+                row = Gtk.ListBoxRow()
+
+                row.completion = completion
+
+                row.set_child(label)
+
+                self._completion_list_box.append(row)
+
+            self._completion_popover.popup()
+
+        else:
+
+            self._completion_popover.popdown()
+
     def _on_file_chooser_dialog_response(self, dialog, response):
 
         self._file_chooser_dialog.hide()
@@ -1364,6 +1450,8 @@ class CommandChooserRow(FileChooserRow):
 
             self.remove_css_class("error")
 
+        self._update_completions(text)
+
 
 class IconChooserRow(FileChooserRow):
 
@@ -1391,13 +1479,25 @@ class IconChooserRow(FileChooserRow):
 
         self.get_chooser_button().set_child(self._icon_image_stack)
 
+        self._update_image_source_id = None
+
     def _on_changed(self, editable):
 
         text = self.get_text()
 
         self._events.trigger("text-changed", self, text)
 
-        GLib.idle_add(self._update_image)
+        if self._update_image_source_id is None:
+
+            self._update_image_source_id = GLib.idle_add(self._on_update_image_idle)
+
+    def _on_update_image_idle(self):
+
+        self._update_image_source_id = None
+
+        self._update_image()
+
+        return False
 
     def _update_image(self):
 
@@ -1600,7 +1700,7 @@ class SwitchRow(Adw.ActionRow):
 
     def hook(self, event, callback, *args):
 
-        self._events.hook(event, callback, *args)
+        return self._events.hook(event, callback, *args)
 
     def release(self, id):
 
@@ -1619,7 +1719,7 @@ class ComboRow(Adw.ActionRow):
 
         self._icon_finder = app.get_icon_finder()
 
-        self._icon_finder.hook("changed", self._on_icon_finder_changed)
+        self._icon_finder.hook("changed", self._on_icon_finder_changed, weak=True)
 
         self._flow_row = None
 
@@ -1869,7 +1969,7 @@ class ComboRow(Adw.ActionRow):
 
     def hook(self, event, callback, *args):
 
-        self._events.hook(event, callback, *args)
+        return self._events.hook(event, callback, *args)
 
     def release(self, id):
 
@@ -2035,7 +2135,11 @@ class TaggedRowTag(Gtk.FlowBoxChild):
 
         self._style_manager = Adw.StyleManager.get_default()
 
-        self._style_manager.connect("notify::dark", self._on_style_manager_dark_changed)
+        style_manager_callback = basic.WeakCallback(self._on_style_manager_dark_changed, scheduler=GLib.idle_add)
+
+        style_manager_handler_id = self._style_manager.connect("notify::dark", style_manager_callback)
+
+        style_manager_callback.add_finalizer(self._style_manager.disconnect, style_manager_handler_id)
 
         self._update_tag_button_style()
 
@@ -2127,6 +2231,20 @@ class TaggedRowTag(Gtk.FlowBoxChild):
 
         self._update_tag_button_style()
 
+    def reset(self):
+
+        if self._timeout_id:
+
+            GLib.source_remove(self._timeout_id)
+
+            self._timeout_id = None
+
+        self._icon_image.clear()
+
+        self.set_text("")
+
+        self.set_show_warning(False)
+
 
 class TagNotFoundError(Exception):
 
@@ -2139,9 +2257,9 @@ class TaggedFlowRow(Adw.PreferencesRow):
 
         super().__init__(*args, **kwargs)
 
-        self._events = basic.EventManager()
+        self._events = basic.EventManager(scheduler=app.schedule_update)
 
-        self._events.add("text-changed", object, str)
+        self._events.add("text-changed", object, str, coalesce=True)
 
         self._application = app
 
@@ -2153,6 +2271,10 @@ class TaggedFlowRow(Adw.PreferencesRow):
 
         self._delimiters = [";"]
 
+        self._tag_pool = []
+
+        self._max_pooled_tags = 64
+
         self._entry_row = None
 
         self._entry_row_default_values = {}
@@ -2163,8 +2285,6 @@ class TaggedFlowRow(Adw.PreferencesRow):
 
         self._flow_box = Gtk.FlowBox()
 
-        self._flow_box.set_sort_func(self._do_flow_box_sort)
-
         self._flow_box.set_margin_top(Margin.DEFAULT)
 
         self._flow_box.set_margin_bottom(Margin.DEFAULT)
@@ -2195,30 +2315,6 @@ class TaggedFlowRow(Adw.PreferencesRow):
 
         self.set_child(self._revealer)
 
-    def _do_flow_box_sort(self, tag_1, tag_2):
-
-        labels = [
-
-            tag_1.get_text(),
-
-            tag_2.get_text()
-
-            ]
-
-        if labels[0] == labels[1]:
-
-            return 0
-
-        else:
-
-            if sorted(labels, key=str.lower)[0] == labels[0]:
-
-                return -1
-
-            else:
-
-                return 1
-
     def _on_tag_event_controller_key_pressed(self, controller, keyval, keycode, state):
 
         if (
@@ -2301,6 +2397,42 @@ class TaggedFlowRow(Adw.PreferencesRow):
 
             return list(filter(None, strings))
 
+    def _create_tag(self, text):
+
+        try:
+
+            tag = self._tag_pool.pop()
+
+        except IndexError:
+
+            tag = TaggedRowTag(self._application)
+
+            event_controller_key = Gtk.EventControllerKey()
+
+            event_controller_key.connect("key-pressed", self._on_tag_event_controller_key_pressed)
+
+            tag.add_controller(event_controller_key)
+
+            tag.set_flow_row(self)
+
+        tag.set_text(text)
+
+        return tag
+
+    def _remove_tag(self, tag):
+
+        self._flow_box.remove(tag)
+
+        if tag in self._duplicate_tag_warnings:
+
+            self._duplicate_tag_warnings.remove(tag)
+
+        if tag.get_flow_row() == self and len(self._tag_pool) < self._max_pooled_tags:
+
+            tag.reset()
+
+            self._tag_pool.append(tag)
+
     def _get_duplicates(self, *strings, mark_duplicates=False, warning_timeout=None):
 
         duplicate_strings, duplicate_tags = [], []
@@ -2375,17 +2507,51 @@ class TaggedFlowRow(Adw.PreferencesRow):
 
     def set_text(self, *strings):
 
+        old_text = self.get_text()
+
         self._ends_with_delimiter = strings[-1].endswith(self._delimiters[0])
 
+        new_strings = self._split_text(*strings)
+
+        missing_strings, kept_tags = list(new_strings), {}
+
         for tag in self.get_tags():
 
-            self._flow_box.remove(tag)
+            if tag.get_text() in missing_strings:
 
-        self._update_reveal_child()
+                missing_strings.remove(tag.get_text())
 
-        self._update_entry_row()
+                kept_tags.setdefault(tag.get_text(), []).append(tag)
+
+            else:
+
+                self._remove_tag(tag)
+
+        for index, string in enumerate(new_strings):
+
+            if len(kept_tags.get(string, [])):
+
+                tag = kept_tags[string].pop(0)
+
+                if not self._flow_box.get_child_at_index(index) == tag:
+
+                    self._flow_box.remove(tag)
+
+                    self._flow_box.insert(tag, index)
+
+            else:
 
-        self.add_tags(*strings)
+                self._flow_box.insert(self._create_tag(string), index)
+
+        if not self.get_text() == old_text:
+
+            self._do_flow_box_children_changed()
+
+        else:
+
+            self._update_reveal_child()
+
+            self._update_entry_row()
 
     def get_tags(self):
 
@@ -2433,19 +2599,17 @@ class TaggedFlowRow(Adw.PreferencesRow):
 
             tag = text
 
-        else:
-
-            tag = TaggedRowTag(self._application)
+            event_controller_key = Gtk.EventControllerKey()
 
-            tag.set_text(text)
+            event_controller_key.connect("key-pressed", self._on_tag_event_controller_key_pressed)
 
-        event_controller_key = Gtk.EventControllerKey()
+            tag.add_controller(event_controller_key)
 
-        event_controller_key.connect("key-pressed", self._on_tag_event_controller_key_pressed)
+            tag.set_flow_row(self)
 
-        tag.add_controller(event_controller_key)
+        else:
 
-        tag.set_flow_row(self)
+            tag = self._create_tag(text)
 
         self._flow_box.insert(tag, -1)
 
@@ -2457,7 +2621,7 @@ class TaggedFlowRow(Adw.PreferencesRow):
 
         if isinstance(text, TaggedRowTag):
 
-            self._flow_box.remove(text)
+            self._remove_tag(text)
 
             self._do_flow_box_children_changed()
 
@@ -2467,7 +2631,7 @@ class TaggedFlowRow(Adw.PreferencesRow):
 
                 if tag.get_text() == text:
 
-                    self._flow_box.remove(tag)
+                    self._remove_tag(tag)
 
                     self._do_flow_box_children_changed()
 
@@ -2487,7 +2651,7 @@ class TaggedFlowRow(Adw.PreferencesRow):
 
             for tag in self.get_tags():
 
-                self._flow_box.remove(tag)
+                self._remove_tag(tag)
 
             self._do_flow_box_children_changed()
 
@@ -2501,6 +2665,10 @@ class TaggedFlowRow(Adw.PreferencesRow):
 
         self._events.release(id)
 
+    def flush_events(self):
+
+        self._events.flush()
+
 
 class ItemAlreadyExistingError(Exception):
 
@@ -2526,6 +2694,8 @@ class SearchList(Gtk.Box):
 
         self._children = {}
 
+        self._search_filter = basic.SearchFilter()
+
         self._last_activated = None
 
         self._ignore_selection = False
@@ -2534,7 +2704,7 @@ class SearchList(Gtk.Box):
 
         self._icon_finder = app.get_icon_finder()
 
-        self._icon_finder.hook("changed", self._on_icon_finder_changed)
+        self._icon_finder.hook("changed", self._on_icon_finder_changed, weak=True)
 
         self._application_window = app.get_application_window()
 
@@ -2780,23 +2950,17 @@ class SearchList(Gtk.Box):
 
         return children
 
-    def _update_search_results(self):
+    def _update_search_results(self, names=None):
 
-        text = self._search_entry.get_text().lower()
-
-        for name in self._children:
+        if names is None:
 
-            for keyword in self._children[name]["keywords"]:
+            names = list(self._children.keys())
 
-                if text in keyword:
-
-                    self._children[name]["widget"].set_visible(True)
-
-                    break
+        matches = self._search_filter.get_matches(self._search_entry.get_text(), names)
 
-            else:
+        for name in names:
 
-                self._children[name]["widget"].set_visible(False)
+            self._children[name]["widget"].set_visible(name in matches)
 
     def _update_item_image(self, image, icon):
 
@@ -2852,6 +3016,46 @@ class SearchList(Gtk.Box):
 
         return self._search_entry
 
+    def get_search_text(self):
+
+        return self._search_entry.get_text()
+
+    def set_search_text(self, text):
+
+        if len(text) and not self._search_bar.get_search_mode():
+
+            self._search_bar.set_search_mode(True)
+
+        self._search_entry.set_text(text)
+
+    def add_filter(self, prefix, callback):
+
+        prefix = prefix.lower()
+
+        if not prefix in self._search_filter.get_filters():
+
+            self._search_filter.add_filter(prefix, callback)
+
+            self._update_search_results()
+
+        else:
+
+            raise ItemAlreadyExistingError(prefix)
+
+    def remove_filter(self, prefix):
+
+        prefix = prefix.lower()
+
+        if prefix in self._search_filter.get_filters():
+
+            self._search_filter.remove_filter(prefix)
+
+            self._update_search_results()
+
+        else:
+
+            raise ItemNotFoundError(prefix)
+
     def get_visible_items(self):
 
         items = []
@@ -2890,13 +3094,13 @@ class SearchList(Gtk.Box):
 
             label.set_text(text)
 
-            self._children[name]["keywords"] = [keyword.lower() for keyword in keywords]
+            self._search_filter.set_keywords(name, keywords)
 
             if invalidate_sort:
 
                 self._list_box.invalidate_sort()
 
-            self._update_search_results()
+            self._update_search_results([name])
 
         else:
 
@@ -2952,8 +3156,6 @@ class SearchList(Gtk.Box):
 
             self._list_box.prepend(child)
 
-            self._update_search_results()
-
         else:
 
             raise ItemAlreadyExistingError(name)
@@ -2970,7 +3172,7 @@ class SearchList(Gtk.Box):
 
             del self._children[name]
 
-            self._update_search_results()
+            self._search_filter.remove(name)
 
         else:
 
@@ -3116,25 +3318,15 @@ class Application(Adw.Application):
 
         self._cache_dir = os.path.join(GLib.get_user_cache_dir(), self._app_name)
 
-        self._flatpak_filesystem_prefix = os.path.join(os.path.sep, "run", "host")
-
-        ###############################################################################################################
-
-        if os.getenv("APP_RUNNING_AS_FLATPAK") == "true":
-
-            home_var = self.get_flatpak_host_environment_variable("HOME")
+        self._system_paths = desktop.SystemPaths()
 
-            if home_var:
+        self._flatpak_host_environment_process = None
 
-                self._flatpak_real_home = os.path.abspath(home_var)
+        self._profiler = basic.Profiler()
 
-            else:
-
-                self._flatpak_real_home = os.path.join(os.path.sep, "home", os.getenv("USER"))
-
-        else:
+        self._events = basic.EventManager()
 
-            self._flatpak_real_home = None
+        self._events.add("host-environment-loaded")
 
         ###############################################################################################################
 
@@ -3162,223 +3354,115 @@ class Application(Adw.Application):
 
         ###############################################################################################################
 
-        if os.getenv("APP_RUNNING_AS_FLATPAK") == "true":
-
-            self._system_data_dirs = [
-
-                os.path.join(GLib.get_user_data_dir(), "flatpak", "exports", "share"),
-
-                os.path.join(os.path.sep, "var", "lib", "flatpak", "exports", "share"),
-
-                os.path.join(os.path.sep, "var", "lib", "snapd", "desktop"),
-
-                os.path.join(self._flatpak_filesystem_prefix, "usr", "local", "share"),
-
-                os.path.join(self._flatpak_filesystem_prefix, "usr", "share")
-
-                ]
-
-            try:
-
-                for path in self.get_flatpak_host_environment_variable("XDG_DATA_DIRS").split(":"):
-
-                    if path.startswith("~"):
-
-                        path = self._join_path_prefix(self._flatpak_real_home, path[1:])
-
-                    if path.startswith(self._flatpak_real_home) and not path in self._system_data_dirs:
-
-                        self._system_data_dirs.append(path)
-
-                    path = self._join_path_prefix(self._flatpak_filesystem_prefix, path)
-
-                    if not path in self._system_data_dirs:
-
-                        self._system_data_dirs.append(path)
-
-            except AttributeError as e:
-
-                if self.get_flatpak_host_environment_variable("XDG_DATA_DIRS"):
-
-                    raise e
-
-            self._icon_search_dirs = [
-
-                self._join_path_prefix(self._flatpak_filesystem_prefix, self._flatpak_real_home, ".local", "share", "icons"),
-
-                self._join_path_prefix(self._flatpak_filesystem_prefix, self._flatpak_real_home, ".local", "share", "pixmaps"),
-
-                self._join_path_prefix(self._flatpak_filesystem_prefix, self._flatpak_real_home, ".icons"),
-
-                self._join_path_prefix(self._flatpak_filesystem_prefix, self._flatpak_real_home, ".pixmaps")
-
-                ]
-
-            for path in self._system_data_dirs:
-
-                self._icon_search_dirs.append(os.path.join(path, "icons"))
-
-                self._icon_search_dirs.append(os.path.join(path, "pixmaps"))
-
-        else:
-
-            self._system_data_dirs = [
-
-                os.path.join(GLib.get_user_data_dir(), "flatpak", "exports", "share"),
-
-                os.path.join(os.path.sep, "var", "lib", "flatpak", "exports", "share"),
-
-                os.path.join(os.path.sep, "var", "lib", "snapd", "desktop"),
+        self._icon_finder.add_search_paths(*self._system_paths.get_icon_search_dirs(), os.path.join(self.get_project_dir(), "icons"))
 
-                os.path.join(os.path.sep, "usr", "local", "share"),
-
-                os.path.join(os.path.sep, "usr", "share")
-
-                ]
-
-            try:
-
-                for path in os.getenv("XDG_DATA_DIRS").split(":"):
-
-                    if path.startswith("~"):
-
-                        path = self._join_path_prefix(GLib.get_home_dir(), path[1:])
-
-                    if not path in self._system_data_dirs:
-
-                        self._system_data_dirs.append(path)
-
-            except AttributeError as e:
-
-                if os.getenv("XDG_DATA_DIRS"):
-
-                    raise e
-
-            self._icon_search_dirs = [
-
-                os.path.join(GLib.get_user_data_dir(), "icons"),
-
-                os.path.join(GLib.get_user_data_dir(), "pixmaps"),
+        ###############################################################################################################
 
-                os.path.join(GLib.get_home_dir(), ".icons"),
+        self._executable_index = basic.ExecutableIndex(self._system_paths.get_command_dirs())
 
-                os.path.join(GLib.get_home_dir(), ".pixmaps")
+        self._exec_parser = desktop.ExecParser(self._system_paths.get_flatpak_bin_dirs())
 
-                ]
+        self._command_completer = basic.CommandCompleter(self._executable_index, path_converter=self._system_paths.get_command_lookup_path)
 
-            for path in self._system_data_dirs:
+        self._command_completer.update()
 
-                self._icon_search_dirs.append(os.path.join(path, "icons"))
+        if self._system_paths.get_flatpak():
 
-                self._icon_search_dirs.append(os.path.join(path, "pixmaps"))
+            self._start_flatpak_host_environment_process()
 
         ###############################################################################################################
 
-        self._icon_search_dirs.append(os.path.join(self.get_project_dir(), "icons"))
-
-        self._icon_finder.add_search_paths(*self._icon_search_dirs)
-
-        ###############################################################################################################
-
-        self._command_dirs = []
-
-        ###############################################################################################################
-
-        if os.getenv("APP_RUNNING_AS_FLATPAK") == "true":
+        self.connect("activate", self._on_activate)
 
-            self._command_lookup_cwd = self._flatpak_real_home
+        self.connect("shutdown", self._on_shutdown)
 
-            try:
+    def _on_activate(self, app):
 
-                for path in self.get_flatpak_host_environment_variable("PATH").split(":"):
+        GLib.set_prgname(self._app_name)
 
-                    if path.startswith("~"):
+        self._application_window.set_default_size(
 
-                        path = self._join_path_prefix(self._flatpak_real_home, path[1:])
+            self._config_manager.get("window.width"),
 
-                    if path.startswith(self._flatpak_real_home) and not path in self._command_dirs:
+            self._config_manager.get("window.height")
 
-                        self._command_dirs.append(path)
+            )
 
-                    path = self._join_path_prefix(self._flatpak_filesystem_prefix, path)
+        if self._config_manager.get("window.maximized"):
 
-                    if not path in self._command_dirs:
+            self._application_window.maximize()
 
-                        self._command_dirs.append(path)
+        self._application_window.set_application(self)
 
-            except AttributeError as e:
+        self._application_window.show()
 
-                if self.get_flatpak_host_environment_variable("PATH"):
+    def _on_shutdown(self, app):
 
-                    raise e
+        self._config_manager.set("window.width", self._application_window.get_default_size()[0])
 
-        else:
+        self._config_manager.set("window.height", self._application_window.get_default_size()[1])
 
-            self._command_lookup_cwd = GLib.get_home_dir()
+        self._config_manager.set("window.maximized", self._application_window.is_maximized())
 
-            try:
+        self._config_manager.save()
 
-                for path in os.getenv("PATH").split(":"):
+    def _start_flatpak_host_environment_process(self):
 
-                    if path.startswith("~"):
+        try:
 
-                        path = self._join_path_prefix(GLib.get_home_dir(), path[1:])
+            self._flatpak_host_environment_process = Gio.Subprocess.new(
 
-                    if not path in self._command_dirs:
+                self._system_paths.get_host_environment_command(),
 
-                        self._command_dirs.append(path)
+                Gio.SubprocessFlags.STDOUT_PIPE | Gio.SubprocessFlags.STDERR_SILENCE
 
-            except AttributeError as e:
+                )
 
-                if os.getenv("PATH"):
+        except GLib.Error:
 
-                    raise e
+            self._flatpak_host_environment_process = None
 
-        ###############################################################################################################
+        else:
 
-        self.connect("activate", self._on_activate)
+            self._flatpak_host_environment_process.communicate_async(
 
-        self.connect("shutdown", self._on_shutdown)
+                None, None, self._on_flatpak_host_environment_process_communicate
 
-    def _on_activate(self, app):
+                )
 
-        GLib.set_prgname(self._app_name)
+    def _on_flatpak_host_environment_process_communicate(self, process, result):
 
-        self._application_window.set_default_size(
+        self._flatpak_host_environment_process = None
 
-            self._config_manager.get("window.width"),
+        try:
 
-            self._config_manager.get("window.height")
+            success, stdout, stderr = process.communicate_finish(result)
 
-            )
+        except GLib.Error:
 
-        if self._config_manager.get("window.maximized"):
+            self._on_flatpak_host_environment_loaded({})
 
-            self._application_window.maximize()
-
-        self._application_window.set_application(self)
-
-        self._application_window.show()
+        else:
 
-    def _on_shutdown(self, app):
+            if success and process.get_successful() and not stdout is None:
 
-        self._config_manager.set("window.width", self._application_window.get_default_size()[0])
+                self._on_flatpak_host_environment_loaded(self._system_paths.parse_host_environment(stdout.get_data()))
 
-        self._config_manager.set("window.height", self._application_window.get_default_size()[1])
+            else:
 
-        self._config_manager.set("window.maximized", self._application_window.is_maximized())
+                self._on_flatpak_host_environment_loaded({})
 
-        self._config_manager.save()
+    def _on_flatpak_host_environment_loaded(self, environment):
 
-    def _join_path_prefix(self, *paths):
+        self._system_paths.set_host_environment(environment)
 
-        names = [""]
+        self._icon_finder.add_search_paths(*self._system_paths.get_icon_search_dirs())
 
-        for path in paths:
+        self._executable_index.set_directories(self._system_paths.get_command_dirs())
 
-            names.append(os.path.sep.join(list(filter(None, path.split(os.path.sep)))))
+        self._command_completer.update()
 
-        return os.path.sep.join(names)
+        self._events.trigger("host-environment-loaded")
 
     def get_application_window(self):
 
@@ -3412,128 +3496,88 @@ class Application(Adw.Application):
 
         return self._icon_finder
 
-    def get_flatpak_host_system_path(self, path):
+    def get_profiler(self):
 
-        if path.startswith(self._flatpak_filesystem_prefix):
+        return self._profiler
 
-            return os.path.join(os.path.sep, path[len(self._flatpak_filesystem_prefix):])
+    def schedule_update(self, callback, *args):
 
-        else:
+        return GLib.idle_add(callback, *args, priority=GLib.PRIORITY_HIGH_IDLE)
 
-            return path
+    def get_system_paths(self):
 
-    def get_flatpak_sandbox_system_path(self, path):
-
-        if not os.path.exists(path):
-
-            target = path
-
-            while True:
-
-                if os.path.islink(target):
-
-                    target = os.path.realpath(path)
+        return self._system_paths
 
-                test = os.path.join(self._join_path_prefix(self._flatpak_filesystem_prefix, target))
-
-                if os.path.exists(test):
-
-                    return test
+    def get_flatpak_host_system_path(self, path):
 
-                elif os.path.islink(test):
+        return self._system_paths.get_host_system_path(path)
 
-                    target = os.path.realpath(test)
+    def get_flatpak_sandbox_system_path(self, path):
 
-                else:
+        return self._system_paths.find_sandbox_path(path)
 
-                    return path
+    def get_flatpak_host_environment(self):
 
-        else:
-
-            return path
+        return self._system_paths.get_host_environment() or {}
 
     def get_flatpak_host_environment_variable(self, variable):
 
-        printenv_commands = [
-
-            ["flatpak-spawn", "--host", "printenv", variable],
-
-            ["flatpak-spawn", "--host", "sh", "-c", f"echo ${variable}"]
-
-            ]
-
-        for command in printenv_commands:
-
-            process = subprocess.Popen(command, stdout=subprocess.PIPE)
+        value = self.get_flatpak_host_environment().get(variable, "").split("\n")[0]
 
-            stdout, stderr = process.communicate()
+        if len(value):
 
-            if not process.returncode:
-
-                decoded_stdout = stdout.decode().split("\n")[0]
-
-                if len(decoded_stdout):
-
-                    return decoded_stdout
+            return value
 
     def get_command_exists(self, text, skip_empty_path=False, include_lookup_cwd=False):
 
-        filtered_pieces = []
-
-        escaped_pieces = text.strip().split("\ ")
-
-        for escaped_piece in escaped_pieces:
-
-            if not " " in escaped_piece:
-
-                filtered_pieces.append(escaped_piece)
+        try:
 
-            else:
+            command = self._exec_parser.get_program(text)
 
-                filtered_pieces.append(escaped_piece.split(" ")[0])
+        except desktop.ExecInvalidError:
 
-                break
+            return None
 
-        command = "\ ".join(filtered_pieces)
+        if command is None:
 
-        if os.path.sep in command:
+            return None
 
-            path = command.replace("\ ", " ")
+        elif skip_empty_path and not os.path.sep in command and not len(self._system_paths.get_command_dirs()):
 
-            if command.startswith(os.path.sep):
+            return True
 
-                if os.getenv("APP_RUNNING_AS_FLATPAK") == "true" and not path.startswith(self._flatpak_real_home):
+        elif include_lookup_cwd:
 
-                    path = self._join_path_prefix(self._flatpak_filesystem_prefix, path)
+            return self._executable_index.get_command_path(
 
-            elif include_lookup_cwd:
+                command, path_converter=self._system_paths.get_command_lookup_path, lookup_dir=self._system_paths.get_command_lookup_cwd()
 
-                path = os.path.join(self._command_lookup_cwd, path)
+                )
 
-            if os.access(path, os.X_OK) and os.path.isfile(path):
+        else:
 
-                return path
+            return self._executable_index.get_command_path(command, path_converter=self._system_paths.get_command_lookup_path)
 
-        elif skip_empty_path and not len(self._command_dirs):
+    def get_executable_index(self):
 
-            return True
+        return self._executable_index
 
-        elif len(command):
+    def get_exec_parser(self):
 
-            command_dirs = self._command_dirs
+        return self._exec_parser
 
-            if include_lookup_cwd:
+    def get_command_completer(self):
 
-                command_dirs.append(self._command_lookup_cwd)
+        return self._command_completer
 
-            for command_dir in command_dirs:
+    def get_flatpak_real_home(self):
 
-                path = self._join_path_prefix(command_dir, command)
+        return self._system_paths.get_real_home()
 
-                if os.access(path, os.X_OK) and os.path.isfile(path):
+    def hook(self, event, callback):
 
-                    return path
+        return self._events.hook(event, callback)
 
-    def get_flatpak_real_home(self):
+    def release(self, id):
 
-        return self._flatpak_real_home
+        self._events.release(id)
@@ -0,0 +1,71 @@
+#!/usr/bin/python3
+
+# Copyright (C) 2022 Free Software Foundation, Inc.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+
+import os, sys, shutil, tempfile, unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(os.path.realpath(__file__))), "..", "libre-menu-editor"))
+
+from modules import desktop
+
+
+class DesktopParserTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._directory = tempfile.mkdtemp()
+
+        self._path = os.path.join(self._directory, "tool.desktop")
+
+        with open(self._path, "w") as file:
+
+            file.write("[Desktop Entry]\nType=Application\nName=Tool\nExec=tool %F\nMimeType=text/plain;\n")
+
+        self._desktop_parser = desktop.DesktopParser(None, self._path, self._path)
+
+    def tearDown(self):
+
+        shutil.rmtree(self._directory)
+
+    def test_unchanged(self):
+
+        self.assertEqual(self._desktop_parser.get_changed_keys(), [])
+
+    def test_changed_keys_before_save(self):
+
+        self._desktop_parser.set_mimetypes(["text/plain", "image/png"])
+
+        self.assertIn("MimeType", self._desktop_parser.get_changed_keys())
+
+        self._desktop_parser.save()
+
+        self.assertEqual(self._desktop_parser.get_changed_keys(), [])
+
+        self.assertEqual(sorted(desktop.DesktopParser(None, self._path, self._path).get_mimetypes()), ["image/png", "text/plain"])
+
+    def test_changed_name(self):
+
+        self._desktop_parser.set_name("Other")
+
+        self.assertIn("Name", self._desktop_parser.get_changed_keys())
+
+        self.assertNotIn("MimeType", self._desktop_parser.get_changed_keys())
+
+
+if __name__ == "__main__":
+
+    unittest.main()
@@ -0,0 +1,206 @@
+#!/usr/bin/python3
+
+# Copyright (C) 2022 Free Software Foundation, Inc.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+
+import os, sys, gc, unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(os.path.realpath(__file__))), "..", "libre-menu-editor"))
+
+from modules import basic
+
+
+class Listener():
+
+    def __init__(self):
+
+        self.calls = []
+
+    def on_event(self, event, *args):
+
+        self.calls.append((event, *args))
+
+
+class EventManagerTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._scheduled = []
+
+        self._event_manager = basic.EventManager(scheduler=self._scheduled.append)
+
+        self._event_manager.add("changed", str)
+
+        self._event_manager.add("coalesced", str, coalesce=True)
+
+    def _run_scheduled(self):
+
+        scheduled, self._scheduled[:] = list(self._scheduled), []
+
+        for callback in scheduled:
+
+            callback()
+
+    def test_trigger(self):
+
+        listener = Listener()
+
+        self._event_manager.hook("changed", listener.on_event)
+
+        self._event_manager.trigger("changed", "a")
+
+        self.assertEqual(listener.calls, [("changed", "a")])
+
+    def test_hook_arguments(self):
+
+        first_listener, second_listener = Listener(), Listener()
+
+        self._event_manager.hook("changed", first_listener.on_event, 1)
+
+        self._event_manager.hook("changed", second_listener.on_event, 2, 3)
+
+        self._event_manager.trigger("changed", "a")
+
+        self._event_manager.trigger("changed", "b")
+
+        self.assertEqual(first_listener.calls, [("changed", "a", 1), ("changed", "b", 1)])
+
+        self.assertEqual(second_listener.calls, [("changed", "a", 2, 3), ("changed", "b", 2, 3)])
+
+    def test_release_during_dispatch(self):
+
+        listener, ids = Listener(), []
+
+        ids.append(self._event_manager.hook("changed", lambda event, text: self._event_manager.release(ids[1])))
+
+        ids.append(self._event_manager.hook("changed", listener.on_event))
+
+        self._event_manager.trigger("changed", "a")
+
+        self.assertEqual(listener.calls, [])
+
+    def test_remove_releases_all_hooks(self):
+
+        ids = [self._event_manager.hook("changed", Listener().on_event) for index in range(4)]
+
+        self._event_manager.remove("changed")
+
+        for id in ids:
+
+            self.assertNotIn(id, self._event_manager.get_hooks())
+
+    def test_coalesced_flush(self):
+
+        listener = Listener()
+
+        self._event_manager.hook("coalesced", listener.on_event)
+
+        for text in ["a", "b", "c"]:
+
+            self._event_manager.trigger("coalesced", text)
+
+        self.assertEqual(listener.calls, [])
+
+        self.assertEqual(len(self._scheduled), 1)
+
+        self._run_scheduled()
+
+        self.assertEqual(listener.calls, [("coalesced", "c")])
+
+        self._event_manager.trigger("coalesced", "d")
+
+        self.assertEqual(len(self._scheduled), 1)
+
+        self._run_scheduled()
+
+        self.assertEqual(listener.calls, [("coalesced", "c"), ("coalesced", "d")])
+
+    def test_coalesce_requires_scheduler(self):
+
+        with self.assertRaises(basic.EventSchedulerMissingError):
+
+            basic.EventManager().add("coalesced", coalesce=True)
+
+    def test_weak_hook_release(self):
+
+        listener = Listener()
+
+        id = self._event_manager.hook("changed", listener.on_event, weak=True)
+
+        self._event_manager.trigger("changed", "a")
+
+        self.assertEqual(listener.calls, [("changed", "a")])
+
+        del listener
+
+        gc.collect()
+
+        self._event_manager.trigger("changed", "b")
+
+        self.assertNotIn(id, self._event_manager.get_hooks())
+
+        with self.assertRaises(basic.EventHookInvalidError):
+
+            self._event_manager.release(id)
+
+    def test_weak_hook_released_lazily(self):
+
+        listener = Listener()
+
+        id = self._event_manager.hook("changed", listener.on_event, weak=True)
+
+        del listener
+
+        gc.collect()
+
+        self.assertIn(id, self._event_manager._hooks)
+
+        self.assertNotIn(id, self._event_manager.get_hooks())
+
+    def test_weak_hook_requires_method(self):
+
+        with self.assertRaises(basic.EventCallbackInvalidError):
+
+            self._event_manager.hook("changed", lambda event, text: None, weak=True)
+
+    def test_weak_callback_finalizer(self):
+
+        listener, finalized = Listener(), []
+
+        callback = basic.WeakCallback(listener.on_event, scheduler=self._scheduled.append)
+
+        callback.add_finalizer(finalized.append, "done")
+
+        callback("changed", "a")
+
+        self.assertEqual(listener.calls, [("changed", "a")])
+
+        del listener
+
+        gc.collect()
+
+        self.assertFalse(callback.get_alive())
+
+        self.assertEqual(finalized, [])
+
+        self._run_scheduled()
+
+        self.assertEqual(finalized, ["done"])
+
+
+if __name__ == "__main__":
+
+    unittest.main()
@@ -0,0 +1,123 @@
+#!/usr/bin/python3
+
+# Copyright (C) 2022 Free Software Foundation, Inc.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+
+import os, sys, shutil, tempfile, unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(os.path.realpath(__file__))), "..", "libre-menu-editor"))
+
+from modules import desktop
+
+
+class ExecParserTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._directory = tempfile.mkdtemp()
+
+        self._user_bin_dir = os.path.join(self._directory, "user", "bin")
+
+        self._system_bin_dir = os.path.join(self._directory, "system", "bin")
+
+        os.makedirs(self._user_bin_dir)
+
+        os.makedirs(self._system_bin_dir)
+
+        self._exec_parser = desktop.ExecParser([self._user_bin_dir, self._system_bin_dir])
+
+    def tearDown(self):
+
+        shutil.rmtree(self._directory)
+
+    def test_arguments(self):
+
+        self.assertEqual(self._exec_parser.get_arguments("editor --new-window %U"), ["editor", "--new-window"])
+
+        self.assertEqual(self._exec_parser.get_arguments("printf 100%% %f"), ["printf", "100%"])
+
+    def test_quoting(self):
+
+        self.assertEqual(self._exec_parser.get_arguments('"/opt/my app/run" "a b"'), ["/opt/my app/run", "a b"])
+
+        self.assertEqual(self._exec_parser.get_arguments('sh -c "echo \\\\"hi\\\\""'), ["sh", "-c", 'echo "hi"'])
+
+    def test_string_unescaping(self):
+
+        self.assertEqual(self._exec_parser.get_arguments("tool\\sargument\\targument"), ["tool", "argument", "argument"])
+
+        self.assertEqual(self._exec_parser.get_program('"/opt/my app/run" %F'), "/opt/my app/run")
+
+    def test_invalid(self):
+
+        for text in ['editor "unterminated', "editor trailing\\\\"]:
+
+            with self.assertRaises(desktop.ExecInvalidError):
+
+                self._exec_parser.get_arguments(text)
+
+    def test_empty(self):
+
+        self.assertIsNone(self._exec_parser.get_program(""))
+
+        self.assertIsNone(self._exec_parser.get_program("%U"))
+
+    def test_env_wrapper(self):
+
+        self.assertEqual(self._exec_parser.get_program("env LANG=C -u HOME editor %f"), "editor")
+
+        self.assertEqual(self._exec_parser.get_program("/usr/bin/env -C /tmp -S 'editor --x'"), "'editor")
+
+        self.assertEqual(self._exec_parser.get_program('env -S "editor --x" %f'), "editor")
+
+    def test_flatpak_run(self):
+
+        path = os.path.join(self._system_bin_dir, "org.example.App")
+
+        open(path, "w").close()
+
+        self.assertEqual(self._exec_parser.get_program("flatpak run --branch=stable org.example.App %U"), path)
+
+        self.assertEqual(self._exec_parser.get_program("/usr/bin/flatpak run org.example.App/x86_64/stable"), path)
+
+    def test_flatpak_run_prefers_first_dir(self):
+
+        for directory in [self._user_bin_dir, self._system_bin_dir]:
+
+            open(os.path.join(directory, "org.example.App"), "w").close()
+
+        self.assertEqual(self._exec_parser.get_program("flatpak run org.example.App"), os.path.join(self._user_bin_dir, "org.example.App"))
+
+    def test_flatpak_run_missing_app(self):
+
+        self.assertEqual(self._exec_parser.get_program("flatpak run org.example.Missing"), os.path.join(self._user_bin_dir, "org.example.Missing"))
+
+    def test_flatpak_without_bin_dirs(self):
+
+        self.assertEqual(desktop.ExecParser().get_program("flatpak run org.example.App"), "flatpak")
+
+    def test_cache_size(self):
+
+        exec_parser = desktop.ExecParser(cache_size=2)
+
+        for text in ["a", "b", "c", "a"]:
+
+            self.assertEqual(exec_parser.get_program(text), text)
+
+
+if __name__ == "__main__":
+
+    unittest.main()
@@ -0,0 +1,97 @@
+#!/usr/bin/python3
+
+# Copyright (C) 2022 Free Software Foundation, Inc.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+
+import os, sys, shutil, tempfile, unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(os.path.realpath(__file__))), "..", "libre-menu-editor"))
+
+from modules import basic
+
+
+class ExecutableIndexTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._directory = tempfile.mkdtemp()
+
+        self._bin_dir = os.path.join(self._directory, "bin")
+
+        self._lookup_dir = os.path.join(self._directory, "home")
+
+        for directory in [self._bin_dir, os.path.join(self._lookup_dir, "scripts")]:
+
+            os.makedirs(directory)
+
+        self._tool_path = self._write(os.path.join(self._bin_dir, "tool"))
+
+        self._script_path = self._write(os.path.join(self._lookup_dir, "scripts", "run"))
+
+        self._write(os.path.join(self._bin_dir, "data"), mode=0o644)
+
+        self._executable_index = basic.ExecutableIndex([self._bin_dir])
+
+    def tearDown(self):
+
+        shutil.rmtree(self._directory)
+
+    def _write(self, path, mode=0o755):
+
+        with open(path, "w") as file:
+
+            file.write("#!/bin/sh\n")
+
+        os.chmod(path, mode)
+
+        return path
+
+    def test_names(self):
+
+        self.assertEqual(self._executable_index.get_names(), {"tool"})
+
+        self.assertEqual(self._executable_index.get_path("tool"), self._tool_path)
+
+        self.assertIsNone(self._executable_index.get_path("data"))
+
+    def test_command_path(self):
+
+        self.assertEqual(self._executable_index.get_command_path("tool"), self._tool_path)
+
+        self.assertEqual(self._executable_index.get_command_path(self._tool_path), self._tool_path)
+
+        self.assertIsNone(self._executable_index.get_command_path("missing"))
+
+        self.assertIsNone(self._executable_index.get_command_path(""))
+
+    def test_command_path_lookup_dir(self):
+
+        self.assertIsNone(self._executable_index.get_command_path("scripts/run"))
+
+        self.assertEqual(self._executable_index.get_command_path("scripts/run", lookup_dir=self._lookup_dir), self._script_path)
+
+    def test_command_path_converter(self):
+
+        path_converter = lambda path: os.path.join(self._directory, path.lstrip(os.path.sep))
+
+        self.assertEqual(self._executable_index.get_command_path("/bin/tool", path_converter=path_converter), self._tool_path)
+
+        self.assertIsNone(self._executable_index.get_command_path("/bin/data", path_converter=path_converter))
+
+
+if __name__ == "__main__":
+
+    unittest.main()
@@ -0,0 +1,79 @@
+#!/usr/bin/python3
+
+# Copyright (C) 2022 Free Software Foundation, Inc.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+
+import os, sys, shutil, tempfile, unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(os.path.realpath(__file__))), "..", "libre-menu-editor"))
+
+import headless
+
+
+class ReadSpecTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+
+        shutil.rmtree(self._directory)
+
+    def _write(self, name, text):
+
+        path = os.path.join(self._directory, name)
+
+        with open(path, "w") as file:
+
+            file.write(text)
+
+        return path
+
+    def test_json(self):
+
+        path = self._write("spec.json", '{"operations": []}')
+
+        self.assertEqual(headless.read_spec(path), {"operations": []})
+
+    def test_invalid_json(self):
+
+        path = self._write("spec.json", '{"operations": [')
+
+        with self.assertRaises(headless.SpecInvalidError):
+
+            headless.read_spec(path)
+
+    def test_invalid_yaml(self):
+
+        try:
+
+            import yaml
+
+        except ImportError:
+
+            self.skipTest("python3-yaml is not installed")
+
+        path = self._write("spec.yaml", "operations: [a\n")
+
+        with self.assertRaises(headless.SpecInvalidError):
+
+            headless.read_spec(path)
+
+
+if __name__ == "__main__":
+
+    unittest.main()
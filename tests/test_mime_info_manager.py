@@ -0,0 +1,143 @@
+#!/usr/bin/python3
+
+# Copyright (C) 2022 Free Software Foundation, Inc.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+
+import os, sys, shutil, tempfile, unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(os.path.realpath(__file__))), "..", "libre-menu-editor"))
+
+from modules import desktop
+
+
+class MimeInfoManagerTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._directory = tempfile.mkdtemp()
+
+        self._cache_path = os.path.join(self._directory, "applications", "mimeinfo.cache")
+
+        self._list_path = os.path.join(self._directory, "mimeapps.list")
+
+        self._mime_info_manager = self._create_manager()
+
+    def tearDown(self):
+
+        shutil.rmtree(self._directory)
+
+    def _create_manager(self):
+
+        return desktop.MimeInfoManager({
+
+            "MIME Cache": [self._cache_path],
+
+            "Added Associations": [self._list_path]
+
+            })
+
+    def _write(self, path, text):
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        with open(path, "w") as file:
+
+            file.write(text)
+
+    def _read(self, path):
+
+        with open(path, "r") as file:
+
+            return file.read()
+
+    def test_update_round_trip(self):
+
+        self._mime_info_manager.update("a.desktop", ["text/plain", "image/png"])
+
+        self._mime_info_manager.update("b.desktop", ["text/plain"])
+
+        mime_info_manager = self._create_manager()
+
+        for section in mime_info_manager.get_sections():
+
+            self.assertEqual(mime_info_manager.get_mimetypes("a.desktop", section), ["image/png", "text/plain"])
+
+            self.assertEqual(mime_info_manager.get_names("text/plain", section), ["a.desktop", "b.desktop"])
+
+    def test_update_replaces_mimetypes(self):
+
+        self._mime_info_manager.update("a.desktop", ["text/plain", "image/png"])
+
+        self._mime_info_manager.update("a.desktop", ["image/png", "image/jpeg"])
+
+        mime_info_manager = self._create_manager()
+
+        self.assertEqual(mime_info_manager.get_mimetypes("a.desktop", "MIME Cache"), ["image/jpeg", "image/png"])
+
+        self.assertEqual(mime_info_manager.get_names("text/plain", "MIME Cache"), [])
+
+    def test_delete_removes_empty_keys(self):
+
+        self._mime_info_manager.update("a.desktop", ["text/plain"])
+
+        self._mime_info_manager.update("b.desktop", ["text/plain", "image/png"])
+
+        self._mime_info_manager.update("b.desktop", [], delete=True)
+
+        self.assertNotIn("image/png", self._read(self._cache_path))
+
+        self.assertIn("text/plain=a.desktop;", self._read(self._cache_path))
+
+    def test_unchanged_update_skips_save(self):
+
+        self._mime_info_manager.update("a.desktop", ["text/plain"])
+
+        self.assertEqual(self._mime_info_manager.update("a.desktop", ["text/plain"]), [])
+
+    def test_write_is_atomic(self):
+
+        self._mime_info_manager.update("a.desktop", ["text/plain"])
+
+        self.assertEqual(os.listdir(os.path.dirname(self._cache_path)), ["mimeinfo.cache"])
+
+        self.assertEqual(os.stat(self._cache_path).st_mode & 0o777, 0o644)
+
+    def test_write_keeps_mode(self):
+
+        self._write(self._cache_path, "[MIME Cache]\n")
+
+        os.chmod(self._cache_path, 0o600)
+
+        self._mime_info_manager.update("a.desktop", ["text/plain"])
+
+        self.assertEqual(os.stat(self._cache_path).st_mode & 0o777, 0o600)
+
+    def test_update_with_duplicate_names(self):
+
+        self._write(self._cache_path, "[MIME Cache]\ntext/plain=a.desktop;a.desktop;b.desktop;\n")
+
+        self._mime_info_manager.update("a.desktop", ["image/png"])
+
+        mime_info_manager = self._create_manager()
+
+        self.assertEqual(mime_info_manager.get_names("text/plain", "MIME Cache"), ["b.desktop"])
+
+        self.assertEqual(mime_info_manager.get_names("image/png", "MIME Cache"), ["a.desktop"])
+
+
+if __name__ == "__main__":
+
+    unittest.main()
@@ -0,0 +1,201 @@
+#!/usr/bin/python3
+
+# Copyright (C) 2022 Free Software Foundation, Inc.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+
+import os, sys, shutil, tempfile, unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(os.path.realpath(__file__))), "..", "libre-menu-editor"))
+
+from modules import desktop
+
+
+class StarterLocatorTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._directory = tempfile.mkdtemp()
+
+        self._data_dirs = [os.path.join(self._directory, "first"), os.path.join(self._directory, "second")]
+
+        self._override_dir = os.path.join(self._directory, "override")
+
+        for directory in self._data_dirs:
+
+            os.makedirs(os.path.join(directory, "applications"))
+
+        os.makedirs(self._override_dir)
+
+        self._starter_locator = desktop.StarterLocator(self._data_dirs, self._override_dir)
+
+    def tearDown(self):
+
+        shutil.rmtree(self._directory)
+
+    def _write(self, directory, name, text="[Desktop Entry]\n"):
+
+        path = os.path.join(directory, "%s.desktop" % name)
+
+        with open(path, "w") as file:
+
+            file.write(text)
+
+        return path
+
+    def _touch_dir(self, directory):
+
+        timestamp = os.stat(directory).st_mtime_ns + 1000000000
+
+        os.utime(directory, ns=(timestamp, timestamp))
+
+    def test_names(self):
+
+        self._write(os.path.join(self._data_dirs[0], "applications"), "b")
+
+        self._write(os.path.join(self._data_dirs[1], "applications"), "a")
+
+        self._write(os.path.join(self._data_dirs[1], "applications"), "b")
+
+        self._write(self._override_dir, "c")
+
+        with open(os.path.join(self._override_dir, "readme.txt"), "w") as file:
+
+            file.write("")
+
+        self.assertEqual(self._starter_locator.get_names(), ["a", "b", "c"])
+
+        self.assertEqual(list(self._starter_locator.iter_names(reverse=True)), ["c", "b", "a"])
+
+    def test_override_precedence(self):
+
+        default_path = self._write(os.path.join(self._data_dirs[1], "applications"), "a")
+
+        self.assertFalse(self._starter_locator.get_has_override("a"))
+
+        self.assertEqual(self._starter_locator.get_path("a"), default_path)
+
+        override_path = self._write(self._override_dir, "a")
+
+        self._touch_dir(self._override_dir)
+
+        self.assertTrue(self._starter_locator.get_has_override("a"))
+
+        self.assertTrue(self._starter_locator.get_has_default("a"))
+
+        self.assertEqual(self._starter_locator.get_path("a"), override_path)
+
+    def test_default_precedence(self):
+
+        first_path = self._write(os.path.join(self._data_dirs[0], "applications"), "a")
+
+        self._write(os.path.join(self._data_dirs[1], "applications"), "a")
+
+        self.assertEqual(self._starter_locator.get_default_path("a"), first_path)
+
+        self.assertEqual(self._starter_locator.get_default_path("missing"), os.path.join(self._data_dirs[0], "applications", "missing.desktop"))
+
+    def test_rescan(self):
+
+        self.assertEqual(self._starter_locator.get_names(), [])
+
+        path = self._write(os.path.join(self._data_dirs[0], "applications"), "a")
+
+        self._touch_dir(os.path.join(self._data_dirs[0], "applications"))
+
+        self.assertEqual(self._starter_locator.get_names(), ["a"])
+
+        os.remove(path)
+
+        self._touch_dir(os.path.join(self._data_dirs[0], "applications"))
+
+        self.assertFalse(self._starter_locator.get_has_name("a"))
+
+    def test_invalidate(self):
+
+        self._starter_locator.set_active(True)
+
+        try:
+
+            self.assertIn(self._override_dir, self._starter_locator._path_inspector.get_paths())
+
+            self.assertFalse(self._starter_locator.get_has_override("a"))
+
+            timestamp = os.stat(self._override_dir).st_mtime_ns
+
+            self._write(self._override_dir, "a")
+
+            os.utime(self._override_dir, ns=(timestamp, timestamp))
+
+            self._starter_locator.invalidate()
+
+            self.assertTrue(self._starter_locator.get_has_override("a"))
+
+        finally:
+
+            self._starter_locator.set_active(False)
+
+    def test_set_data_dirs(self):
+
+        self._starter_locator = desktop.StarterLocator(self._data_dirs[:1], self._override_dir)
+
+        path = self._write(os.path.join(self._data_dirs[1], "applications"), "a")
+
+        self.assertFalse(self._starter_locator.get_has_name("a"))
+
+        self._starter_locator.set_data_dirs(self._data_dirs)
+
+        self.assertEqual(self._starter_locator.get_data_dirs(), self._data_dirs)
+
+        self.assertEqual(self._starter_locator.get_path("a"), path)
+
+    def test_stat_after_edit(self):
+
+        path = self._write(self._override_dir, "a")
+
+        self.assertEqual(self._starter_locator.get_stat("a").st_size, os.stat(path).st_size)
+
+        self._write(self._override_dir, "a", "[Desktop Entry]\nName=A\n")
+
+        os.utime(path, ns=(0, 0))
+
+        self.assertEqual(self._starter_locator.get_stat("a").st_size, os.stat(path).st_size)
+
+        self.assertEqual(self._starter_locator.get_stat("a").st_mtime_ns, 0)
+
+    def test_dangling_symlink(self):
+
+        os.symlink(os.path.join(self._directory, "missing.desktop"), os.path.join(self._override_dir, "a.desktop"))
+
+        self.assertTrue(self._starter_locator.get_has_override("a"))
+
+        self.assertIsNone(self._starter_locator.get_stat("a"))
+
+    def test_path_converter(self):
+
+        self._starter_locator = desktop.StarterLocator(["/usr/share"], self._override_dir, path_converter=lambda path: os.path.join(self._data_dirs[0], path.split(os.sep)[-1]))
+
+        self._write(os.path.join(self._data_dirs[0], "applications"), "a")
+
+        self.assertTrue(self._starter_locator.get_has_default("a"))
+
+        self.assertEqual(self._starter_locator.get_default_path("a"), "/usr/share/applications/a.desktop")
+
+        self.assertEqual(self._starter_locator.get_default_path("a", include_host=True), os.path.join(self._data_dirs[0], "applications", "a.desktop"))
+
+
+if __name__ == "__main__":
+
+    unittest.main()
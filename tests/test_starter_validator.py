@@ -0,0 +1,117 @@
+#!/usr/bin/python3
+
+# Copyright (C) 2022 Free Software Foundation, Inc.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+
+import os, sys, json, shutil, tempfile, unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(os.path.realpath(__file__))), "..", "libre-menu-editor"))
+
+from modules import desktop
+
+
+class StarterValidatorTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._directory = tempfile.mkdtemp()
+
+        self._commands = {"tool"}
+
+        self._icons = {"tool-icon"}
+
+        self._path = os.path.join(self._directory, "tool.desktop")
+
+        with open(self._path, "w") as file:
+
+            file.write("[Desktop Entry]\nExec=tool %U\nIcon=tool-icon\nTerminal=maybe\nActions=new;\n")
+
+        self._cache_path = os.path.join(self._directory, "cache", "validation.json")
+
+    def tearDown(self):
+
+        shutil.rmtree(self._directory)
+
+    def _create_validator(self):
+
+        return desktop.StarterValidator(
+
+            command_checker=lambda command: command.split()[0] in self._commands,
+
+            icon_checker=lambda icon: icon in self._icons
+
+            )
+
+    def _get_problems(self, results):
+
+        return [issue["problem"] for issue in results[self._path]]
+
+    def test_validate(self):
+
+        results = self._create_validator().validate([self._path])
+
+        self.assertEqual(self._get_problems(results), ["invalid-boolean", "missing-action"])
+
+    def test_environment_checks_are_not_cached(self):
+
+        starter_validator = self._create_validator()
+
+        starter_validator.validate([self._path])
+
+        self._commands.clear()
+
+        self._icons.clear()
+
+        results = starter_validator.validate([self._path])
+
+        self.assertEqual(self._get_problems(results), ["missing-command", "missing-icon", "invalid-boolean", "missing-action"])
+
+    def test_saved_cache(self):
+
+        starter_validator = self._create_validator()
+
+        starter_validator.validate([self._path])
+
+        starter_validator.save(self._cache_path)
+
+        self._commands.clear()
+
+        starter_validator = self._create_validator()
+
+        self.assertTrue(starter_validator.load(self._cache_path))
+
+        results = starter_validator.validate([self._path])
+
+        self.assertEqual(self._get_problems(results), ["missing-command", "invalid-boolean", "missing-action"])
+
+    def test_outdated_cache_is_ignored(self):
+
+        os.makedirs(os.path.dirname(self._cache_path))
+
+        with open(self._cache_path, "w") as file:
+
+            json.dump({self._path: [os.stat(self._path).st_mtime_ns, []]}, file)
+
+        starter_validator = self._create_validator()
+
+        self.assertFalse(starter_validator.load(self._cache_path))
+
+        self.assertEqual(self._get_problems(starter_validator.validate([self._path])), ["invalid-boolean", "missing-action"])
+
+
+if __name__ == "__main__":
+
+    unittest.main()
@@ -0,0 +1,169 @@
+#!/usr/bin/python3
+
+# Copyright (C) 2022 Free Software Foundation, Inc.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+
+import os, sys, shutil, tempfile, unittest, unittest.mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(os.path.realpath(__file__))), "..", "libre-menu-editor"))
+
+from modules import desktop
+
+
+class SystemPathsTest(unittest.TestCase):
+
+    def test_native_dirs(self):
+
+        system_paths = desktop.SystemPaths(flatpak=False, environment={
+
+            "HOME": "/home/user",
+
+            "XDG_DATA_DIRS": "/usr/share:~/share:/opt/share",
+
+            "PATH": "/usr/bin:~/bin:/usr/bin"
+
+            })
+
+        self.assertEqual(system_paths.get_system_data_dirs(), [
+
+            "/home/user/.local/share/flatpak/exports/share",
+
+            "/var/lib/flatpak/exports/share",
+
+            "/var/lib/snapd/desktop",
+
+            "/usr/local/share",
+
+            "/usr/share",
+
+            "/home/user/share",
+
+            "/opt/share"
+
+            ])
+
+        self.assertEqual(system_paths.get_command_dirs(), ["/usr/bin", "/home/user/bin"])
+
+        self.assertEqual(system_paths.get_starter_override_dir(), "/home/user/.local/share/applications")
+
+        self.assertIsNone(system_paths.get_real_home())
+
+        self.assertIsNone(system_paths.get_path_converter())
+
+        self.assertEqual(system_paths.get_command_lookup_path("/usr/bin/ls"), "/usr/bin/ls")
+
+    def test_flatpak_dirs(self):
+
+        system_paths = desktop.SystemPaths(flatpak=True, environment={
+
+            "HOME": "/home/user",
+
+            "XDG_DATA_HOME": "/home/user/.var/app/example/data",
+
+            "XDG_DATA_DIRS": "/app/share:/usr/share"
+
+            })
+
+        system_paths.set_host_environment(system_paths.parse_host_environment(
+
+            b"HOME=/var/home/user\0XDG_DATA_DIRS=~/.local/share/flatpak/exports/share:/usr/share:/opt/share\0PATH=/usr/bin:~/bin\0"
+
+            ))
+
+        self.assertEqual(system_paths.get_real_home(), "/var/home/user")
+
+        self.assertEqual(system_paths.get_system_data_dirs()[3:], [
+
+            "/run/host/usr/local/share",
+
+            "/run/host/usr/share",
+
+            "/var/home/user/.local/share/flatpak/exports/share",
+
+            "/run/host/var/home/user/.local/share/flatpak/exports/share",
+
+            "/run/host/opt/share"
+
+            ])
+
+        self.assertEqual(system_paths.get_command_dirs(), ["/run/host/usr/bin", "/var/home/user/bin", "/run/host/var/home/user/bin"])
+
+        self.assertEqual(system_paths.get_icon_search_dirs()[0], "/run/host/var/home/user/.local/share/icons")
+
+        self.assertEqual(system_paths.get_command_lookup_path("/usr/bin/ls"), "/run/host/usr/bin/ls")
+
+        self.assertEqual(system_paths.get_command_lookup_path("/var/home/user/bin/tool"), "/var/home/user/bin/tool")
+
+        self.assertEqual(system_paths.get_host_system_path("/run/host/usr/share"), "/usr/share")
+
+        self.assertIsNotNone(system_paths.get_path_converter())
+
+    def test_flatpak_without_host_environment(self):
+
+        system_paths = desktop.SystemPaths(flatpak=True, environment={"HOME": "/home/user"})
+
+        self.assertEqual(system_paths.get_real_home(), "/home/user")
+
+        self.assertEqual(system_paths.get_command_dirs(), [])
+
+        self.assertIsNone(system_paths.get_host_environment())
+
+    def test_sandbox_path(self):
+
+        directory = tempfile.mkdtemp()
+
+        try:
+
+            system_paths = desktop.SystemPaths(flatpak=True, environment={"HOME": directory})
+
+            path = os.path.join(directory, "missing.png")
+
+            self.assertEqual(system_paths.get_sandbox_path(path), path)
+
+            with unittest.mock.patch("os.path.exists", side_effect=AssertionError), unittest.mock.patch("os.path.islink", side_effect=AssertionError):
+
+                self.assertEqual(system_paths.get_sandbox_path(os.path.join(directory, "other.png")), os.path.join(directory, "other.png"))
+
+            self.assertEqual(system_paths.find_sandbox_path(path), path)
+
+            with open(path, "w") as file:
+
+                file.write("")
+
+            self.assertEqual(system_paths.find_sandbox_path(path), path)
+
+            missing_path = os.path.join(directory, "missing", "icon.png")
+
+            self.assertEqual(system_paths.get_sandbox_path(missing_path), missing_path)
+
+        finally:
+
+            shutil.rmtree(directory)
+
+    def test_flatpak_real_home_fallback(self):
+
+        system_paths = desktop.SystemPaths(flatpak=True, environment={"HOME": "/var/sandbox", "USER": "user"})
+
+        self.assertEqual(system_paths.get_real_home(), "/home/user")
+
+        system_paths.set_host_environment({"HOME": "/var/home/user"})
+
+        self.assertEqual(system_paths.get_real_home(), "/var/home/user")
+
+
+if __name__ == "__main__":
+
+    unittest.main()
@@ -0,0 +1,115 @@
+#!/usr/bin/python3
+
+# Copyright (C) 2022 Free Software Foundation, Inc.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+
+import os, sys, unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(os.path.realpath(__file__))), "..", "libre-menu-editor"))
+
+try:
+
+    import gi
+
+    gi.require_version("Adw", "1")
+
+    gi.require_version("Gtk", "4.0")
+
+    from gi.repository import Adw, Gtk
+
+    from modules import gui
+
+except (ImportError, ValueError):
+
+    gtk_available = False
+
+else:
+
+    gtk_available = Gtk.init_check()
+
+
+class Application():
+
+    def schedule_update(self, callback, *args):
+
+        return callback(*args)
+
+    def get_icon_finder(self):
+
+        return self
+
+    def get_image(self, name):
+
+        return Gtk.Image.new_from_icon_name(name)
+
+    def get_name(self, name):
+
+        return name
+
+
+@unittest.skipUnless(gtk_available, "GTK 4 and libadwaita are required")
+class TaggedFlowRowTest(unittest.TestCase):
+
+    def setUp(self):
+
+        Adw.init()
+
+        self._flow_row = gui.TaggedFlowRow(Application())
+
+    def _get_strings(self):
+
+        return [tag.get_text() for tag in self._flow_row.get_tags()]
+
+    def test_set_text(self):
+
+        self._flow_row.set_text("A;B;")
+
+        self.assertEqual(self._flow_row.get_text(), "A;B;")
+
+    def test_set_text_keeps_order(self):
+
+        self._flow_row.set_text("A;B;")
+
+        tags = self._flow_row.get_tags()
+
+        self._flow_row.set_text("B;A;")
+
+        self.assertEqual(self._flow_row.get_text(), "B;A;")
+
+        self.assertEqual(self._flow_row.get_tags(), tags[::-1])
+
+    def test_set_text_inserts_in_place(self):
+
+        self._flow_row.set_text("A;C;")
+
+        self._flow_row.set_text("C;B;A;D")
+
+        self.assertEqual(self._get_strings(), ["C", "B", "A", "D"])
+
+        self.assertEqual(self._flow_row.get_text(), "C;B;A;D")
+
+    def test_set_text_with_duplicates(self):
+
+        self._flow_row.set_text("A;B;A;")
+
+        self._flow_row.set_text("B;A;A;")
+
+        self.assertEqual(self._get_strings(), ["B", "A", "A"])
+
+
+if __name__ == "__main__":
+
+    unittest.main()